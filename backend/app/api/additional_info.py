@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-import os
-import google.generativeai as genai
-import json
 
-from app.core.database import get_db
-from app.models.document import Document, DocumentExtraction, AdditionalInfo
+from app.core.database import get_async_db, get_db
+from app.models.document import Document, AdditionalInfo
+from app.repositories import documents as document_repo
+from app.services.industry_knowledge import get_industry_knowledge
+from app.services.llm_client import get_llm_client
+from app.services.suggestion_cache import get_suggestion_cache, normalize_industry
 from app.schemas.additional_info import (
     AdditionalInfoCreate,
     AdditionalInfoUpdate,
@@ -18,35 +20,60 @@ from app.schemas.additional_info import (
 router = APIRouter(prefix="/api/additional-info", tags=["additional-info"])
 
 
+@router.get("/suggestion-cache/stats")
+def get_suggestion_cache_stats():
+    """
+    산업별 추가 정보 제안 캐시의 히트/미스 횟수와 항목 수를 조회합니다.
+    """
+    return get_suggestion_cache().stats()
+
+
 @router.get("/{document_id}/suggestions", response_model=AdditionalInfoSuggestion)
-def get_suggested_fields(document_id: int, db: Session = Depends(get_db)):
+async def get_suggested_fields(document_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     문서 ID를 기반으로 AI가 제안하는 추가 정보 필드를 반환합니다.
-    추출된 산업 정보를 기반으로 LLM이 필요한 필드를 제안합니다.
+    산업 지식(data/industry_knowledge)에 있는 산업은 저장된 제안을 사용하고,
+    그 외 산업은 LLM이 필요한 필드를 제안하며 결과는 산업별로 캐시됩니다.
     """
     # 문서 존재 확인
-    document = db.query(Document).filter(Document.id == document_id).first()
-    if not document:
+    if not await document_repo.document_exists(db, document_id):
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
 
     # 추출된 데이터에서 산업 정보 가져오기
-    extraction = (
-        db.query(DocumentExtraction)
-        .filter(DocumentExtraction.document_id == document_id)
-        .first()
-    )
+    extraction = await document_repo.get_extraction(db, document_id)
 
     if not extraction:
         raise HTTPException(status_code=404, detail="추출된 데이터를 찾을 수 없습니다.")
 
     industry = extraction.industry or "일반 산업"
 
-    # LLM을 사용하여 산업별 맞춤 필드 제안
+    # 산업 지식에 있는 산업은 LLM 없이 바로 반환
+    industry_match = get_industry_knowledge().match(industry)
+    if industry_match:
+        return AdditionalInfoSuggestion(
+            document_id=document_id, industry=industry, **industry_match.knowledge.suggestion_payload()
+        )
+
+    # 같은 산업의 제안은 캐시에서 반환 (오래된 항목은 백그라운드에서 갱신)
     try:
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel("gemini-2.0-flash")
+        payload = await get_suggestion_cache().get_or_load(
+            normalize_industry(industry),
+            lambda: generate_industry_suggestion(industry),
+        )
+        return AdditionalInfoSuggestion(document_id=document_id, industry=industry, **payload)
+
+    except Exception as e:
+        print(f"[LLM] 추가 정보 제안 생성 실패: {str(e)}")
+        # 에러 발생 시 기본 필드 반환 (캐시하지 않음)
+        return default_suggestion(document_id, industry)
+
 
-        prompt = f"""
+async def generate_industry_suggestion(industry: str) -> dict:
+    """
+    LLM을 사용하여 산업별 맞춤 필드와 인사이트를 생성합니다.
+    문서와 무관한 산업 단위 결과이므로 산업별로 캐시됩니다. 응답이 올바르지 않으면 예외를 발생시킵니다.
+    """
+    prompt = f"""
 당신은 대출 심사 전문가입니다. 다음 산업에 대한 대출 심사를 위해 필요한 추가 정보를 제안해주세요.
 
 산업: {industry}
@@ -86,74 +113,54 @@ suggested_fields는 해당 산업의 대출 심사에 실제로 필요한 정보
 반드시 유효한 JSON 형식으로만 응답하세요.
 """
 
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-            )
-        )
-
-        result = response.text.strip()
-
-        # JSON 코드 블록 제거
-        if result.startswith("```json"):
-            result = result[7:]
-        elif result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        result = result.strip()
-
-        llm_response = json.loads(result)
-
-        # LLM 응답을 Pydantic 모델로 변환
-        suggested_fields = [
-            SuggestedField(**field) for field in llm_response.get("suggested_fields", [])
-        ]
-
-        insights = [
-            IndustryInsight(**insight) for insight in llm_response.get("insights", [])
-        ]
-
-        return AdditionalInfoSuggestion(
-            document_id=document_id,
-            industry=industry,
-            ai_reason=llm_response.get("ai_reason", f"{industry}의 경우, 추가 정보 수집이 필요합니다."),
-            industry_outlook=llm_response.get("industry_outlook", ""),
-            insights=insights,
-            suggested_fields=suggested_fields,
-        )
-
-    except Exception as e:
-        print(f"[LLM] 추가 정보 제안 생성 실패: {str(e)}")
-        # 에러 발생 시 기본 필드 반환
-        suggested_fields = [
-            SuggestedField(
-                id="major_clients",
-                label="주요 거래처 목록",
-                description="상위 5개 거래처와 매출 비중",
-                type="textarea",
-                required=True,
-                placeholder="예: A사 (45%), B사 (30%), ...",
-            ),
-            SuggestedField(
-                id="business_scale",
-                label="사업 규모",
-                description="연간 매출 및 생산 규모",
-                type="textarea",
-                required=True,
-                placeholder="예: 연매출 50억원, 생산량 10만개",
-            ),
-        ]
-
-        return AdditionalInfoSuggestion(
-            document_id=document_id,
-            industry=industry,
-            ai_reason=f"{industry}의 경우, 사업 규모, 주요 거래처 등의 정보가 신용 평가에 중요합니다.",
-            industry_outlook="",
-            insights=[],
-            suggested_fields=suggested_fields,
-        )
+    llm_response = await get_llm_client().generate_json(prompt, temperature=0.3)
+
+    # LLM 응답을 Pydantic 모델로 검증 (잘못된 응답은 캐시되지 않도록)
+    suggested_fields = [
+        SuggestedField(**field) for field in llm_response.get("suggested_fields", [])
+    ]
+
+    insights = [
+        IndustryInsight(**insight) for insight in llm_response.get("insights", [])
+    ]
+
+    return {
+        "ai_reason": llm_response.get("ai_reason", f"{industry}의 경우, 추가 정보 수집이 필요합니다."),
+        "industry_outlook": llm_response.get("industry_outlook", ""),
+        "insights": [insight.model_dump() for insight in insights],
+        "suggested_fields": [field.model_dump() for field in suggested_fields],
+    }
+
+
+def default_suggestion(document_id: int, industry: str) -> AdditionalInfoSuggestion:
+    """LLM 제안을 사용할 수 없을 때의 기본 필드"""
+    suggested_fields = [
+        SuggestedField(
+            id="major_clients",
+            label="주요 거래처 목록",
+            description="상위 5개 거래처와 매출 비중",
+            type="textarea",
+            required=True,
+            placeholder="예: A사 (45%), B사 (30%), ...",
+        ),
+        SuggestedField(
+            id="business_scale",
+            label="사업 규모",
+            description="연간 매출 및 생산 규모",
+            type="textarea",
+            required=True,
+            placeholder="예: 연매출 50억원, 생산량 10만개",
+        ),
+    ]
+
+    return AdditionalInfoSuggestion(
+        document_id=document_id,
+        industry=industry,
+        ai_reason=f"{industry}의 경우, 사업 규모, 주요 거래처 등의 정보가 신용 평가에 중요합니다.",
+        industry_outlook="",
+        insights=[],
+        suggested_fields=suggested_fields,
+    )
 
 
 @router.post("/{document_id}", response_model=AdditionalInfoResponse)
@@ -209,22 +216,17 @@ def save_additional_info(
 
 
 @router.get("/{document_id}", response_model=AdditionalInfoResponse)
-def get_additional_info(document_id: int, db: Session = Depends(get_db)):
+async def get_additional_info(document_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     저장된 추가 정보를 조회합니다.
     추가 정보가 없으면 404를 반환합니다 (사용자가 Skip한 경우).
     """
     # 문서 존재 확인
-    document = db.query(Document).filter(Document.id == document_id).first()
-    if not document:
+    if not await document_repo.document_exists(db, document_id):
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
 
     # 추가 정보 조회
-    additional_info = (
-        db.query(AdditionalInfo)
-        .filter(AdditionalInfo.document_id == document_id)
-        .first()
-    )
+    additional_info = await document_repo.get_additional_info(db, document_id)
 
     if not additional_info:
         raise HTTPException(status_code=404, detail="추가 정보를 찾을 수 없습니다.")
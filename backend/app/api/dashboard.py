@@ -1,34 +1,62 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
 
-from app.core.database import get_db
-from app.models.document import Document, DocumentExtraction
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.repositories import documents as document_repo
+from app.schemas.dashboard import CompletedReportItem, CompletedReportPage
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
-@router.get("/completed-reports")
-def get_completed_reports(db: Session = Depends(get_db)):
-    """완료된 리포트 목록을 반환합니다."""
-
-    completed_docs = db.query(Document).filter(
-        Document.status == "completed"
-    ).order_by(
-        Document.upload_date.desc()
-    ).all()
-
-    result = []
-    for doc in completed_docs:
-        extraction = db.query(DocumentExtraction).filter(
-            DocumentExtraction.document_id == doc.id
-        ).first()
-
-        result.append({
-            "id": doc.id,
-            "filename": doc.filename,
-            "company_name": extraction.company_name if extraction else None,
-            "industry": extraction.industry if extraction else None,
-            "upload_date": doc.upload_date.isoformat() if doc.upload_date else None,
-            "status": doc.status
-        })
-
-    return result
\ No newline at end of file
+# 완료된 리포트 목록 페이지 크기
+COMPLETED_REPORTS_PAGE_SIZE = 50
+COMPLETED_REPORTS_MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(upload_date: datetime, document_id: int) -> str:
+    """페이지의 마지막 항목 (upload_date, id)를 URL에 넣을 수 있는 커서 문자열로 변환합니다."""
+    raw = f"{upload_date.isoformat()}|{document_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        upload_date, document_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        return datetime.fromisoformat(upload_date), int(document_id)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+@router.get("/completed-reports", response_model=CompletedReportPage)
+async def get_completed_reports(
+    limit: int = Query(COMPLETED_REPORTS_PAGE_SIZE, ge=1, le=COMPLETED_REPORTS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    q: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    완료된 리포트 목록을 최신 업로드 순으로 반환합니다.
+
+    - 추출 데이터와 조인한 한 번의 쿼리로 필요한 컬럼만 조회합니다.
+    - 키셋 페이지네이션: 응답의 next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다.
+    - q: 회사명 또는 산업에 포함된 문자열로 필터링
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    # 다음 페이지가 있는지 확인하기 위해 한 건 더 조회
+    rows = await document_repo.list_completed_reports(db, limit + 1, after=after, q=q)
+
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_next and rows[-1].upload_date is not None:
+        next_cursor = encode_cursor(rows[-1].upload_date, rows[-1].id)
+
+    return CompletedReportPage(
+        items=[CompletedReportItem(**row._asdict()) for row in rows],
+        next_cursor=next_cursor,
+    )
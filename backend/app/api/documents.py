@@ -1,17 +1,28 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import asyncio
 import os
 import shutil
-from datetime import datetime
 from pathlib import Path
 from pydantic import BaseModel
-import google.generativeai as genai
+from typing import Any, Awaitable, Callable
 import json
 
-from app.core.database import get_db, SessionLocal
+from app.core.database import get_async_db, get_db, new_async_session
 from app.models.document import Document, AdditionalInfo, DocumentExtraction
+from app.repositories import analyses as analysis_repo
+from app.repositories import documents as document_repo
 from app.schemas.document import DocumentUploadResponse, ReportRequest, ReportResponse, ReportData
-from app.services.extraction_service import ExtractionService
+from app.services.analysis_store import RISK_ANALYSIS_TYPE, RISK_ANALYSIS_VERSION, compute_input_fingerprint, compute_report_fingerprint
+from app.services.blob_store import FileTooLargeError, get_blob_store
+from app.services.document_ingest import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, register_upload
+from app.services.financial_ratios import build_financial_ratios
+from app.services.industry_knowledge import build_local_risk_analysis, get_industry_knowledge
+from app.services.json_stream import IncrementalJSONObjectParser
+from app.services.llm_client import get_llm_client, parse_json_response
+from app.services.report_pipeline import Stage, StagePipeline
 
 router = APIRouter(prefix="/api/documents", tags=["documents"])
 
@@ -51,21 +62,15 @@ class RiskAnalysisResponse(BaseModel):
     overall_grade: str
     improvement_plan: str
 
-UPLOAD_DIR = "uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-# 허용된 파일 확장자
-ALLOWED_EXTENSIONS = {".pdf", ".doc", ".docx", ".ppt", ".pptx", ".jpg", ".jpeg", ".png", ".gif"}
-MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
-
-# PDF와 이미지 파일은 자동으로 OCR 처리
-OCR_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".gif"}
+# 리포트 생성 파이프라인 방식 (dependent: 위험 분석 후 심사 의견 작성, parallel: 동시 작성 후 병합)
+REPORT_PIPELINE_MODES = ("dependent", "parallel")
+REPORT_PIPELINE_MODE = os.getenv("REPORT_PIPELINE_MODE", "dependent")
 
 
 @router.get("", response_model=list[DocumentUploadResponse])
-def get_documents(db: Session = Depends(get_db)):
+async def get_documents(db: AsyncSession = Depends(get_async_db)):
     """모든 문서 목록을 조회합니다."""
-    documents = db.query(Document).order_by(Document.upload_date.desc()).all()
+    documents = await document_repo.list_documents(db)
     return [
         DocumentUploadResponse(
             id=doc.id,
@@ -79,25 +84,15 @@ def get_documents(db: Session = Depends(get_db)):
     ]
 
 
-def process_document_background(document_id: int):
-    """백그라운드에서 문서를 처리합니다."""
-    db = SessionLocal()
-    try:
-        extraction_service = ExtractionService()
-        extraction_service.process_document(document_id, db)
-        print(f"[Background] 문서 {document_id} 처리 완료")
-    except Exception as e:
-        print(f"[Background] 문서 {document_id} 처리 실패: {str(e)}")
-    finally:
-        db.close()
-
 @router.post("/upload", response_model=DocumentUploadResponse)
 async def upload_document(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
 ):
-    """파일을 업로드하고 데이터베이스에 저장합니다. PDF/이미지는 자동으로 OCR 처리됩니다."""
+    """
+    파일을 업로드하고 데이터베이스에 저장합니다.
+    PDF/이미지는 추출 작업 큐에 등록되어 워커(worker.py)가 OCR 처리합니다.
+    """
 
     try:
         # 파일 확장자 검증
@@ -108,42 +103,18 @@ async def upload_document(
                 detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(ALLOWED_EXTENSIONS)}"
             )
 
-        # 파일명 생성 (타임스탬프 포함, 안전한 파일명으로 변환)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_filename = "".join(c for c in file.filename if c.isalnum() or c in "._- ")
-        filename = f"{timestamp}_{safe_filename}"
-        filepath = os.path.join(UPLOAD_DIR, filename)
-
-        # 파일 저장 (청크 단위로 읽어서 크기 제한 확인)
-        file_size = 0
-        with open(filepath, "wb") as buffer:
-            while chunk := await file.read(8192):  # 8KB씩 읽기
-                file_size += len(chunk)
-                if file_size > MAX_FILE_SIZE:
-                    buffer.close()
-                    os.remove(filepath)  # 저장 중인 파일 삭제
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 크기가 제한을 초과했습니다. (최대: 50MB)"
-                    )
-                buffer.write(chunk)
-
-        # 데이터베이스에 저장
-        db_document = Document(
-            filename=file.filename,
-            filepath=filepath,
-            file_size=file_size,
-            upload_date=datetime.utcnow(),
-            status="uploaded"
-        )
-        db.add(db_document)
-        db.commit()
-        db.refresh(db_document)
+        # 내용 해시로 저장 (같은 파일은 디스크에 한 번만 저장)
+        try:
+            blob = await get_blob_store().save_upload(file, file_ext, max_size=MAX_FILE_SIZE)
+        except FileTooLargeError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"파일 크기가 제한을 초과했습니다. (최대: 50MB)"
+            )
 
-        # PDF 또는 이미지 파일인 경우 백그라운드에서 OCR 처리
-        if file_ext in OCR_EXTENSIONS:
-            background_tasks.add_task(process_document_background, db_document.id)
-            print(f"[Upload] 문서 {db_document.id} OCR 처리 예약됨")
+        # 데이터베이스에 저장 (이미 추출된 파일이면 추출 데이터를 재사용, 아니면 OCR 작업 등록)
+        # 동기 세션이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        db_document = await asyncio.to_thread(register_upload, db, file.filename, blob, file_ext)
 
         return DocumentUploadResponse(
             id=db_document.id,
@@ -157,10 +128,8 @@ async def upload_document(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
-        # 업로드 실패 시 파일 삭제
-        if 'filepath' in locals() and os.path.exists(filepath):
-            os.remove(filepath)
+        await asyncio.to_thread(db.rollback)
+        # 같은 내용의 다른 문서가 파일을 공유할 수 있으므로 저장된 파일은 지우지 않음
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
     finally:
         await file.close()
@@ -183,12 +152,9 @@ def update_review_opinion(
 
     return ReviewOpinionResponse(review_opinion=document.review_opinion)
 
-def generate_additional_information(additional_info_data: dict) -> str:
+async def generate_additional_information(additional_info_data: dict) -> str:
     """추가 정보를 기반으로 LLM이 인사이트를 생성합니다."""
     try:
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel("gemini-2.0-flash")
-
         # 추가 정보 데이터를 텍스트로 변환
         field_data = additional_info_data.get("field_data", {})
         custom_fields = additional_info_data.get("custom_fields", {})
@@ -218,25 +184,27 @@ def generate_additional_information(additional_info_data: dict) -> str:
 전문적이고 명확한 한국어로 작성하되, 구체적인 수치와 근거를 포함해주세요.
 """
 
-        response = model.generate_content(
-            context,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-            )
-        )
+        response = await get_llm_client().generate(context, temperature=0.3)
 
-        return response.text.strip()
+        return response.strip()
 
     except Exception as e:
         print(f"[LLM] 추가 정보 생성 실패: {str(e)}")
         return "추가 정보를 생성할 수 없습니다."
 
-def generate_review_opinion(document_id: int, extraction: DocumentExtraction, additional_info: AdditionalInfo | None, risk_analysis, db: Session) -> str:
-    """심사 의견을 LLM으로 생성합니다."""
-    try:
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel("gemini-2.0-flash")
+def _additional_info_context(additional_info: AdditionalInfo | None) -> str:
+    if not additional_info:
+        return ""
+    return f"""
+【추가 정보】
+- AI 제안 필드: {json.dumps(additional_info.field_data or {}, ensure_ascii=False)}
+- 사용자 입력: {json.dumps(additional_info.custom_fields or {}, ensure_ascii=False)}
+- 담보 정보: {json.dumps(additional_info.collateral_data or {}, ensure_ascii=False)}
+"""
 
+async def draft_review_opinion(extraction: DocumentExtraction, additional_info: AdditionalInfo | None, risk_analysis) -> str:
+    """심사 의견을 LLM으로 생성합니다 (DB에 저장하지 않음). risk_analysis가 None이면 추출 데이터만으로 작성합니다."""
+    try:
         context = f"""
 당신은 금융 대출 심사 전문가입니다. 다음 정보를 바탕으로 심사 의견을 작성해주세요.
 
@@ -259,13 +227,7 @@ def generate_review_opinion(document_id: int, extraction: DocumentExtraction, ad
 - 대출 금액: {extraction.loan_amount or "N/A"}
 """
 
-        if additional_info:
-            context += f"""
-【추가 정보】
-- AI 제안 필드: {json.dumps(additional_info.field_data or {}, ensure_ascii=False)}
-- 사용자 입력: {json.dumps(additional_info.custom_fields or {}, ensure_ascii=False)}
-- 담보 정보: {json.dumps(additional_info.collateral_data or {}, ensure_ascii=False)}
-"""
+        context += _additional_info_context(additional_info)
 
         if risk_analysis:
             context += f"""
@@ -288,75 +250,37 @@ def generate_review_opinion(document_id: int, extraction: DocumentExtraction, ad
 전문적이고 객관적인 한국어로 작성하되, 명확한 근거와 구체적인 수치를 포함해주세요.
 """
 
-        response = model.generate_content(
-            context,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-            )
-        )
-
-        opinion = response.text.strip()
+        response = await get_llm_client().generate(context, temperature=0.3)
 
-        # DB에 저장
-        document = db.query(Document).filter(Document.id == document_id).first()
-        if document:
-            document.review_opinion = opinion
-            db.commit()
-
-        return opinion
+        return response.strip()
 
     except Exception as e:
         print(f"[LLM] 심사 의견 생성 실패: {str(e)}")
         return ""
 
-@router.get("/{document_id}/report", response_model=ReportResponse)
-def get_report(
-    document_id: int,
-    db: Session = Depends(get_db)
-):
-    """문서의 리포트 데이터를 조회합니다. 저장된 리포트가 있으면 반환하고, 없으면 LLM이 생성합니다."""
-    document = db.query(Document).filter(Document.id == document_id).first()
-
-    if not document:
-        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
-
-    # 저장된 리포트 데이터가 있으면 반환
-    if document.report_data:
-        report_data = ReportData(**document.report_data)
-        return ReportResponse(data=report_data, review_opinion=document.review_opinion)
-
-    # 저장된 리포트가 없으면 새로 생성
-    # 추출 데이터 조회
-    extraction = db.query(DocumentExtraction).filter(
-        DocumentExtraction.document_id == document_id
-    ).first()
-
-    if not extraction:
-        raise HTTPException(status_code=404, detail="추출된 데이터를 찾을 수 없습니다.")
+def merge_risk_summary(opinion: str, risk_analysis) -> str:
+    """위험 분석 없이 작성된 심사 의견 뒤에 위험 분석 요약 문단을 덧붙입니다."""
+    if not opinion or not risk_analysis:
+        return opinion
 
-    # 추가 정보 조회
-    additional_info = db.query(AdditionalInfo).filter(
-        AdditionalInfo.document_id == document_id
-    ).first()
+    high_risks = ', '.join([f.title for f in risk_analysis.risk_factors if f.level == 'high']) or '없음'
+    medium_risks = ', '.join([f.title for f in risk_analysis.risk_factors if f.level == 'medium']) or '없음'
 
-    # 위험 분석 수행 (내부적으로 호출)
-    try:
-        risk_analysis = get_risk_analysis(document_id, db)
-    except:
-        risk_analysis = None
+    return f"""{opinion}
 
-    # 심사 의견 조회 또는 생성
-    review_opinion = document.review_opinion
-    if not review_opinion:
-        review_opinion = generate_review_opinion(document_id, extraction, additional_info, risk_analysis, db)
+【위험 분석 요약】
+종합 등급은 {risk_analysis.overall_grade}입니다. 고위험 요인: {high_risks}. 중위험 요인: {medium_risks}.
+개선 계획: {risk_analysis.improvement_plan}"""
 
-    # LLM을 사용하여 최종 리포트 생성
-    try:
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel("gemini-2.0-flash")
-
-        # 컨텍스트 구성
-        context = f"""
+def build_report_prompt(
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+    risk_analysis,
+    review_opinion: str | None,
+) -> str:
+    """최종 리포트 작성 프롬프트 (추출 데이터, 추가 정보, 위험 분석, 심사 의견 포함)"""
+    # 컨텍스트 구성
+    context = f"""
 당신은 금융 대출 심사 전문가입니다. 다음 정보를 바탕으로 최종 대출 심사 리포트를 작성해주세요.
 
 【추출된 기업 정보】
@@ -378,16 +302,10 @@ def get_report(
 - 대출 금액: {extraction.loan_amount or "N/A"}
 """
 
-        if additional_info:
-            context += f"""
-【추가 정보】
-- AI 제안 필드: {json.dumps(additional_info.field_data or {}, ensure_ascii=False)}
-- 사용자 입력: {json.dumps(additional_info.custom_fields or {}, ensure_ascii=False)}
-- 담보 정보: {json.dumps(additional_info.collateral_data or {}, ensure_ascii=False)}
-"""
+    context += _additional_info_context(additional_info)
 
-        if risk_analysis:
-            context += f"""
+    if risk_analysis:
+        context += f"""
 【위험 분석 결과】
 - 산업 분류: {risk_analysis.industry_classification.name} ({risk_analysis.industry_classification.code})
 - 종합 등급: {risk_analysis.overall_grade}
@@ -396,14 +314,21 @@ def get_report(
 - 저위험 요인: {', '.join([f.title for f in risk_analysis.risk_factors if f.level == 'low'])}
 - 개선 계획: {risk_analysis.improvement_plan}
 """
-
-        if review_opinion:
-            context += f"""
+        ratio_lines = [
+            f"- {r.name}: {r.value:.1f}% (업종 평균 {r.industry_average:.1f}%, {r.status})"
+            for r in risk_analysis.financial_ratios
+            if r.value is not None and r.industry_average is not None
+        ]
+        if ratio_lines:
+            context += "\n【재무 비율 (계산값 - financial.ratios에 이 값을 그대로 사용)】\n" + "\n".join(ratio_lines) + "\n"
+
+    if review_opinion:
+        context += f"""
 【심사자 의견】
 {review_opinion}
 """
 
-        context += """
+    context += """
 다음 형식의 JSON으로 최종 리포트를 작성해주세요:
 
 {
@@ -453,34 +378,318 @@ def get_report(
    - loan.approval_requirements: 심사자가 요구한 승인 조건을 포함
 5. 반드시 유효한 JSON 형식으로만 응답하세요.
 """
+    return context
+
+async def generate_report_data(
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+    risk_analysis,
+    review_opinion: str | None,
+) -> ReportData:
+    """추출 데이터, 추가 정보, 위험 분석, 심사 의견을 바탕으로 LLM이 최종 리포트를 작성합니다."""
+    prompt = build_report_prompt(extraction, additional_info, risk_analysis, review_opinion)
+    report_json = await get_llm_client().generate_json(prompt, temperature=0.3)
+    return ReportData(**report_json)
+
+async def stream_report_data(
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+    risk_analysis,
+    review_opinion: str | None,
+    on_section: Callable[[str, Any], Awaitable[None]],
+) -> ReportData:
+    """
+    generate_report_data의 스트리밍 버전. 모델 응답을 받는 대로 파싱하여
+    최상위 섹션(summary, company, financial, risk, loan)이 완성될 때마다 on_section을 호출합니다.
+    """
+    prompt = build_report_prompt(extraction, additional_info, risk_analysis, review_opinion)
+    parser = IncrementalJSONObjectParser()
+    text = ""
+
+    async for chunk in get_llm_client().stream(prompt, temperature=0.3):
+        text += chunk
+        for name, value in parser.feed(chunk):
+            if name in ReportData.model_fields:
+                await on_section(name, value)
+
+    # 응답 형식이 어긋나 섹션을 다 받지 못했으면 전체 응답을 다시 파싱
+    report_json = parser.result if parser.done else parse_json_response(text)
+    return ReportData(**report_json)
+
+def build_report_pipeline(
+    mode: str,
+    document_id: int,
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+    existing_opinion: str | None,
+    db: AsyncSession,
+    write_report: Callable[..., Awaitable[ReportData]] = generate_report_data,
+) -> StagePipeline:
+    """
+    리포트 생성 단계를 구성합니다.
+    write_report: 마지막 리포트 작성 단계 (스트리밍 응답에서는 stream_report_data 기반 함수)
+
+    - dependent: 심사 의견이 위험 분석 결과를 보고 작성됩니다 (기존 방식).
+    - parallel: 심사 의견 초안을 추출 데이터만으로 위험 분석과 동시에 작성하고,
+      위험 분석이 끝나면 요약 문단을 덧붙입니다.
+    저장된 심사 의견이 있으면 LLM을 호출하지 않고 그대로 사용하고,
+    위험 분석도 입력이 바뀌지 않았으면 저장된 결과를 사용합니다.
+    """
+
+    async def risk():
+        try:
+            return await get_or_run_risk_analysis(document_id, extraction, additional_info, db)
+        except Exception as e:
+            print(f"[LLM] 위험 분석 실패: {str(e)}")
+            return None
+
+    async def report(risk, opinion):
+        return await write_report(extraction, additional_info, risk, opinion)
+
+    if existing_opinion:
+        async def opinion(risk):
+            return existing_opinion
+
+        return StagePipeline([
+            Stage("risk", risk),
+            Stage("opinion", opinion, depends_on=("risk",)),
+            Stage("report", report, depends_on=("risk", "opinion")),
+        ])
+
+    if mode == "parallel":
+        async def opinion_draft():
+            return await draft_review_opinion(extraction, additional_info, None)
+
+        async def opinion(risk, opinion_draft):
+            return merge_risk_summary(opinion_draft, risk)
+
+        return StagePipeline([
+            Stage("risk", risk),
+            Stage("opinion_draft", opinion_draft),
+            Stage("opinion", opinion, depends_on=("risk", "opinion_draft")),
+            Stage("report", report, depends_on=("risk", "opinion")),
+        ])
+
+    async def opinion(risk):
+        return await draft_review_opinion(extraction, additional_info, risk)
+
+    return StagePipeline([
+        Stage("risk", risk),
+        Stage("opinion", opinion, depends_on=("risk",)),
+        Stage("report", report, depends_on=("risk", "opinion")),
+    ])
+
+def _resolve_pipeline_mode(mode: str | None) -> str:
+    mode = mode or REPORT_PIPELINE_MODE
+    if mode not in REPORT_PIPELINE_MODES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 mode입니다: {mode} (가능한 값: {', '.join(REPORT_PIPELINE_MODES)})")
+    return mode
+
+async def _load_report_inputs(document_id: int, db: AsyncSession) -> tuple[DocumentExtraction, AdditionalInfo | None]:
+    """리포트 생성에 필요한 추출 데이터와 추가 정보를 조회합니다."""
+    extraction = await document_repo.get_extraction(db, document_id)
 
-        response = model.generate_content(
-            context,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-            )
+    if not extraction:
+        raise HTTPException(status_code=404, detail="추출된 데이터를 찾을 수 없습니다.")
+
+    additional_info = await document_repo.get_additional_info(db, document_id)
+
+    return extraction, additional_info
+
+async def _cached_report(document: Document, db: AsyncSession) -> ReportResponse | None:
+    """
+    저장된 리포트를 그대로 사용할 수 있으면 반환합니다.
+    - 사용자가 직접 저장한 리포트(지문 없음)는 항상 사용
+    - 자동 저장된 리포트는 입력(추출 데이터, 추가 정보, 심사 의견, 위험 분석 입력)이 그대로일 때만 사용
+    """
+    if not document.report_data:
+        return None
+
+    if document.report_fingerprint is not None:
+        extraction = await document_repo.get_extraction(db, document.id)
+        if not extraction:
+            return None
+        additional_info = await document_repo.get_additional_info(db, document.id)
+        fingerprint = compute_report_fingerprint(
+            extraction, additional_info, document.review_opinion, _risk_input_version()
         )
+        if fingerprint != document.report_fingerprint:
+            print(f"[Report] 문서 {document.id} 리포트 입력이 바뀌어 다시 생성합니다.")
+            return None
+
+    return ReportResponse(data=ReportData(**document.report_data), review_opinion=document.review_opinion)
+
+async def _finish_report(
+    document: Document,
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+    existing_opinion: str | None,
+    result,
+    mode: str,
+    db: AsyncSession,
+) -> tuple[str | None, dict]:
+    """
+    새로 작성된 심사 의견과 리포트를 입력 지문과 함께 저장하고, 단계별 소요 시간을 기록합니다.
+    위험 분석이 실패했으면 위험 분석 없이 작성된 결과이므로 응답만 하고 저장하지 않습니다 (다음 요청에서 다시 생성).
+    """
+    review_opinion = result.results["opinion"]
+
+    if result.results["risk"] is None:
+        print(f"[Report] 문서 {document.id} 위험 분석 없이 작성된 리포트는 저장하지 않습니다.")
+    else:
+        # 새로 작성된 심사 의견은 DB에 저장
+        if review_opinion and not existing_opinion:
+            document.review_opinion = review_opinion
+
+        # 입력이 바뀌기 전까지는 저장된 리포트를 그대로 사용
+        document.report_data = result.results["report"].model_dump()
+        document.report_fingerprint = compute_report_fingerprint(
+            extraction, additional_info, document.review_opinion, _risk_input_version()
+        )
+        await db.commit()
 
-        result = response.text.strip()
+    timings = result.timings()
+    timings["mode"] = mode
+    print(
+        f"[Report] 문서 {document.id} 리포트 생성 ({mode}): "
+        f"{timings['wall_clock']:.2f}초 (순차 실행 시 {timings['sequential_estimate']:.2f}초, "
+        f"{timings['saved']:.2f}초 절약)"
+    )
+    return review_opinion, timings
 
-        # JSON 코드 블록 제거
-        if result.startswith("```json"):
-            result = result[7:]
-        elif result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        result = result.strip()
+def _sse_event(event: str, data) -> str:
+    """Server-Sent Events 형식의 이벤트 문자열"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
 
-        report_json = json.loads(result)
-        report_data = ReportData(**report_json)
+@router.get("/{document_id}/report", response_model=ReportResponse)
+async def get_report(
+    document_id: int,
+    mode: str | None = None,
+    force: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    문서의 리포트 데이터를 조회합니다. 저장된 리포트가 있으면 반환하고, 없으면 LLM이 생성하여 저장합니다.
+    자동 저장된 리포트는 입력(추출 데이터, 추가 정보, 심사 의견, 위험 분석 입력)이 바뀌었거나 force=True이면 다시 생성합니다.
+    mode: dependent(기본) 또는 parallel - 리포트 생성 파이프라인 방식 (REPORT_PIPELINE_MODE 환경변수로 기본값 변경)
+    """
+    document = await document_repo.get_document(db, document_id)
 
-        return ReportResponse(data=report_data, review_opinion=review_opinion)
+    if not document:
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
 
+    # 저장된 리포트를 사용할 수 있으면 반환
+    if not force:
+        cached = await _cached_report(document, db)
+        if cached:
+            return cached
+
+    mode = _resolve_pipeline_mode(mode)
+
+    # 저장된 리포트가 없으면 새로 생성
+    extraction, additional_info = await _load_report_inputs(document_id, db)
+
+    existing_opinion = document.review_opinion
+    pipeline = build_report_pipeline(mode, document_id, extraction, additional_info, existing_opinion, db)
+
+    try:
+        result = await pipeline.run()
     except Exception as e:
         print(f"[LLM] 리포트 생성 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"리포트 생성에 실패했습니다: {str(e)}")
 
+    review_opinion, timings = await _finish_report(document, extraction, additional_info, existing_opinion, result, mode, db)
+
+    return ReportResponse(data=result.results["report"], review_opinion=review_opinion, timings=timings)
+
+@router.get("/{document_id}/report/stream")
+async def stream_report(
+    document_id: int,
+    mode: str | None = None,
+    force: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    get_report의 Server-Sent Events 버전. 전체 리포트를 기다리지 않고 진행 상황과 섹션을 바로 받습니다.
+    저장된 리포트를 사용하는 조건과 force는 get_report와 같습니다.
+
+    이벤트:
+    - stage: 단계 완료 (risk, opinion 등). 단계 이름과 소요 시간, 위험 등급/심사 의견 포함
+    - section: 리포트 섹션 완성 (summary, company, financial, risk, loan 순서로 생성되는 대로)
+    - done: 최종 리포트 (ReportResponse 형식)
+    - error: 생성 실패
+    """
+    document = await document_repo.get_document(db, document_id)
+
+    if not document:
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+    # 저장된 리포트를 사용할 수 있으면 섹션을 바로 전송
+    report = None if force else await _cached_report(document, db)
+    if report:
+        async def stored_events():
+            sections = report.data.model_dump()
+            for name in ReportData.model_fields:
+                yield _sse_event("section", {"name": name, "data": sections[name]})
+            yield _sse_event("done", report.model_dump())
+
+        return StreamingResponse(stored_events(), media_type="text/event-stream", headers=headers)
+
+    mode = _resolve_pipeline_mode(mode)
+    extraction, additional_info = await _load_report_inputs(document_id, db)
+    existing_opinion = document.review_opinion
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def on_section(name: str, value):
+        await events.put(("section", {"name": name, "data": value}))
+
+    async def write_report(extraction, additional_info, risk, opinion):
+        return await stream_report_data(extraction, additional_info, risk, opinion, on_section)
+
+    async def on_stage_complete(name: str, value, timing: dict):
+        if name == "report":
+            return
+        payload = {"stage": name, **timing}
+        if name == "risk":
+            payload["overall_grade"] = value.overall_grade if value else None
+        elif name == "opinion":
+            payload["review_opinion"] = value
+        await events.put(("stage", payload))
+
+    async def produce():
+        # 응답 본문은 핸들러가 반환된 뒤에 전송되므로 요청 세션이 아닌 별도 세션에서 저장
+        async with new_async_session() as stream_db:
+            try:
+                pipeline = build_report_pipeline(
+                    mode, document_id, extraction, additional_info, existing_opinion, stream_db, write_report=write_report
+                )
+                result = await pipeline.run(on_stage_complete=on_stage_complete)
+                stream_document = await document_repo.get_document(stream_db, document_id)
+                review_opinion, timings = await _finish_report(
+                    stream_document, extraction, additional_info, existing_opinion, result, mode, stream_db
+                )
+                response = ReportResponse(data=result.results["report"], review_opinion=review_opinion, timings=timings)
+                await events.put(("done", response.model_dump()))
+            except Exception as e:
+                print(f"[LLM] 리포트 생성 실패: {str(e)}")
+                await events.put(("error", {"detail": f"리포트 생성에 실패했습니다: {str(e)}"}))
+            finally:
+                await events.put(None)
+
+    async def event_stream():
+        task = asyncio.create_task(produce())
+        try:
+            while (event := await events.get()) is not None:
+                yield _sse_event(*event)
+        finally:
+            # 클라이언트 연결이 끊기면 생성 중단 (공유 중인 위험 분석 작업은 계속 진행)
+            task.cancel()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=headers)
+
+
 @router.post("/{document_id}/report", response_model=ReportResponse)
 def update_report(
     document_id: int,
@@ -494,6 +703,8 @@ def update_report(
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
 
     document.report_data = request.data.model_dump()
+    # 직접 저장한 리포트는 입력이 바뀌어도 다시 생성하지 않음
+    document.report_fingerprint = None
     db.commit()
     db.refresh(document)
 
@@ -516,38 +727,18 @@ def complete_report(
 
     return {"status": "success", "message": "리포트가 저장되었습니다."}
 
-@router.get("/{document_id}/risk-analysis", response_model=RiskAnalysisResponse)
-def get_risk_analysis(
-    document_id: int,
-    db: Session = Depends(get_db)
-):
-    """문서의 위험 분석을 수행합니다. DB에 저장된 extraction과 additional_info를 기반으로 LLM이 분석합니다."""
-
-    # 문서 확인
-    document = db.query(Document).filter(Document.id == document_id).first()
-    if not document:
-        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
-
-    # 추출된 데이터 확인
-    extraction = db.query(DocumentExtraction).filter(
-        DocumentExtraction.document_id == document_id
-    ).first()
-
-    if not extraction:
-        raise HTTPException(status_code=404, detail="추출된 데이터를 찾을 수 없습니다.")
-
-    # 추가 정보 (선택적)
-    additional_info = db.query(AdditionalInfo).filter(
-        AdditionalInfo.document_id == document_id
-    ).first()
-
-    # LLM을 사용하여 위험 분석 수행
-    try:
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel("gemini-2.0-flash")
-
-        # 컨텍스트 구성
-        context = f"""
+async def run_risk_analysis(extraction: DocumentExtraction, additional_info: AdditionalInfo | None) -> RiskAnalysisResponse:
+    """
+    추출 데이터와 추가 정보를 바탕으로 위험 분석을 수행합니다. 실패하면 예외를 그대로 전달합니다.
+    산업 지식(data/industry_knowledge)에 있는 산업은 업종 평균과 위험 요인 템플릿으로 바로 분석하고,
+    그 외 산업만 LLM으로 분석합니다.
+    """
+    industry_match = get_industry_knowledge().match(extraction.industry)
+    if industry_match:
+        return RiskAnalysisResponse(**build_local_risk_analysis(extraction, industry_match))
+
+    # 컨텍스트 구성
+    context = f"""
 당신은 금융 대출 심사 전문가입니다. 다음 정보를 바탕으로 위험 분석을 수행해주세요.
 
 【기업 기본 정보】
@@ -573,15 +764,16 @@ def get_risk_analysis(
 - 대출 금액: {extraction.loan_amount or "N/A"}
 """
 
-        if additional_info:
-            context += f"""
-【추가 정보】
-- AI 제안 필드: {json.dumps(additional_info.field_data or {}, ensure_ascii=False)}
-- 사용자 입력: {json.dumps(additional_info.custom_fields or {}, ensure_ascii=False)}
-- 담보 정보: {json.dumps(additional_info.collateral_data or {}, ensure_ascii=False)}
-"""
+    context += _additional_info_context(additional_info)
 
-        context += """
+    # 재무 비율은 로컬에서 계산 (LLM은 서술만 작성)
+    financial_ratios = [FinancialRatio(**ratio) for ratio in build_financial_ratios(extraction)]
+    context += "\n【재무 비율 (계산값, 비교 기준: 전산업 평균)】\n"
+    for ratio in financial_ratios:
+        value = f"{ratio.value:.1f}%" if ratio.value is not None else "계산 불가"
+        context += f"- {ratio.name}: {value} (기준 {ratio.industry_average:.1f}%, 상태: {ratio.status})\n"
+
+    context += """
 다음 형식의 JSON으로 응답해주세요:
 
 {
@@ -608,60 +800,110 @@ def get_risk_analysis(
       "recommendation": "개선 권장사항"
     }
   ],
-  "financial_ratios": [
-    {
-      "name": "부채비율",
-      "value": 145.0,
-      "industry_average": 120.0,
-      "status": "warning",
-      "percentage": 72.0
-    }
-  ],
-
-중요: 재무 정보가 없어서 계산할 수 없는 경우, value/industry_average/percentage 필드에 null을 사용하세요. 'N/A' 같은 문자열은 사용하지 마세요.
   "overall_grade": "B등급 (5등급 중 2등급)",
   "improvement_plan": "개선 계획 설명"
 }
 
 위험 요인은 high(고위험), medium(중위험), low(저위험)로 구분하고, 각각 최소 1개씩 포함해주세요.
-재무 비율은 최소 2개 이상 분석해주세요.
-status는 good(양호), warning(주의), danger(위험) 중 하나입니다.
+재무 비율은 위에 계산된 값을 그대로 인용하고, 다시 계산하지 마세요.
 반드시 유효한 JSON 형식으로만 응답하세요.
 """
 
-        response = model.generate_content(
-            context,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-            )
-        )
+    llm_response = await get_llm_client().generate_json(context, temperature=0.3)
 
-        result = response.text.strip()
-
-        # JSON 코드 블록 제거
-        if result.startswith("```json"):
-            result = result[7:]
-        elif result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        result = result.strip()
-
-        llm_response = json.loads(result)
-
-        # Pydantic 모델로 변환
-        industry_classification = IndustryClassification(**llm_response["industry_classification"])
-        risk_factors = [RiskFactor(**factor) for factor in llm_response["risk_factors"]]
-        financial_ratios = [FinancialRatio(**ratio) for ratio in llm_response["financial_ratios"]]
-
-        return RiskAnalysisResponse(
-            industry_classification=industry_classification,
-            risk_factors=risk_factors,
-            financial_ratios=financial_ratios,
-            overall_grade=llm_response["overall_grade"],
-            improvement_plan=llm_response["improvement_plan"]
-        )
+    # Pydantic 모델로 변환
+    industry_classification = IndustryClassification(**llm_response["industry_classification"])
+    risk_factors = [RiskFactor(**factor) for factor in llm_response["risk_factors"]]
+
+    return RiskAnalysisResponse(
+        industry_classification=industry_classification,
+        risk_factors=risk_factors,
+        financial_ratios=financial_ratios,
+        overall_grade=llm_response["overall_grade"],
+        improvement_plan=llm_response["improvement_plan"]
+    )
+
+# 진행 중인 위험 분석 (문서 ID, 입력 지문) -> Task
+# 프론트엔드 폴링 등으로 같은 분석이 동시에 요청되면 LLM 호출 하나를 공유합니다.
+_risk_analysis_tasks: dict[tuple[int, str], asyncio.Task] = {}
+
+def _risk_input_version() -> str:
+    # 산업 지식 파일이 바뀌어도 다시 분석하도록 지식 저장소의 지문을 포함
+    return f"{RISK_ANALYSIS_VERSION}:{get_industry_knowledge().signature}"
 
+async def get_or_run_risk_analysis(
+    document_id: int,
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+    db: AsyncSession,
+    force: bool = False,
+) -> RiskAnalysisResponse:
+    """
+    저장된 위험 분석 결과를 반환합니다.
+    저장된 결과가 없거나 입력(추출 데이터, 추가 정보)이 바뀌었거나 force=True이면 LLM으로 다시 분석하고 저장합니다.
+    """
+    fingerprint = compute_input_fingerprint(extraction, additional_info, version=_risk_input_version())
+
+    if not force:
+        stored = await analysis_repo.get_stored_analysis(db, document_id, RISK_ANALYSIS_TYPE, fingerprint)
+        if stored is not None:
+            try:
+                return RiskAnalysisResponse(**stored)
+            except Exception as e:
+                print(f"[RiskAnalysis] 저장된 결과를 읽을 수 없어 다시 분석합니다 (문서 {document_id}): {str(e)}")
+
+    key = (document_id, fingerprint)
+    task = _risk_analysis_tasks.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_run_and_save_risk_analysis(document_id, fingerprint, extraction, additional_info))
+        _risk_analysis_tasks[key] = task
+        task.add_done_callback(lambda _: _risk_analysis_tasks.pop(key, None))
+
+    # 요청이 취소되어도 다른 요청이 기다리는 분석은 계속 진행
+    return await asyncio.shield(task)
+
+async def _run_and_save_risk_analysis(
+    document_id: int,
+    fingerprint: str,
+    extraction: DocumentExtraction,
+    additional_info: AdditionalInfo | None,
+) -> RiskAnalysisResponse:
+    """
+    위험 분석을 실행하고 결과를 한 번만 저장합니다. 같은 분석을 기다리는 요청들이 이 작업을 공유하므로
+    요청 세션이 아닌 별도 세션을 사용합니다 (먼저 끝난 요청의 세션이 닫혀도 저장되도록).
+    """
+    result = await run_risk_analysis(extraction, additional_info)
+    async with new_async_session() as db:
+        await analysis_repo.save_analysis(db, document_id, RISK_ANALYSIS_TYPE, fingerprint, result.model_dump())
+    return result
+
+@router.get("/{document_id}/risk-analysis", response_model=RiskAnalysisResponse)
+async def get_risk_analysis(
+    document_id: int,
+    force: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    문서의 위험 분석 결과를 반환합니다. DB에 저장된 extraction과 additional_info를 기반으로 LLM이 분석하며,
+    결과는 저장되어 입력이 바뀌지 않는 한 다시 분석하지 않습니다. force=true이면 항상 다시 분석합니다.
+    """
+
+    # 문서 확인
+    if not await document_repo.document_exists(db, document_id):
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
+
+    # 추출된 데이터 확인
+    extraction = await document_repo.get_extraction(db, document_id)
+
+    if not extraction:
+        raise HTTPException(status_code=404, detail="추출된 데이터를 찾을 수 없습니다.")
+
+    # 추가 정보 (선택적)
+    additional_info = await document_repo.get_additional_info(db, document_id)
+
+    # 저장된 결과 조회 또는 LLM을 사용하여 위험 분석 수행
+    try:
+        return await get_or_run_risk_analysis(document_id, extraction, additional_info, db, force=force)
     except Exception as e:
         print(f"[LLM] 위험 분석 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"위험 분석에 실패했습니다: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"위험 분석에 실패했습니다: {str(e)}")
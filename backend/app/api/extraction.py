@@ -1,28 +1,76 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.models.document import Document, DocumentExtraction
-from app.schemas.extraction import ExtractionDataResponse, ExtractionDataUpdate
+from app.models.job import ExtractionBatch
+from app.repositories import documents as document_repo
+from app.schemas.extraction import ExtractionDataResponse, ExtractionDataUpdate, BatchReprocessRequest, BatchProgressResponse
+from app.services.batch_reprocess import batch_progress, create_reprocess_batch
 from app.services.extraction_service import ExtractionService
+from app.services.job_queue import JobQueue
+from app.services.ocr_cache import get_ocr_cache
 
 router = APIRouter(prefix="/api/extraction", tags=["extraction"])
 
+@router.get("/ocr-cache/stats")
+def get_ocr_cache_stats():
+    """
+    OCR 결과 캐시의 히트/미스 횟수와 사용량을 조회합니다.
+    """
+    cache = get_ocr_cache()
+    if cache is None:
+        return {"enabled": False}
+
+    return {"enabled": True, **cache.stats()}
+
+@router.get("/jobs/stats")
+def get_job_stats(db: Session = Depends(get_db)):
+    """
+    추출 작업 큐의 상태별 작업 수를 조회합니다.
+    """
+    return JobQueue().counts(db)
+
+@router.post("/batch", response_model=BatchProgressResponse)
+def create_batch_reprocess(request: BatchReprocessRequest, db: Session = Depends(get_db)):
+    """
+    조건(상태, 업로드 기간, 문서 ID 목록)에 맞는 문서를 일괄 재처리하도록 작업 큐에 추가합니다.
+    실제 처리는 추출 워커(worker.py 또는 reprocess.py)가 동시 작업 수 제한 안에서 수행합니다.
+    """
+    batch = create_reprocess_batch(
+        db,
+        statuses=request.statuses,
+        uploaded_from=request.uploaded_from,
+        uploaded_to=request.uploaded_to,
+        document_ids=request.document_ids,
+    )
+    return batch_progress(db, batch)
+
+@router.get("/batch/{batch_id}", response_model=BatchProgressResponse)
+def get_batch_progress(batch_id: int, db: Session = Depends(get_db)):
+    """
+    일괄 재처리 작업의 진행 상황을 조회합니다.
+    """
+    batch = db.query(ExtractionBatch).filter(ExtractionBatch.id == batch_id).first()
+    if not batch:
+        raise HTTPException(status_code=404, detail="일괄 작업을 찾을 수 없습니다.")
+
+    return batch_progress(db, batch)
+
 @router.get("/{document_id}", response_model=ExtractionDataResponse)
-def get_extraction_data(document_id: int, db: Session = Depends(get_db)):
+async def get_extraction_data(document_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     문서 ID로 추출된 데이터를 조회합니다.
     """
 
     # 문서 존재 확인
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = await document_repo.get_document(db, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
 
     # 추출된 데이터 조회
-    extraction = db.query(DocumentExtraction).filter(
-        DocumentExtraction.document_id == document_id
-    ).first()
+    extraction = await document_repo.get_extraction(db, document_id)
 
     if not extraction:
         # 문서 상태에 따라 다른 에러 메시지 반환
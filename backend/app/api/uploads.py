@@ -0,0 +1,144 @@
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_async_db, get_db
+from app.models.upload import UploadSession
+from app.schemas.document import DocumentUploadResponse
+from app.schemas.upload import UploadSessionCreate, UploadSessionResponse
+from app.services import upload_sessions
+from app.services.upload_sessions import (
+    RESUMABLE_CHUNK_SIZE,
+    OffsetMismatchError,
+    UploadInProgressError,
+    UploadSessionError,
+)
+
+router = APIRouter(prefix="/api/uploads", tags=["uploads"])
+
+# Content-Range: bytes <start>-<end>/<total>
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+def _session_response(session: UploadSession) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        id=session.id,
+        filename=session.filename,
+        size=session.total_size,
+        offset=session.received,
+        status=session.status,
+        chunk_size=RESUMABLE_CHUNK_SIZE,
+        document_id=session.document_id,
+        expires_at=session.expires_at,
+    )
+
+
+def _get_session(upload_id: str, db: Session) -> UploadSession:
+    session = db.query(UploadSession).filter(UploadSession.id == upload_id).first()
+    if not session:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return session
+
+
+def _offset_conflict(e: OffsetMismatchError | UploadInProgressError) -> HTTPException:
+    # 클라이언트는 Upload-Offset 위치부터 다시 보내면 됨
+    return HTTPException(status_code=409, detail=str(e), headers={"Upload-Offset": str(e.offset)})
+
+
+@router.post("", response_model=UploadSessionResponse)
+def create_upload(request: UploadSessionCreate, db: Session = Depends(get_db)):
+    """
+    이어받기 업로드 세션을 만듭니다.
+    이후 PUT /api/uploads/{id}로 조각을 순서대로 보내고, POST /api/uploads/{id}/complete로 완료합니다.
+    """
+    try:
+        session = upload_sessions.create_session(db, request.filename, request.size)
+    except UploadSessionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return _session_response(session)
+
+
+@router.get("/{upload_id}", response_model=UploadSessionResponse)
+def get_upload(upload_id: str, db: Session = Depends(get_db)):
+    """업로드 세션 상태와 서버가 받은 위치(offset)를 조회합니다. 연결이 끊긴 뒤 이어서 보낼 위치를 확인할 때 사용합니다."""
+    return _session_response(_get_session(upload_id, db))
+
+
+@router.head("/{upload_id}")
+def head_upload(upload_id: str, db: Session = Depends(get_db)):
+    """GET과 같지만 본문 없이 Upload-Offset / Upload-Length 헤더로만 응답합니다."""
+    session = _get_session(upload_id, db)
+    return Response(headers={
+        "Upload-Offset": str(session.received),
+        "Upload-Length": str(session.total_size),
+        "Cache-Control": "no-store",
+    })
+
+
+@router.put("/{upload_id}", response_model=UploadSessionResponse)
+async def upload_chunk(upload_id: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    파일 조각을 업로드합니다. 본문은 조각의 바이트 그대로 보내고 위치는 Content-Range 헤더로 지정합니다.
+    (예: Content-Range: bytes 0-8388607/104857600)
+
+    - 시작 위치는 서버가 받은 위치(offset)와 같아야 하며, 다르면 409와 함께 현재 offset을 반환합니다.
+    - 조각을 보내는 중 연결이 끊겨도 이미 받은 바이트는 유지됩니다.
+    - 같은 업로드에 다른 요청이 조각을 쓰고 있으면 본문을 받기 전에 409로 거절합니다.
+    """
+    session = await db.get(UploadSession, upload_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+
+    content_range = request.headers.get("content-range")
+    match = CONTENT_RANGE_PATTERN.match(content_range or "")
+    if not match:
+        raise HTTPException(status_code=400, detail="Content-Range 헤더가 필요합니다. (예: bytes 0-1023/4096)")
+
+    start, end, total = (int(value) for value in match.groups())
+    if total != session.total_size or end < start or end >= total:
+        raise HTTPException(status_code=400, detail="Content-Range가 업로드 세션과 맞지 않습니다.")
+
+    try:
+        await upload_sessions.write_range(db, session, start, request.stream(), length=end - start + 1)
+    except (OffsetMismatchError, UploadInProgressError) as e:
+        raise _offset_conflict(e)
+    except UploadSessionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return _session_response(session)
+
+
+@router.post("/{upload_id}/complete", response_model=DocumentUploadResponse)
+def complete_upload(upload_id: str, db: Session = Depends(get_db)):
+    """
+    업로드를 완료하고 문서로 등록합니다.
+    PDF/이미지는 추출 작업 큐에 등록되며, 이미 추출된 파일과 내용이 같으면 기존 추출 데이터를 재사용합니다.
+    다른 요청이 조각을 쓰거나 완료 처리하는 중이면 409를 반환하며, 같은 세션을 다시 완료 요청하면 같은 문서를 반환합니다.
+    """
+    session = _get_session(upload_id, db)
+
+    try:
+        document = upload_sessions.finalize(db, session)
+    except UploadInProgressError as e:
+        raise _offset_conflict(e)
+    except UploadSessionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return DocumentUploadResponse(
+        id=document.id,
+        filename=document.filename,
+        filepath=document.filepath,
+        file_size=document.file_size,
+        upload_date=document.upload_date,
+        status=document.status
+    )
+
+
+@router.delete("/{upload_id}")
+def abort_upload(upload_id: str, db: Session = Depends(get_db)):
+    """업로드를 취소하고 받은 조각을 삭제합니다."""
+    upload_sessions.abort(db, _get_session(upload_id, db))
+    return {"status": "success", "message": "업로드가 취소되었습니다."}
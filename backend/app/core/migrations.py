@@ -0,0 +1,308 @@
+"""
+버전 기반 스키마 마이그레이션
+
+- 적용된 버전은 schema_version 테이블에 기록하고, 아직 적용되지 않은 마이그레이션만 순서대로 실행합니다.
+- 마이그레이션은 `python migrate.py`로 한 번 적용하며, API/워커는 시작 시 버전만 확인합니다
+  (매 시작마다 create_all로 전체 스키마를 조회하지 않음).
+- 기존 migrate_add_*.py 스크립트로 이미 컬럼을 추가한 DB에서도 안전하도록 각 단계는 멱등적으로 작성합니다.
+- 테이블을 만드는 단계는 현재 모델이 아니라 그 버전을 공개할 때의 테이블 정의를 그대로 고정해 둡니다
+  (모델이 바뀌어도 새 DB와 기존 DB가 같은 단계를 거쳐 같은 스키마가 되도록).
+
+새 마이그레이션은 MIGRATIONS 끝에 다음 버전 번호로 추가합니다.
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    inspect,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+# 시작 시 미적용 마이그레이션을 자동으로 적용할지 여부 (로컬 개발/단일 프로세스용, 운영에서는 migrate.py로 적용)
+AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", "0") == "1"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def _add_column(conn: Connection, table: str, column: str, ddl: str) -> None:
+    """컬럼이 없을 때만 추가합니다."""
+    columns = {col["name"] for col in inspect(conn).get_columns(table)}
+    if column not in columns:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+
+
+def _create_index(conn: Connection, name: str, table: str, columns: List[str]) -> None:
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+
+
+def _create_tables(conn: Connection) -> None:
+    # v1 공개 당시의 테이블 정의 (이후 추가된 컬럼/테이블은 해당 버전의 마이그레이션에서 추가)
+    metadata = MetaData()
+    Table(
+        "documents", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("filename", String, nullable=False),
+        Column("filepath", String, nullable=False),
+        Column("file_size", Integer),
+        Column("upload_date", DateTime, index=True),
+        Column("status", String),
+        Column("review_opinion", Text, nullable=True),
+        Column("report_data", JSON, nullable=True),
+        Column("report_fingerprint", String, nullable=True),
+        Index("ix_documents_status_upload_date", "status", "upload_date"),
+    )
+    Table(
+        "document_extractions", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("document_id", Integer, ForeignKey("documents.id"), nullable=False, unique=True),
+        Column("company_name", String),
+        Column("business_number", String),
+        Column("ceo_name", String),
+        Column("establishment_date", String),
+        Column("industry", String),
+        Column("address", String),
+        Column("revenue", Float),
+        Column("operating_profit", Float),
+        Column("net_profit", Float),
+        Column("total_assets", Float),
+        Column("total_liabilities", Float),
+        Column("equity", Float),
+        Column("employee_count", Integer),
+        Column("main_products", Text),
+        Column("loan_purpose", Text),
+        Column("loan_amount", Float),
+        Column("extracted_at", DateTime),
+        Column("extraction_method", String),
+    )
+    Table(
+        "additional_info", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("document_id", Integer, ForeignKey("documents.id"), nullable=False, unique=True),
+        Column("field_data", JSON, nullable=True),
+        Column("custom_fields", JSON, nullable=True),
+        Column("collateral_data", JSON, nullable=True),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    Table(
+        "analyses", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("document_id", Integer, ForeignKey("documents.id"), nullable=False),
+        Column("analysis_type", String, nullable=False),
+        Column("result", String),
+        Column("score", Float),
+        Column("input_fingerprint", String, nullable=True),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+        Index("ix_analyses_document_id_analysis_type", "document_id", "analysis_type"),
+    )
+    Table(
+        "extraction_batches", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("kind", String, nullable=False),
+        Column("filter", JSON, nullable=True),
+        Column("total", Integer, nullable=False),
+        Column("skipped", Integer, nullable=False),
+        Column("created_at", DateTime),
+    )
+    Table(
+        "extraction_jobs", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("document_id", Integer, ForeignKey("documents.id"), nullable=False, index=True),
+        Column("batch_id", Integer, ForeignKey("extraction_batches.id"), nullable=True, index=True),
+        Column("kind", String, nullable=False),
+        Column("status", String, nullable=False),
+        Column("attempts", Integer, nullable=False),
+        Column("max_attempts", Integer, nullable=False),
+        Column("available_at", DateTime, nullable=False),
+        Column("last_error", Text, nullable=True),
+        Column("worker_id", String, nullable=True),
+        Column("locked_until", DateTime, nullable=True),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+        Column("finished_at", DateTime, nullable=True),
+        Index("ix_extraction_jobs_status_available_at", "status", "available_at"),
+    )
+    metadata.create_all(bind=conn)
+
+
+def _add_collateral(conn: Connection) -> None:
+    _add_column(conn, "additional_info", "collateral_data", "TEXT")
+
+
+def _add_report_data(conn: Connection) -> None:
+    _add_column(conn, "documents", "report_data", "TEXT")
+
+
+def _add_review_opinion(conn: Connection) -> None:
+    _add_column(conn, "documents", "review_opinion", "TEXT")
+
+
+def _add_analysis_fingerprint(conn: Connection) -> None:
+    _add_column(conn, "analyses", "input_fingerprint", "TEXT")
+
+
+def _add_job_batch(conn: Connection) -> None:
+    _add_column(conn, "extraction_jobs", "batch_id", "INTEGER REFERENCES extraction_batches(id)")
+    _create_index(conn, "ix_extraction_jobs_batch_id", "extraction_jobs", ["batch_id"])
+
+
+def _add_report_fingerprint(conn: Connection) -> None:
+    _add_column(conn, "documents", "report_fingerprint", "TEXT")
+
+
+def _add_dashboard_index(conn: Connection) -> None:
+    _create_index(conn, "ix_documents_status_upload_date", "documents", ["status", "upload_date"])
+
+
+def _add_lookup_indexes(conn: Connection) -> None:
+    # 문서 목록 (upload_date 내림차순)
+    _create_index(conn, "ix_documents_upload_date", "documents", ["upload_date"])
+    # 저장된 분석 조회 (document_id + analysis_type)
+    _create_index(conn, "ix_analyses_document_id_analysis_type", "analyses", ["document_id", "analysis_type"])
+
+
+def _add_content_hash(conn: Connection) -> None:
+    _add_column(conn, "documents", "content_hash", "VARCHAR")
+    _create_index(conn, "ix_documents_content_hash", "documents", ["content_hash"])
+
+
+def _add_upload_sessions(conn: Connection) -> None:
+    # v11 공개 당시의 테이블 정의 (documents는 FK 대상으로만 참조)
+    metadata = MetaData()
+    Table("documents", metadata, Column("id", Integer, primary_key=True))
+    upload_sessions = Table(
+        "upload_sessions", metadata,
+        Column("id", String, primary_key=True),
+        Column("filename", String, nullable=False),
+        Column("file_ext", String, nullable=False),
+        Column("total_size", BigInteger, nullable=False),
+        Column("received", BigInteger, nullable=False),
+        Column("temp_path", String, nullable=False),
+        Column("status", String, nullable=False),
+        Column("document_id", Integer, ForeignKey("documents.id"), nullable=True),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+        Column("expires_at", DateTime, nullable=False),
+        Index("ix_upload_sessions_status_expires_at", "status", "expires_at"),
+    )
+    upload_sessions.create(bind=conn, checkfirst=True)
+
+
+def _add_upload_writer(conn: Connection) -> None:
+    _add_column(conn, "upload_sessions", "writer_id", "VARCHAR")
+
+
+def _add_upload_content_hash(conn: Connection) -> None:
+    _add_column(conn, "upload_sessions", "content_hash", "VARCHAR")
+
+
+# 이미 공개된 마이그레이션의 순서/내용은 바꾸지 않습니다 (변경은 새 버전으로 추가)
+MIGRATIONS: List[Migration] = [
+    Migration(1, "테이블 생성", _create_tables),
+    Migration(2, "additional_info.collateral_data 컬럼 추가", _add_collateral),
+    Migration(3, "documents.report_data 컬럼 추가", _add_report_data),
+    Migration(4, "documents.review_opinion 컬럼 추가", _add_review_opinion),
+    Migration(5, "analyses.input_fingerprint 컬럼 추가", _add_analysis_fingerprint),
+    Migration(6, "extraction_jobs.batch_id 컬럼 추가", _add_job_batch),
+    Migration(7, "documents.report_fingerprint 컬럼 추가", _add_report_fingerprint),
+    Migration(8, "documents (status, upload_date) 인덱스 추가", _add_dashboard_index),
+    Migration(9, "documents.upload_date, analyses (document_id, analysis_type) 인덱스 추가", _add_lookup_indexes),
+    Migration(10, "documents.content_hash 컬럼 추가", _add_content_hash),
+    Migration(11, "upload_sessions 테이블 추가", _add_upload_sessions),
+    Migration(12, "upload_sessions.writer_id 컬럼 추가", _add_upload_writer),
+    Migration(13, "upload_sessions.content_hash 컬럼 추가", _add_upload_content_hash),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR NOT NULL, "
+        "applied_at TIMESTAMP NOT NULL)"
+    ))
+
+
+def current_version(engine: Engine) -> int:
+    """적용된 마지막 마이그레이션 버전 (schema_version 테이블이 없으면 0)."""
+    with engine.begin() as conn:
+        _ensure_version_table(conn)
+        version = conn.execute(text(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}")).scalar()
+    return version or 0
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    version = current_version(engine)
+    return [migration for migration in MIGRATIONS if migration.version > version]
+
+
+def apply_migrations(engine: Engine) -> List[Migration]:
+    """
+    미적용 마이그레이션을 버전 순서대로 적용합니다.
+    마이그레이션마다 별도 트랜잭션에서 실행하고 성공하면 schema_version에 기록합니다.
+
+    Returns:
+        이번에 적용된 마이그레이션 목록
+    """
+    applied = []
+    for migration in pending_migrations(engine):
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(
+                text(
+                    f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description, applied_at) "
+                    "VALUES (:version, :description, :applied_at)"
+                ),
+                {"version": migration.version, "description": migration.description, "applied_at": datetime.utcnow()},
+            )
+        print(f"[Migration] v{migration.version} 적용: {migration.description}")
+        applied.append(migration)
+    return applied
+
+
+def ensure_schema(engine: Engine) -> None:
+    """
+    프로세스 시작 시 스키마 버전을 확인합니다 (schema_version 조회 한 번).
+    AUTO_MIGRATE=1이면 미적용 마이그레이션을 적용합니다.
+
+    Raises:
+        RuntimeError: AUTO_MIGRATE가 꺼져 있고 스키마가 최신 버전이 아닌 경우 (오래된 스키마로 시작하지 않음)
+    """
+    if AUTO_MIGRATE:
+        apply_migrations(engine)
+        return
+
+    version = current_version(engine)
+    if version < LATEST_VERSION:
+        message = (
+            f"스키마 버전 v{version} < v{LATEST_VERSION}: "
+            "`python migrate.py`로 마이그레이션을 적용한 뒤 다시 시작하세요."
+        )
+        print(f"[Migration] {message}")
+        raise RuntimeError(message)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -10,15 +10,22 @@ class Document(Base):
     filename = Column(String, nullable=False)
     filepath = Column(String, nullable=False)
     file_size = Column(Integer)
-    upload_date = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String, nullable=True, index=True)  # 파일 내용의 SHA-256 (중복 업로드 확인)
+    upload_date = Column(DateTime, default=datetime.utcnow, index=True)
     status = Column(String, default="uploaded")  # uploaded, processing, completed, failed
     review_opinion = Column(Text, nullable=True)  # 심사 의견
     report_data = Column(JSON, nullable=True)  # 리포트 데이터
+    report_fingerprint = Column(String, nullable=True)  # 자동 저장된 리포트의 입력 지문 (직접 저장한 리포트는 NULL)
 
     # Relationship
     extraction = relationship("DocumentExtraction", back_populates="document", uselist=False)
     analyses = relationship("Analysis", back_populates="document")
 
+    __table_args__ = (
+        # 대시보드 완료 목록: status로 거르고 upload_date(+ rowid인 id) 순서로 페이지 조회
+        Index("ix_documents_status_upload_date", "status", "upload_date"),
+    )
+
 class DocumentExtraction(Base):
     __tablename__ = "document_extractions"
 
@@ -84,8 +91,13 @@ class Analysis(Base):
     analysis_type = Column(String, nullable=False)
     result = Column(String)
     score = Column(Float)
+    input_fingerprint = Column(String, nullable=True)  # 분석 입력(추출 데이터 + 추가 정보)의 지문
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
-    document = relationship("Document", back_populates="analyses")
\ No newline at end of file
+    document = relationship("Document", back_populates="analyses")
+
+    __table_args__ = (
+        Index("ix_analyses_document_id_analysis_type", "document_id", "analysis_type"),
+    )
@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, JSON
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+
+class ExtractionBatch(Base):
+    __tablename__ = "extraction_batches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False, default="reprocess")
+    filter = Column(JSON, nullable=True)  # 대상 문서 조건 (status, 업로드 기간, 문서 ID 목록)
+    total = Column(Integer, nullable=False, default=0)  # 큐에 추가된 작업 수
+    skipped = Column(Integer, nullable=False, default=0)  # 이미 처리 중이어서 제외된 문서 수
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationship
+    jobs = relationship("ExtractionJob", back_populates="batch")
+
+class ExtractionJob(Base):
+    __tablename__ = "extraction_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    batch_id = Column(Integer, ForeignKey("extraction_batches.id"), nullable=True, index=True)  # 일괄 재처리 작업
+    kind = Column(String, nullable=False, default="extract")  # extract, reprocess
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+
+    # 재시도
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # 이 시각 이후 실행 가능
+    last_error = Column(Text, nullable=True)
+
+    # 실행 중인 워커 (locked_until이 지나면 워커가 죽은 것으로 보고 다시 가져감)
+    worker_id = Column(String, nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+
+    # 메타데이터
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    # Relationship
+    document = relationship("Document")
+    batch = relationship("ExtractionBatch", back_populates="jobs")
+
+    __table_args__ = (
+        Index("ix_extraction_jobs_status_available_at", "status", "available_at"),
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from app.core.database import Base
+
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+
+    id = Column(String, primary_key=True)  # 클라이언트에 전달하는 업로드 ID (uuid)
+    filename = Column(String, nullable=False)
+    file_ext = Column(String, nullable=False)
+    total_size = Column(BigInteger, nullable=False)  # 전체 파일 크기 (바이트)
+    received = Column(BigInteger, nullable=False, default=0)  # 지금까지 받은 바이트 수 (다음 업로드 시작 위치)
+    temp_path = Column(String, nullable=False)  # 조각을 이어 쓰는 임시 파일
+    status = Column(String, nullable=False, default="open")  # open, writing, finalizing, completed, aborted, expired
+    writer_id = Column(String, nullable=True)  # 조각을 쓰고 있는 요청 (status가 writing일 때)
+    content_hash = Column(String, nullable=True)  # 완료 처리 중 내용 해시 경로로 옮긴 파일 (재시도 시 이어서 사용)
+    document_id = Column(Integer, ForeignKey("documents.id"), nullable=True)  # 완료 후 생성된 문서
+
+    # 메타데이터
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)  # 이 시각까지 업로드가 없으면 만료
+
+    __table_args__ = (
+        Index("ix_upload_sessions_status_expires_at", "status", "expires_at"),
+    )
@@ -0,0 +1,60 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Analysis
+
+
+async def get_analysis(db: AsyncSession, document_id: int, analysis_type: str) -> Optional[Analysis]:
+    result = await db.execute(
+        select(Analysis).where(
+            Analysis.document_id == document_id,
+            Analysis.analysis_type == analysis_type,
+        )
+    )
+    return result.scalars().first()
+
+
+async def get_stored_analysis(
+    db: AsyncSession,
+    document_id: int,
+    analysis_type: str,
+    fingerprint: str,
+) -> Optional[Dict[str, Any]]:
+    """입력 지문이 일치하는 저장된 분석 결과를 반환합니다. 없거나 입력이 바뀌었으면 None."""
+    analysis = await get_analysis(db, document_id, analysis_type)
+
+    if not analysis or analysis.input_fingerprint != fingerprint or not analysis.result:
+        return None
+
+    try:
+        return json.loads(analysis.result)
+    except ValueError:
+        return None
+
+
+async def save_analysis(
+    db: AsyncSession,
+    document_id: int,
+    analysis_type: str,
+    fingerprint: str,
+    result: Dict[str, Any],
+    score: Optional[float] = None,
+) -> Analysis:
+    """분석 결과를 저장합니다. 문서별·분석 종류별로 최신 결과 하나만 유지합니다."""
+    analysis = await get_analysis(db, document_id, analysis_type)
+
+    if not analysis:
+        analysis = Analysis(document_id=document_id, analysis_type=analysis_type)
+        db.add(analysis)
+
+    analysis.result = json.dumps(result, ensure_ascii=False)
+    analysis.score = score
+    analysis.input_fingerprint = fingerprint
+    analysis.updated_at = datetime.utcnow()
+
+    await db.commit()
+    return analysis
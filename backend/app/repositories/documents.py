@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import AdditionalInfo, Document, DocumentExtraction
+
+
+async def get_document(db: AsyncSession, document_id: int) -> Optional[Document]:
+    return await db.get(Document, document_id)
+
+
+async def document_exists(db: AsyncSession, document_id: int) -> bool:
+    result = await db.execute(select(Document.id).where(Document.id == document_id))
+    return result.first() is not None
+
+
+async def list_documents(db: AsyncSession) -> Sequence[Document]:
+    """모든 문서 (최신 업로드 순)"""
+    result = await db.execute(select(Document).order_by(Document.upload_date.desc()))
+    return result.scalars().all()
+
+
+async def get_extraction(db: AsyncSession, document_id: int) -> Optional[DocumentExtraction]:
+    result = await db.execute(
+        select(DocumentExtraction).where(DocumentExtraction.document_id == document_id)
+    )
+    return result.scalars().first()
+
+
+async def get_additional_info(db: AsyncSession, document_id: int) -> Optional[AdditionalInfo]:
+    result = await db.execute(
+        select(AdditionalInfo).where(AdditionalInfo.document_id == document_id)
+    )
+    return result.scalars().first()
+
+
+async def list_completed_reports(
+    db: AsyncSession,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    q: Optional[str] = None,
+) -> List[Any]:
+    """
+    완료된 문서와 추출 데이터(회사명, 산업)를 조인한 목록 (최신 업로드 순).
+
+    Args:
+        limit: 최대 행 수
+        after: 키셋 페이지네이션 기준 (upload_date, id). 이 항목 다음부터 조회
+        q: 회사명 또는 산업에 포함된 문자열
+    """
+    query = select(
+        Document.id,
+        Document.filename,
+        Document.upload_date,
+        Document.status,
+        DocumentExtraction.company_name,
+        DocumentExtraction.industry,
+    ).outerjoin(
+        DocumentExtraction, DocumentExtraction.document_id == Document.id
+    ).where(
+        Document.status == "completed"
+    )
+
+    if q and q.strip():
+        pattern = f"%{q.strip()}%"
+        query = query.where(or_(
+            DocumentExtraction.company_name.ilike(pattern),
+            DocumentExtraction.industry.ilike(pattern),
+        ))
+
+    if after:
+        upload_date, document_id = after
+        query = query.where(or_(
+            Document.upload_date < upload_date,
+            and_(Document.upload_date == upload_date, Document.id < document_id),
+        ))
+
+    result = await db.execute(
+        query.order_by(Document.upload_date.desc(), Document.id.desc()).limit(limit)
+    )
+    return result.all()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class DashboardStats(BaseModel):
     total_documents: int
@@ -18,4 +18,16 @@ class RecentAnalysisItem(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class CompletedReportItem(BaseModel):
+    id: int
+    filename: str
+    company_name: Optional[str] = None
+    industry: Optional[str] = None
+    upload_date: Optional[datetime] = None
+    status: str
+
+class CompletedReportPage(BaseModel):
+    items: List[CompletedReportItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (마지막 페이지면 None)
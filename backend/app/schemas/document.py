@@ -62,4 +62,5 @@ class ReportRequest(BaseModel):
 
 class ReportResponse(BaseModel):
     data: ReportData
-    review_opinion: str | None = None
\ No newline at end of file
+    review_opinion: str | None = None
+    timings: Optional[Dict[str, Any]] = None  # 리포트 생성 단계별 소요 시간 (새로 생성한 경우)
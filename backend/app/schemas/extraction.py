@@ -1,6 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, field_validator
+from typing import Optional, List, Dict, Any, Union
+from datetime import date, datetime
 
 class ExtractionDataResponse(BaseModel):
     id: int
@@ -56,4 +56,36 @@ class ExtractionDataUpdate(BaseModel):
     employee_count: Optional[int] = None
     main_products: Optional[str] = None
     loan_purpose: Optional[str] = None
-    loan_amount: Optional[float] = None
\ No newline at end of file
+    loan_amount: Optional[float] = None
+
+class BatchReprocessRequest(BaseModel):
+    # 대상 문서 조건 (지정하지 않은 조건은 적용하지 않음)
+    statuses: Optional[List[str]] = None  # uploaded, processing, completed, failed
+    uploaded_from: Optional[Union[datetime, date]] = None
+    uploaded_to: Optional[Union[datetime, date]] = None  # 날짜만 지정하면 그날 전체 포함
+    document_ids: Optional[List[int]] = None
+
+    @field_validator("uploaded_from", "uploaded_to", mode="before")
+    @classmethod
+    def keep_date_only(cls, value):
+        # "2025-06-30"을 datetime(자정)으로 바꾸면 uploaded_to가 그날 업로드분을 빠뜨리므로 date로 유지
+        if isinstance(value, str):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        return value
+
+class BatchProgressResponse(BaseModel):
+    batch_id: int
+    kind: str
+    filter: Optional[Dict[str, Any]] = None
+    total: int
+    skipped: int
+    queued: int
+    running: int
+    succeeded: int
+    failed: int
+    percent: float
+    done: bool
+    created_at: datetime
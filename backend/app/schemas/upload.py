@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class UploadSessionCreate(BaseModel):
+    filename: str
+    size: int  # 전체 파일 크기 (바이트)
+
+class UploadSessionResponse(BaseModel):
+    id: str
+    filename: str
+    size: int
+    offset: int  # 서버가 받은 바이트 수 (다음 조각의 시작 위치)
+    status: str  # open, writing, finalizing, completed, aborted, expired
+    chunk_size: int  # 권장 조각 크기
+    document_id: Optional[int] = None
+    expires_at: datetime
@@ -0,0 +1,62 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from app.models.document import AdditionalInfo, DocumentExtraction
+
+
+RISK_ANALYSIS_TYPE = "risk"
+# 위험 분석 프롬프트나 응답 형식이 바뀌면 올려서 저장된 결과를 무효화
+RISK_ANALYSIS_VERSION = "3"
+# 리포트 프롬프트나 형식이 바뀌면 올려서 자동 저장된 리포트를 무효화
+REPORT_VERSION = "1"
+
+# 분석 입력에서 제외하는 추출 데이터 컬럼 (내용과 무관한 메타데이터)
+_EXTRACTION_METADATA_COLUMNS = {"id", "document_id", "extracted_at", "extraction_method"}
+_ADDITIONAL_INFO_COLUMNS = ("field_data", "custom_fields", "collateral_data")
+
+
+def compute_input_fingerprint(
+    extraction: DocumentExtraction,
+    additional_info: Optional[AdditionalInfo],
+    version: str = RISK_ANALYSIS_VERSION,
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    분석 입력(추출 데이터 + 추가 정보)의 SHA-256 지문.
+    추출 데이터나 추가 정보가 수정되면 지문이 바뀌어 저장된 분석 결과가 무효화됩니다.
+    extra: 그 밖의 입력 (예: 리포트의 심사 의견)
+    """
+    payload = {
+        "version": version,
+        "extraction": {
+            column.name: getattr(extraction, column.name)
+            for column in DocumentExtraction.__table__.columns
+            if column.name not in _EXTRACTION_METADATA_COLUMNS
+        },
+        "additional_info": {
+            name: getattr(additional_info, name) for name in _ADDITIONAL_INFO_COLUMNS
+        } if additional_info else None,
+    }
+    if extra:
+        payload["extra"] = extra
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def compute_report_fingerprint(
+    extraction: DocumentExtraction,
+    additional_info: Optional[AdditionalInfo],
+    review_opinion: Optional[str],
+    version: str,
+) -> str:
+    """
+    리포트 입력(추출 데이터, 추가 정보, 심사 의견, 위험 분석 입력)의 지문.
+    version에는 REPORT_VERSION과 위험 분석 입력 버전(산업 지식 등)을 함께 넣습니다.
+    """
+    return compute_input_fingerprint(
+        extraction,
+        additional_info,
+        version=f"report-{REPORT_VERSION}:{version}",
+        extra={"review_opinion": review_opinion},
+    )
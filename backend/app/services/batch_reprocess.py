@@ -0,0 +1,96 @@
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.job import ExtractionBatch
+from app.services.job_queue import JobQueue
+
+# 날짜만 지정한 조건은 그날 전체로 해석 (uploaded_from은 0시부터, uploaded_to는 다음 날 0시 전까지)
+DateBound = Union[date, datetime]
+
+
+def select_documents(
+    db: Session,
+    statuses: Optional[List[str]] = None,
+    uploaded_from: Optional[DateBound] = None,
+    uploaded_to: Optional[DateBound] = None,
+    document_ids: Optional[List[int]] = None,
+) -> List[int]:
+    """재처리 대상 문서 ID 목록 (조건을 지정하지 않으면 모든 문서)"""
+    query = db.query(Document.id)
+    if statuses:
+        query = query.filter(Document.status.in_(statuses))
+    if uploaded_from:
+        if not isinstance(uploaded_from, datetime):
+            uploaded_from = datetime.combine(uploaded_from, time.min)
+        query = query.filter(Document.upload_date >= uploaded_from)
+    if isinstance(uploaded_to, datetime):
+        query = query.filter(Document.upload_date <= uploaded_to)
+    elif uploaded_to:
+        query = query.filter(Document.upload_date < datetime.combine(uploaded_to + timedelta(days=1), time.min))
+    if document_ids:
+        query = query.filter(Document.id.in_(document_ids))
+    return [document_id for (document_id,) in query.order_by(Document.id).all()]
+
+
+def create_reprocess_batch(
+    db: Session,
+    statuses: Optional[List[str]] = None,
+    uploaded_from: Optional[DateBound] = None,
+    uploaded_to: Optional[DateBound] = None,
+    document_ids: Optional[List[int]] = None,
+    queue: Optional[JobQueue] = None,
+) -> ExtractionBatch:
+    """
+    조건에 맞는 문서의 재처리(OCR + 구조화 추출) 작업을 하나의 일괄 작업으로 큐에 추가합니다.
+    작업은 DB에 저장되므로 처리 도중 워커가 중단되어도 다시 실행하면 남은 문서부터 이어서 처리합니다.
+    """
+    queue = queue or JobQueue()
+    targets = select_documents(db, statuses, uploaded_from, uploaded_to, document_ids)
+
+    batch = ExtractionBatch(
+        kind="reprocess",
+        filter={
+            "statuses": statuses,
+            "uploaded_from": uploaded_from.isoformat() if uploaded_from else None,
+            "uploaded_to": uploaded_to.isoformat() if uploaded_to else None,
+            "document_ids": document_ids,
+        },
+    )
+    db.add(batch)
+    db.commit()
+    db.refresh(batch)
+
+    added, skipped = queue.enqueue_many(db, targets, kind="reprocess", batch_id=batch.id)
+    batch.total = len(added)
+    batch.skipped = len(skipped)
+    db.commit()
+    db.refresh(batch)
+
+    print(f"[BatchReprocess] 일괄 작업 {batch.id}: {len(added)}개 문서 추가, {len(skipped)}개 제외 (이미 처리 중)")
+    return batch
+
+
+def batch_progress(db: Session, batch: ExtractionBatch, queue: Optional[JobQueue] = None) -> Dict[str, Any]:
+    """일괄 작업의 진행 상황"""
+    counts = (queue or JobQueue()).counts(db, batch_id=batch.id)
+    succeeded = counts.get("succeeded", 0)
+    failed = counts.get("failed", 0)
+    finished = succeeded + failed
+
+    return {
+        "batch_id": batch.id,
+        "kind": batch.kind,
+        "filter": batch.filter,
+        "total": batch.total,
+        "skipped": batch.skipped,
+        "queued": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "succeeded": succeeded,
+        "failed": failed,
+        "percent": round(finished / batch.total * 100, 1) if batch.total else 100.0,
+        "done": finished >= batch.total,
+        "created_at": batch.created_at,
+    }
@@ -0,0 +1,101 @@
+import asyncio
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# 업로드 저장 설정
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))  # 업로드를 읽고 쓰는 단위 (1MB)
+
+
+class FileTooLargeError(Exception):
+    """업로드 크기가 제한을 넘은 경우"""
+
+
+@dataclass
+class StoredBlob:
+    content_hash: str  # 파일 내용의 SHA-256
+    path: str
+    size: int
+    existed: bool  # 같은 내용의 파일이 이미 저장되어 있었는지
+
+
+class BlobStore:
+    """
+    업로드 파일을 내용 해시(SHA-256)로 저장하는 저장소.
+
+    파일은 uploads/<해시 앞 2자리>/<해시><확장자>에 저장되므로 같은 내용을 다시 올려도 디스크에 한 번만 남습니다.
+    쓰기 중인 파일은 uploads/tmp에 두었다가 완료되면 최종 경로로 옮깁니다 (중단된 업로드가 저장소에 섞이지 않음).
+    """
+
+    def __init__(self, root: str = UPLOAD_DIR):
+        self.root = Path(root)
+        self.tmp_dir = self.root / "tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, content_hash: str, ext: str) -> Path:
+        return self.root / content_hash[:2] / f"{content_hash}{ext}"
+
+    def new_temp_path(self) -> Path:
+        return self.tmp_dir / f"{uuid.uuid4().hex}.part"
+
+    def commit(self, temp_path: Path, content_hash: str, ext: str, size: int) -> StoredBlob:
+        """
+        다 쓴 임시 파일을 내용 해시 경로로 옮깁니다.
+        같은 내용이 이미 있으면 임시 파일을 지우고 기존 파일을 사용합니다.
+        """
+        target = self.path_for(content_hash, ext)
+        if target.exists():
+            temp_path.unlink(missing_ok=True)
+            return StoredBlob(content_hash=content_hash, path=str(target), size=size, existed=True)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, target)
+        return StoredBlob(content_hash=content_hash, path=str(target), size=size, existed=False)
+
+    async def save_upload(self, upload, ext: str, max_size: Optional[int] = None) -> StoredBlob:
+        """
+        업로드 스트림을 UPLOAD_CHUNK_SIZE 단위로 읽어 임시 파일에 쓰면서 SHA-256을 계산합니다.
+        파일 쓰기는 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+
+        Args:
+            upload: read(size)를 지원하는 비동기 파일 (FastAPI UploadFile)
+            ext: 저장할 확장자 (OCR 서비스가 확장자로 파일 형식을 판단)
+            max_size: 최대 크기 (바이트). 넘으면 FileTooLargeError
+
+        Returns:
+            StoredBlob
+        """
+        temp_path = self.new_temp_path()
+        digest = hashlib.sha256()
+        size = 0
+
+        buffer = await asyncio.to_thread(open, temp_path, "wb")
+        try:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise FileTooLargeError(f"파일 크기가 제한을 초과했습니다: {size} > {max_size}")
+                digest.update(chunk)
+                await asyncio.to_thread(buffer.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(buffer.close)
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        await asyncio.to_thread(buffer.close)
+        return await asyncio.to_thread(self.commit, temp_path, digest.hexdigest(), ext, size)
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    global _blob_store
+
+    if _blob_store is None:
+        _blob_store = BlobStore()
+    return _blob_store
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.document import Document, DocumentExtraction
+from app.models.job import ExtractionJob
+from app.services.blob_store import StoredBlob
+from app.services.job_queue import ACTIVE_STATUSES, JobQueue
+
+# 허용된 파일 확장자
+ALLOWED_EXTENSIONS = {".pdf", ".doc", ".docx", ".ppt", ".pptx", ".jpg", ".jpeg", ".png", ".gif"}
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+
+# PDF와 이미지 파일은 자동으로 OCR 처리
+OCR_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".gif"}
+
+# 추출 결과를 복사할 때 제외할 컬럼
+_EXTRACTION_SKIP_COLUMNS = {"id", "document_id"}
+
+
+def find_extracted_duplicate(db: Session, content_hash: str) -> Optional[DocumentExtraction]:
+    """같은 내용의 파일로 이미 추출이 끝난 문서의 추출 데이터 (가장 최근 것)"""
+    return (
+        db.query(DocumentExtraction)
+        .join(Document, Document.id == DocumentExtraction.document_id)
+        .filter(Document.content_hash == content_hash)
+        .order_by(DocumentExtraction.extracted_at.desc())
+        .first()
+    )
+
+
+def find_inflight_duplicate(db: Session, content_hash: str, job: ExtractionJob) -> Optional[ExtractionJob]:
+    """
+    같은 내용의 다른 문서에 대해 먼저 등록되어 아직 대기 중이거나 실행 중인 추출 작업.
+    먼저 등록된 작업만 찾으므로 동시에 올라온 같은 파일끼리 서로 기다리지 않습니다.
+    """
+    return (
+        db.query(ExtractionJob)
+        .join(Document, Document.id == ExtractionJob.document_id)
+        .filter(
+            Document.content_hash == content_hash,
+            ExtractionJob.document_id != job.document_id,
+            ExtractionJob.kind == "extract",
+            ExtractionJob.status.in_(ACTIVE_STATUSES),
+            ExtractionJob.id < job.id,
+        )
+        .order_by(ExtractionJob.id)
+        .first()
+    )
+
+
+def clone_extraction(source: DocumentExtraction, document_id: int) -> DocumentExtraction:
+    """추출 데이터를 다른 문서용으로 복사합니다 (extraction_method 등 메타데이터 포함)."""
+    values = {
+        column.name: getattr(source, column.name)
+        for column in DocumentExtraction.__table__.columns
+        if column.name not in _EXTRACTION_SKIP_COLUMNS
+    }
+    return DocumentExtraction(document_id=document_id, **values)
+
+
+def register_upload(db: Session, filename: str, blob: StoredBlob, file_ext: str) -> Document:
+    """
+    저장된 업로드 파일로 문서를 등록합니다.
+
+    - 같은 내용의 파일이 이미 추출되었다면 그 추출 데이터를 복사하고 바로 완료 처리합니다 (OCR 생략).
+    - 그 외 PDF/이미지는 추출 작업 큐에 등록합니다. 같은 파일이 아직 추출 중이면
+      워커가 그 작업이 끝날 때까지 기다렸다가 결과를 복사합니다 (extraction_worker.handle_extract).
+    """
+    duplicate = find_extracted_duplicate(db, blob.content_hash) if blob.existed else None
+
+    document = Document(
+        filename=filename,
+        filepath=blob.path,
+        file_size=blob.size,
+        content_hash=blob.content_hash,
+        upload_date=datetime.utcnow(),
+        status="completed" if duplicate else "uploaded",
+    )
+    db.add(document)
+    db.flush()
+
+    if duplicate:
+        db.add(clone_extraction(duplicate, document.id))
+        db.commit()
+        db.refresh(document)
+        print(f"[Upload] 문서 {document.id}: 동일한 파일(문서 {duplicate.document_id})의 추출 데이터 재사용")
+        return document
+
+    db.commit()
+    db.refresh(document)
+
+    # PDF 또는 이미지 파일인 경우 추출 작업 큐에 등록
+    if file_ext in OCR_EXTENSIONS:
+        job = JobQueue().enqueue(db, document.id)
+        print(f"[Upload] 문서 {document.id} OCR 작업 {job.id} 등록됨")
+
+    return document
@@ -1,9 +1,11 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from app.services.ocr_service import OCRService
-from app.services.structured_data_service import StructuredDataService
+from app.services.rule_extractor import RuleExtractionResult, extract_with_rules
+from app.services.structured_data_service import EXTRACTION_FIELDS, StructuredDataService
+from app.services.text_compaction import CompactionResult, compact_ocr_result
 from app.models.document import Document, DocumentExtraction
 
 
@@ -14,13 +16,73 @@ class ExtractionService:
         self.ocr_service = OCRService()
         self.structured_data_service = StructuredDataService()
 
-    def process_document(self, document_id: int, db: Session) -> DocumentExtraction:
+    def _build_extraction(
+        self,
+        document_id: int,
+        structured_data: Dict[str, Any],
+        extraction_method: str = "ocr+structured_extraction",
+    ) -> DocumentExtraction:
+        return DocumentExtraction(
+            document_id=document_id,
+            company_name=structured_data.get("company_name"),
+            business_number=structured_data.get("business_number"),
+            ceo_name=structured_data.get("ceo_name"),
+            establishment_date=structured_data.get("establishment_date"),
+            industry=structured_data.get("industry"),
+            address=structured_data.get("address"),
+            revenue=structured_data.get("revenue"),
+            operating_profit=structured_data.get("operating_profit"),
+            net_profit=structured_data.get("net_profit"),
+            total_assets=structured_data.get("total_assets"),
+            total_liabilities=structured_data.get("total_liabilities"),
+            equity=structured_data.get("equity"),
+            employee_count=structured_data.get("employee_count"),
+            main_products=structured_data.get("main_products"),
+            loan_purpose=structured_data.get("loan_purpose"),
+            loan_amount=structured_data.get("loan_amount"),
+            extracted_at=datetime.utcnow(),
+            extraction_method=extraction_method
+        )
+
+    def _apply_rules(self, document_id: int, text: str) -> Tuple[RuleExtractionResult, List[str]]:
+        """형식이 정해진 필드를 규칙으로 먼저 추출하고, LLM에 요청할 남은 필드를 반환합니다."""
+        rules = extract_with_rules(text)
+        missing = [name for name in EXTRACTION_FIELDS if name not in rules.data]
+        print(
+            f"[ExtractionService] 문서 {document_id} 규칙 추출: {len(rules.fields)}개 필드 "
+            f"({', '.join(rules.fields) or '없음'}), LLM 요청 필드 {len(missing)}개"
+        )
+        return rules, missing
+
+    def _merge(self, rules: RuleExtractionResult, llm_data: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """규칙 추출 값과 LLM 추출 값을 합치고, 필드별 출처를 extraction_method로 기록합니다."""
+        structured_data = {name: llm_data.get(name) for name in EXTRACTION_FIELDS}
+        structured_data.update(rules.data)
+
+        llm_fields = [name for name in EXTRACTION_FIELDS if name not in rules.data and llm_data.get(name) is not None]
+        method = "ocr"
+        if rules.fields:
+            method += f"+rules[{','.join(rules.fields)}]"
+        if llm_fields:
+            method += f"+llm[{','.join(llm_fields)}]"
+        return structured_data, method
+
+    def _log_compaction(self, document_id: int, compaction: CompactionResult) -> None:
+        print(
+            f"[ExtractionService] 문서 {document_id} 텍스트 압축: "
+            f"{compaction.original_tokens} -> {compaction.compacted_tokens} 토큰 (압축률 {compaction.ratio}), "
+            f"영역 {compaction.kept_regions}/{compaction.total_regions}, "
+            f"머리글/바닥글 {compaction.removed_header_footer_lines}줄 제거"
+        )
+
+    def process_document(self, document_id: int, db: Session, replace: bool = False) -> DocumentExtraction:
         """
         문서를 처리하여 데이터를 추출하고 DB에 저장합니다.
 
         Args:
             document_id: 처리할 문서 ID
             db: 데이터베이스 세션
+            replace: 기존 추출 데이터를 새 데이터로 교체 (재처리, 새 데이터가 준비된 뒤에 교체)
 
         Returns:
             DocumentExtraction: 추출된 데이터
@@ -40,7 +102,7 @@ class ExtractionService:
             DocumentExtraction.document_id == document_id
         ).first()
 
-        if existing:
+        if existing and not replace:
             raise ValueError("이미 추출된 데이터가 있습니다.")
 
         try:
@@ -50,47 +112,51 @@ class ExtractionService:
 
             # 1단계: OCR로 텍스트 추출
             print(f"[ExtractionService] 문서 {document_id} OCR 처리 시작...")
-            extracted_text = self.ocr_service.extract_text_from_file(document.filepath)
+            ocr_result = self.ocr_service.extract_from_file(document.filepath)
+            extracted_text = ocr_result.text
 
             if not extracted_text:
                 raise ValueError("문서에서 텍스트를 추출할 수 없습니다.")
 
             print(f"[ExtractionService] OCR 완료. 추출된 텍스트 길이: {len(extracted_text)} 문자")
-
-            # 2단계: 구조화된 데이터 추출
-            print(f"[ExtractionService] 구조화된 데이터 추출 시작...")
-            structured_data = self.structured_data_service.extract_document_data(
-                document_text=extracted_text,
-                document_type="기업 대출 신청서"
+            ocr_summary = ocr_result.summary()
+            print(
+                f"[ExtractionService] 페이지 처리 경로: 텍스트 레이어 {ocr_summary['text_layer_pages']}, "
+                f"OCR {ocr_summary['ocr_pages']} (캐시 {ocr_summary['cached_pages']}) / "
+                f"OCR 시간 {ocr_summary['ocr_seconds']}초, "
+                f"절약 추정 {ocr_summary['estimated_ocr_seconds_saved']}초"
             )
 
-            if not structured_data:
-                raise ValueError("LLM이 구조화된 데이터를 추출하지 못했습니다.")
-
-            print(f"[ExtractionService] 구조화된 데이터 추출 완료")
-
-            # 3단계: DB에 저장
-            extraction = DocumentExtraction(
-                document_id=document_id,
-                company_name=structured_data.get("company_name"),
-                business_number=structured_data.get("business_number"),
-                ceo_name=structured_data.get("ceo_name"),
-                establishment_date=structured_data.get("establishment_date"),
-                industry=structured_data.get("industry"),
-                address=structured_data.get("address"),
-                revenue=structured_data.get("revenue"),
-                operating_profit=structured_data.get("operating_profit"),
-                net_profit=structured_data.get("net_profit"),
-                total_assets=structured_data.get("total_assets"),
-                total_liabilities=structured_data.get("total_liabilities"),
-                equity=structured_data.get("equity"),
-                employee_count=structured_data.get("employee_count"),
-                main_products=structured_data.get("main_products"),
-                loan_purpose=structured_data.get("loan_purpose"),
-                loan_amount=structured_data.get("loan_amount"),
-                extracted_at=datetime.utcnow(),
-                extraction_method="ocr+structured_extraction"
-            )
+            # 2단계: 형식이 정해진 필드는 규칙으로 추출 (압축 전 전체 텍스트 사용)
+            rules, missing = self._apply_rules(document_id, extracted_text)
+
+            llm_data: Dict[str, Any] = {}
+            if missing:
+                # 3단계: 추출에 필요한 부분 위주로 텍스트를 압축한 뒤 남은 필드만 LLM으로 추출
+                compaction = compact_ocr_result(ocr_result)
+                self._log_compaction(document_id, compaction)
+
+                print(f"[ExtractionService] 구조화된 데이터 추출 시작...")
+                llm_data = self.structured_data_service.extract_document_data(
+                    document_text=compaction.text,
+                    document_type="기업 대출 신청서",
+                    fields=missing,
+                )
+
+                if not llm_data:
+                    raise ValueError("LLM이 구조화된 데이터를 추출하지 못했습니다.")
+            else:
+                print(f"[ExtractionService] 모든 필드를 규칙으로 추출하여 LLM 호출 생략")
+
+            structured_data, extraction_method = self._merge(rules, llm_data)
+            print(f"[ExtractionService] 구조화된 데이터 추출 완료 ({extraction_method})")
+
+            # 4단계: DB에 저장 (재처리이면 기존 데이터를 같은 트랜잭션에서 교체)
+            if replace:
+                db.query(DocumentExtraction).filter(
+                    DocumentExtraction.document_id == document_id
+                ).delete(synchronize_session=False)
+            extraction = self._build_extraction(document_id, structured_data, extraction_method)
 
             db.add(extraction)
 
@@ -125,6 +191,7 @@ class ExtractionService:
     def reprocess_document(self, document_id: int, db: Session) -> DocumentExtraction:
         """
         이미 처리된 문서를 다시 처리합니다.
+        기존 추출 데이터는 재추출이 성공한 뒤에 교체하므로, 실패해도 이전 데이터가 남습니다.
 
         Args:
             document_id: 재처리할 문서 ID
@@ -133,15 +200,68 @@ class ExtractionService:
         Returns:
             DocumentExtraction: 재추출된 데이터
         """
+        return self.process_document(document_id, db, replace=True)
 
-        # 기존 추출 데이터 삭제
-        existing = db.query(DocumentExtraction).filter(
-            DocumentExtraction.document_id == document_id
-        ).first()
+    def reprocess_documents(self, document_ids: List[int], db: Session) -> Dict[int, str]:
+        """
+        여러 문서를 다시 처리합니다. OCR은 문서별로 수행하고, 구조화 추출은 여러 문서를 묶어
+        LLM 요청 수를 줄입니다 (StructuredDataService.extract_documents_batch).
+        기존 추출 데이터는 새 데이터가 준비된 뒤에 교체합니다.
 
-        if existing:
-            db.delete(existing)
+        Returns:
+            Dict[int, str]: 실패한 문서 ID -> 오류 메시지 (모두 성공하면 빈 dict)
+        """
+        errors: Dict[int, str] = {}
+        texts: Dict[str, str] = {}
+        fields: Dict[str, List[str]] = {}
+        rule_results: Dict[int, RuleExtractionResult] = {}
+
+        documents = db.query(Document).filter(Document.id.in_(document_ids)).all()
+        documents_by_id = {document.id: document for document in documents}
+        for document_id in document_ids:
+            if document_id not in documents_by_id:
+                errors[document_id] = f"문서를 찾을 수 없습니다 (ID: {document_id})"
+
+        # 1단계: 문서별 OCR과 규칙 추출. 남은 필드가 있는 문서만 압축 텍스트를 LLM 요청에 포함
+        for document in documents:
+            document.status = "processing"
             db.commit()
-
-        # 다시 처리
-        return self.process_document(document_id, db)
+            try:
+                ocr_result = self.ocr_service.extract_from_file(document.filepath)
+                if not ocr_result.text:
+                    raise ValueError("문서에서 텍스트를 추출할 수 없습니다.")
+                rule_results[document.id], missing = self._apply_rules(document.id, ocr_result.text)
+                if missing:
+                    compaction = compact_ocr_result(ocr_result)
+                    self._log_compaction(document.id, compaction)
+                    texts[str(document.id)] = compaction.text
+                    fields[str(document.id)] = missing
+            except Exception as e:
+                errors[document.id] = f"텍스트 추출 실패: {str(e)}"
+
+        # 2단계: 여러 문서를 묶어 남은 필드를 구조화 추출
+        outcome = self.structured_data_service.extract_documents_batch(
+            texts, document_type="기업 대출 신청서", fields=fields
+        )
+        print(f"[ExtractionService] {len(texts)}개 문서 구조화 추출: LLM 요청 {outcome.requests}회")
+
+        for key, error in outcome.errors.items():
+            errors[int(key)] = error
+
+        # 3단계: 기존 추출 데이터를 새 데이터로 교체
+        for document_id, rules in rule_results.items():
+            if document_id in errors:
+                continue
+            structured_data, extraction_method = self._merge(rules, outcome.results.get(str(document_id), {}))
+            db.query(DocumentExtraction).filter(
+                DocumentExtraction.document_id == document_id
+            ).delete(synchronize_session=False)
+            db.add(self._build_extraction(document_id, structured_data, extraction_method))
+            documents_by_id[document_id].status = "completed"
+
+        for document_id in errors:
+            if document_id in documents_by_id:
+                documents_by_id[document_id].status = "failed"
+
+        db.commit()
+        return errors
@@ -0,0 +1,261 @@
+import os
+import socket
+import threading
+import traceback
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.document import Document, DocumentExtraction
+from app.models.job import ExtractionJob
+from app.services.document_ingest import clone_extraction, find_extracted_duplicate, find_inflight_duplicate
+from app.services.extraction_service import ExtractionService
+from app.services.job_queue import JobQueue
+
+
+# 워커 설정
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "2"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "2"))
+# 일괄 재처리 작업을 한 번에 가져와 구조화 추출 LLM 요청을 묶을 문서 수 (1이면 문서별 처리)
+REPROCESS_GROUP_SIZE = int(os.getenv("REPROCESS_GROUP_SIZE", "4"))
+# 같은 파일의 다른 문서가 추출 중일 때 결과를 다시 확인하는 간격 (초)
+DUPLICATE_WAIT_SECONDS = float(os.getenv("DUPLICATE_WAIT_SECONDS", "5"))
+
+
+class PermanentJobError(Exception):
+    """재시도해도 성공할 수 없는 작업 오류 (예: 문서가 삭제됨)"""
+
+
+class JobDeferred(Exception):
+    """다른 작업의 결과를 기다려야 하는 작업 (실패로 세지 않고 잠시 뒤 다시 실행)"""
+
+
+def handle_extract(job: ExtractionJob, db: Session) -> None:
+    """업로드된 문서의 OCR + 구조화 데이터 추출"""
+    document = db.query(Document).filter(Document.id == job.document_id).first()
+    if not document:
+        raise PermanentJobError(f"문서를 찾을 수 없습니다 (ID: {job.document_id})")
+
+    # 이전 시도가 추출을 저장한 직후 워커가 죽은 경우 이미 완료된 것으로 처리
+    existing = db.query(DocumentExtraction).filter(
+        DocumentExtraction.document_id == job.document_id
+    ).first()
+    if existing:
+        return
+
+    # 같은 파일이 다른 문서로 먼저 올라왔다면 OCR을 다시 하지 않고 그 결과를 사용
+    if document.content_hash:
+        duplicate = find_extracted_duplicate(db, document.content_hash)
+        if duplicate:
+            db.add(clone_extraction(duplicate, document.id))
+            document.status = "completed"
+            db.commit()
+            print(f"[Worker] 문서 {document.id}: 동일한 파일(문서 {duplicate.document_id})의 추출 데이터 재사용")
+            return
+
+        original = find_inflight_duplicate(db, document.content_hash, job)
+        if original:
+            raise JobDeferred(f"동일한 파일(문서 {original.document_id})의 추출 작업 {original.id} 완료 대기 중")
+
+    ExtractionService().process_document(job.document_id, db)
+
+
+def handle_reprocess(job: ExtractionJob, db: Session) -> None:
+    """기존 추출 데이터를 지우고 다시 추출 (OCR 설정이나 프롬프트 변경 후 일괄 재처리)"""
+    document = db.query(Document).filter(Document.id == job.document_id).first()
+    if not document:
+        raise PermanentJobError(f"문서를 찾을 수 없습니다 (ID: {job.document_id})")
+
+    if _already_reprocessed(job, db):
+        return
+
+    ExtractionService().reprocess_document(job.document_id, db)
+
+
+def _already_reprocessed(job: ExtractionJob, db: Session) -> bool:
+    """이전 시도가 재추출을 저장한 직후 워커가 죽은 경우 이미 완료된 것으로 처리"""
+    if job.attempts <= 1:
+        return False
+    existing = db.query(DocumentExtraction).filter(
+        DocumentExtraction.document_id == job.document_id
+    ).first()
+    return bool(existing and existing.extracted_at and existing.extracted_at >= job.created_at)
+
+
+# 작업 종류별 처리 함수
+JOB_HANDLERS: Dict[str, Callable[[ExtractionJob, Session], None]] = {
+    "extract": handle_extract,
+    "reprocess": handle_reprocess,
+}
+
+
+class _Heartbeat(threading.Thread):
+    """작업이 실행되는 동안 주기적으로 잠금(visibility timeout)을 연장합니다."""
+
+    def __init__(self, queue: JobQueue, job_id: int, worker_id: str):
+        super().__init__(daemon=True)
+        self.queue = queue
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = queue.heartbeat_interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            db = SessionLocal()
+            try:
+                if not self.queue.heartbeat(db, self.job_id, self.worker_id):
+                    print(f"[Worker {self.worker_id}] 작업 {self.job_id}의 잠금을 잃었습니다.")
+                    return
+            except Exception as e:
+                print(f"[Worker {self.worker_id}] heartbeat 실패: {str(e)}")
+            finally:
+                db.close()
+
+    def stop(self):
+        self._stopped.set()
+
+
+class ExtractionWorker:
+    """작업 큐에서 작업을 하나씩 가져와 처리하는 워커"""
+
+    def __init__(
+        self,
+        worker_id: str,
+        queue: Optional[JobQueue] = None,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        batch_id: Optional[int] = None,
+    ):
+        self.worker_id = worker_id
+        self.queue = queue or JobQueue()
+        self.poll_interval = poll_interval
+        self.batch_id = batch_id  # 지정하면 해당 일괄 작업의 작업만 처리
+
+    def run_once(self) -> bool:
+        """
+        작업 하나를 처리합니다.
+
+        Returns:
+            bool: 처리한 작업이 있으면 True, 큐가 비어 있으면 False
+        """
+        db = SessionLocal()
+        try:
+            self.queue.fail_expired(db)
+
+            job = self.queue.claim(db, self.worker_id, batch_id=self.batch_id)
+            if not job:
+                return False
+
+            print(f"[Worker {self.worker_id}] 작업 {job.id} ({job.kind}, 문서 {job.document_id}) 시작 - 시도 {job.attempts}/{job.max_attempts}")
+
+            if job.kind == "reprocess" and job.batch_id is not None and REPROCESS_GROUP_SIZE > 1:
+                self._run_reprocess_group(job, db)
+                return True
+
+            heartbeat = _Heartbeat(self.queue, job.id, self.worker_id)
+            heartbeat.start()
+            try:
+                handler = JOB_HANDLERS.get(job.kind)
+                if handler is None:
+                    raise PermanentJobError(f"알 수 없는 작업 종류입니다: {job.kind}")
+                handler(job, db)
+            except JobDeferred as e:
+                db.rollback()
+                self.queue.defer(db, job, DUPLICATE_WAIT_SECONDS, str(e))
+                print(f"[Worker {self.worker_id}] 작업 {job.id} 보류: {str(e)}")
+            except PermanentJobError as e:
+                db.rollback()
+                self.queue.fail(db, job, str(e), retry=False)
+            except Exception as e:
+                db.rollback()
+                traceback.print_exc()
+                self.queue.fail(db, job, str(e))
+            else:
+                self.queue.complete(db, job)
+                print(f"[Worker {self.worker_id}] 작업 {job.id} 완료")
+            finally:
+                heartbeat.stop()
+
+            return True
+        finally:
+            db.close()
+
+    def _run_reprocess_group(self, first_job: ExtractionJob, db: Session) -> None:
+        """
+        같은 일괄 작업의 재처리 작업을 최대 REPROCESS_GROUP_SIZE개까지 함께 가져와
+        구조화 추출을 한 번의 LLM 요청으로 묶어 처리합니다. 결과는 작업별로 완료/실패 처리합니다.
+        """
+        jobs = [first_job]
+        while len(jobs) < REPROCESS_GROUP_SIZE:
+            job = self.queue.claim(db, self.worker_id, batch_id=first_job.batch_id, kind="reprocess")
+            if not job:
+                break
+            jobs.append(job)
+
+        heartbeats = [_Heartbeat(self.queue, job.id, self.worker_id) for job in jobs]
+        for heartbeat in heartbeats:
+            heartbeat.start()
+        try:
+            pending = []
+            for job in jobs:
+                if _already_reprocessed(job, db):
+                    self.queue.complete(db, job)
+                else:
+                    pending.append(job)
+
+            try:
+                errors = ExtractionService().reprocess_documents([job.document_id for job in pending], db)
+            except Exception as e:
+                db.rollback()
+                traceback.print_exc()
+                for job in pending:
+                    self.queue.fail(db, job, str(e))
+                return
+
+            for job in pending:
+                error = errors.get(job.document_id)
+                if error is None:
+                    self.queue.complete(db, job)
+                else:
+                    document_exists = db.query(Document.id).filter(Document.id == job.document_id).first()
+                    self.queue.fail(db, job, error, retry=bool(document_exists))
+
+            print(f"[Worker {self.worker_id}] 재처리 작업 {len(jobs)}개 완료 (실패 {len(errors)}개)")
+        finally:
+            for heartbeat in heartbeats:
+                heartbeat.stop()
+
+    def run_forever(self, stop_event: threading.Event) -> None:
+        print(f"[Worker {self.worker_id}] 시작")
+        while not stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                print(f"[Worker {self.worker_id}] 작업 처리 중 오류: {str(e)}")
+                processed = False
+            if not processed:
+                stop_event.wait(self.poll_interval)
+        print(f"[Worker {self.worker_id}] 종료")
+
+
+def start_workers(
+    concurrency: int = WORKER_CONCURRENCY,
+    stop_event: Optional[threading.Event] = None,
+    batch_id: Optional[int] = None,
+) -> list:
+    """
+    워커 스레드를 시작합니다. OCR은 프로세스 풀에서 병렬로 처리되므로,
+    워커는 작업 단위 동시성(주로 LLM 대기 시간)만 담당합니다.
+    """
+    stop_event = stop_event or threading.Event()
+    prefix = f"{socket.gethostname()}-{os.getpid()}"
+    threads = []
+    for i in range(concurrency):
+        worker = ExtractionWorker(worker_id=f"{prefix}-{i}", batch_id=batch_id)
+        thread = threading.Thread(
+            target=worker.run_forever, args=(stop_event,), name=f"extraction-worker-{i}", daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+    return threads
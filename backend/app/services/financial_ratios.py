@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.models.document import DocumentExtraction
+
+
+@dataclass(frozen=True)
+class RatioDefinition:
+    name: str
+    label: str
+    numerator: str  # DocumentExtraction 컬럼
+    denominator: str  # DocumentExtraction 컬럼 (0 이하이면 계산하지 않음)
+    lower_is_better: bool = False
+
+
+RATIO_DEFINITIONS: List[RatioDefinition] = [
+    RatioDefinition("debt_ratio", "부채비율", "total_liabilities", "equity", lower_is_better=True),
+    RatioDefinition("equity_ratio", "자기자본비율", "equity", "total_assets"),
+    RatioDefinition("operating_margin", "영업이익률", "operating_profit", "revenue"),
+    RatioDefinition("net_margin", "순이익률", "net_profit", "revenue"),
+    RatioDefinition("roe", "자기자본이익률(ROE)", "net_profit", "equity"),
+    RatioDefinition("roa", "총자산이익률(ROA)", "net_profit", "total_assets"),
+]
+RATIO_NAMES = [definition.name for definition in RATIO_DEFINITIONS]
+
+# 산업 지식에 없는 산업의 비교 기준 (전산업 평균 근사치, %)
+DEFAULT_AVERAGES: Dict[str, float] = {
+    "debt_ratio": 110.0,
+    "equity_ratio": 47.0,
+    "operating_margin": 5.0,
+    "net_margin": 4.0,
+    "roe": 7.0,
+    "roa": 3.3,
+}
+
+# 낮을수록 좋은 비율: 평균의 이 배수를 넘으면 danger
+LOWER_IS_BETTER_DANGER_MULTIPLE = 1.5
+
+_COLUMNS = sorted({d.numerator for d in RATIO_DEFINITIONS} | {d.denominator for d in RATIO_DEFINITIONS})
+_LOWER_IS_BETTER_MASK = np.array([d.lower_is_better for d in RATIO_DEFINITIONS])
+
+
+def _column_arrays(extractions: Sequence[DocumentExtraction]) -> Dict[str, np.ndarray]:
+    """추출 데이터의 재무 컬럼을 float 배열로 변환합니다 (값이 없으면 NaN)."""
+    return {
+        column: np.array(
+            [getattr(e, column) if getattr(e, column) is not None else np.nan for e in extractions],
+            dtype=float,
+        )
+        for column in _COLUMNS
+    }
+
+
+def compute_ratio_matrix(extractions: Sequence[DocumentExtraction]) -> np.ndarray:
+    """
+    여러 문서의 재무 비율(%)을 한 번에 계산합니다.
+
+    Returns:
+        np.ndarray: (문서 수, len(RATIO_DEFINITIONS)) 배열. 계산할 수 없는 값은 NaN,
+            자본잠식 상태의 부채비율은 inf
+    """
+    columns = _column_arrays(extractions)
+    matrix = np.full((len(extractions), len(RATIO_DEFINITIONS)), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, definition in enumerate(RATIO_DEFINITIONS):
+            numerator = columns[definition.numerator]
+            denominator = columns[definition.denominator]
+            # 분모가 0 이하(예: 자본잠식, 매출 없음)이면 비율이 의미가 없으므로 계산하지 않음
+            matrix[:, i] = np.where(denominator > 0, numerator / denominator * 100, np.nan)
+            if definition.lower_is_better:
+                # 자본잠식 상태의 부채비율은 무한대로 보고 위험으로 분류 (응답에서는 값 없음)
+                matrix[:, i] = np.where((denominator <= 0) & (numerator > 0), np.inf, matrix[:, i])
+
+    return np.round(matrix, 1)
+
+
+def classify_ratio_matrix(values: np.ndarray, averages: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    재무 비율을 비교 기준(업종 평균)과 비교하여 상태와 달성도를 계산합니다.
+
+    - 높을수록 좋은 비율: 평균 이상 good, 0 이상 warning, 음수 danger
+    - 낮을수록 좋은 비율: 평균 이하 good, 평균의 1.5배 이하 warning, 초과 danger
+    - percentage: 평균 대비 달성도 (0~100, 평균 이상 성과이면 100)
+
+    Args:
+        values: (문서 수, 비율 수) 배열
+        averages: (비율 수,) 또는 (문서 수, 비율 수) 배열. 기준이 없으면 NaN
+
+    Returns:
+        dict: status (문자열 배열, 값이나 기준이 없으면 warning), percentage (실수 배열, 없으면 NaN)
+    """
+    values = np.asarray(values, dtype=float)
+    averages = np.broadcast_to(np.asarray(averages, dtype=float), values.shape)
+    lower = np.broadcast_to(_LOWER_IS_BETTER_MASK[: values.shape[1]], values.shape)
+    available = ~np.isnan(values) & ~np.isnan(averages) & (averages != 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        good = np.where(lower, values <= averages, values >= averages)
+        danger = np.where(lower, values > averages * LOWER_IS_BETTER_DANGER_MULTIPLE, values < 0)
+        percentage = np.where(
+            lower,
+            np.where(values <= 0, 100.0, averages / values * 100),
+            values / averages * 100,
+        )
+
+    status = np.where(good, "good", np.where(danger, "danger", "warning"))
+    status = np.where(available, status, "warning")
+    percentage = np.where(available, np.round(np.clip(percentage, 0.0, 100.0), 1), np.nan)
+
+    return {"status": status, "percentage": percentage}
+
+
+def _to_optional(value: float) -> Optional[float]:
+    return float(value) if np.isfinite(value) else None
+
+
+def compute_ratios(extraction: DocumentExtraction) -> Dict[str, Optional[float]]:
+    """문서 하나의 재무 비율(%). 계산할 수 없는 비율은 None."""
+    row = compute_ratio_matrix([extraction])[0]
+    return {name: _to_optional(value) for name, value in zip(RATIO_NAMES, row)}
+
+
+def _averages_vector(averages: Optional[Dict[str, float]]) -> np.ndarray:
+    averages = averages or DEFAULT_AVERAGES
+    return np.array([averages.get(name, np.nan) for name in RATIO_NAMES], dtype=float)
+
+
+def build_financial_ratios_batch(
+    extractions: Sequence[DocumentExtraction],
+    averages: Optional[Sequence[Optional[Dict[str, float]]]] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    여러 문서의 재무 비율 분석 결과(FinancialRatio 형태)를 한 번에 계산합니다.
+
+    Args:
+        extractions: 추출 데이터 목록
+        averages: 문서별 업종 평균 (None이면 전산업 평균 DEFAULT_AVERAGES 사용)
+    """
+    if not extractions:
+        return []
+
+    values = compute_ratio_matrix(extractions)
+    averages = averages or [None] * len(extractions)
+    average_matrix = np.vstack([_averages_vector(a) for a in averages])
+    classified = classify_ratio_matrix(values, average_matrix)
+
+    results = []
+    for row in range(len(extractions)):
+        results.append([
+            {
+                "name": definition.label,
+                "value": _to_optional(values[row, col]),
+                "industry_average": _to_optional(average_matrix[row, col]),
+                "status": str(classified["status"][row, col]),
+                "percentage": _to_optional(classified["percentage"][row, col]),
+            }
+            for col, definition in enumerate(RATIO_DEFINITIONS)
+            if not np.isnan(average_matrix[row, col])
+        ])
+    return results
+
+
+def build_financial_ratios(
+    extraction: DocumentExtraction,
+    averages: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """문서 하나의 재무 비율 분석 결과 (FinancialRatio 형태의 dict 목록)"""
+    return build_financial_ratios_batch([extraction], [averages])[0]
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.models.document import DocumentExtraction
+from app.services.financial_ratios import build_financial_ratios, compute_ratios
+from app.services.suggestion_cache import normalize_industry
+
+
+# 산업 지식 파일 위치 (기본값: 저장소 루트의 data/industry_knowledge)
+INDUSTRY_KNOWLEDGE_DIR = os.getenv(
+    "INDUSTRY_KNOWLEDGE_DIR",
+    str(Path(__file__).resolve().parents[3] / "data" / "industry_knowledge"),
+)
+
+# 부분 일치에 사용할 별칭의 최소 단어 수. "자동차", "유통" 같은 단일 일반 명사는 정확히 일치할 때만 사용
+# (예: "자동차 판매업"이 자동차 부품 제조업으로 분류되는 오매칭 방지)
+MIN_PARTIAL_ALIAS_TOKENS = 2
+
+_KSIC_CODE_PATTERN = re.compile(r"^[a-z]\d{2,5}$")
+
+# 위험 점수 (고위험 2점, 중위험 1점) 구간별 종합 등급
+GRADE_THRESHOLDS = [
+    (0, "A등급 (5등급 중 1등급)"),
+    (2, "B등급 (5등급 중 2등급)"),
+    (4, "C등급 (5등급 중 3등급)"),
+    (6, "D등급 (5등급 중 4등급)"),
+]
+LOWEST_GRADE = "E등급 (5등급 중 5등급)"
+
+
+@dataclass
+class IndustryKnowledge:
+    """data/industry_knowledge/*.json 파일 하나에 해당하는 산업 지식"""
+
+    code: str
+    name: str
+    ksic: List[str] = field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
+    ai_reason: str = ""
+    industry_outlook: str = ""
+    insights: List[Dict[str, Any]] = field(default_factory=list)
+    suggested_fields: List[Dict[str, Any]] = field(default_factory=list)
+    average_ratios: Dict[str, float] = field(default_factory=dict)
+    risk_factor_templates: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndustryKnowledge":
+        return cls(
+            code=data["code"],
+            name=data["name"],
+            ksic=data.get("ksic", []),
+            aliases=data.get("aliases", []),
+            ai_reason=data.get("ai_reason", ""),
+            industry_outlook=data.get("industry_outlook", ""),
+            insights=data.get("insights", []),
+            suggested_fields=data.get("suggested_fields", []),
+            average_ratios=data.get("average_ratios", {}),
+            risk_factor_templates=data.get("risk_factor_templates", []),
+        )
+
+    def suggestion_payload(self) -> Dict[str, Any]:
+        """AdditionalInfoSuggestion의 산업 단위 항목"""
+        return {
+            "ai_reason": self.ai_reason or f"{self.name}의 경우, 추가 정보 수집이 필요합니다.",
+            "industry_outlook": self.industry_outlook,
+            "insights": self.insights,
+            "suggested_fields": self.suggested_fields,
+        }
+
+
+@dataclass
+class IndustryMatch:
+    knowledge: IndustryKnowledge
+    matched_alias: str
+    exact: bool
+
+    @property
+    def confidence(self) -> float:
+        return 0.95 if self.exact else 0.8
+
+
+class IndustryKnowledgeStore:
+    """
+    산업 지식을 메모리에 올려 두고 산업 코드와 별칭으로 조회합니다.
+    정규화한 산업명이 코드/산업명/별칭과 정확히 일치하거나 KSIC 코드(하위 분류 포함)이면 바로 찾고,
+    아니면 산업명에 포함된 두 단어 이상의 구체적인 별칭으로 찾습니다. (예: "자동차 시트 부품 제조업" -> "자동차 부품 제조업")
+    여러 산업의 별칭이 함께 포함되거나 일치하는 별칭이 없으면 None을 반환해 LLM으로 분석하게 합니다.
+    """
+
+    def __init__(self, industries: Optional[List[IndustryKnowledge]] = None):
+        self._by_code: Dict[str, IndustryKnowledge] = {}
+        self._by_alias: Dict[str, IndustryKnowledge] = {}
+        self._by_ksic: Dict[str, IndustryKnowledge] = {}
+        # 정규화한 별칭 -> 단어 목록
+        self._alias_tokens: Dict[str, List[str]] = {}
+        # 로드한 파일 내용의 지문 (파일이 바뀌면 저장된 위험 분석 결과를 무효화하는 데 사용)
+        self._hasher = hashlib.sha256()
+        for industry in industries or []:
+            self.add(industry)
+
+    @classmethod
+    def load(cls, directory: str = INDUSTRY_KNOWLEDGE_DIR) -> "IndustryKnowledgeStore":
+        store = cls()
+        path = Path(directory)
+        if not path.is_dir():
+            print(f"[IndustryKnowledge] 디렉토리를 찾을 수 없습니다: {directory}")
+            return store
+
+        for file_path in sorted(path.glob("*.json")):
+            try:
+                raw = file_path.read_bytes()
+                store.add(IndustryKnowledge.from_dict(json.loads(raw.decode("utf-8"))))
+                store._hasher.update(raw)
+            except Exception as e:
+                print(f"[IndustryKnowledge] {file_path.name} 로드 실패: {str(e)}")
+
+        print(f"[IndustryKnowledge] {len(store._by_code)}개 산업, {len(store._by_alias)}개 별칭 로드: {directory}")
+        return store
+
+    def add(self, industry: IndustryKnowledge) -> None:
+        self._by_code[industry.code.upper()] = industry
+        for code in industry.ksic:
+            self._by_ksic.setdefault(normalize_industry(code), industry)
+        for alias in [industry.code, industry.name, *industry.aliases]:
+            key = normalize_industry(alias)
+            if not key:
+                continue
+            self._by_alias.setdefault(key, industry)
+            self._alias_tokens.setdefault(key, _tokens(alias))
+
+    @property
+    def signature(self) -> str:
+        return self._hasher.hexdigest()[:16]
+
+    def get(self, code: str) -> Optional[IndustryKnowledge]:
+        return self._by_code.get(code.upper())
+
+    def match(self, industry: Optional[str]) -> Optional[IndustryMatch]:
+        key = normalize_industry(industry)
+        if not key:
+            return None
+
+        knowledge = self._by_alias.get(key) or self._match_ksic(key)
+        if knowledge:
+            return IndustryMatch(knowledge=knowledge, matched_alias=key, exact=True)
+
+        tokens = _tokens(industry)
+        specific = []
+        candidates = set()
+        for alias, alias_tokens in self._alias_tokens.items():
+            if len(alias_tokens) >= MIN_PARTIAL_ALIAS_TOKENS and (alias in key or _contains_in_order(tokens, alias_tokens)):
+                specific.append(alias)
+            elif not _contains_in_order(tokens, alias_tokens):
+                continue
+            candidates.add(self._by_alias[alias].code)
+
+        # 구체적인 별칭이 없거나 다른 산업의 별칭도 들어 있으면 (예: "자동차 부품 도매업") LLM이 판단
+        if not specific or len(candidates) != 1:
+            return None
+        alias = max(specific, key=len)
+        return IndustryMatch(knowledge=self._by_alias[alias], matched_alias=alias, exact=False)
+
+    def _match_ksic(self, key: str) -> Optional[IndustryKnowledge]:
+        """KSIC 코드는 등록된 코드이거나 그 하위 분류이면 일치로 봅니다. (예: "C3012" -> "C301")"""
+        if not _KSIC_CODE_PATTERN.match(key):
+            return None
+        for length in range(len(key), 1, -1):
+            knowledge = self._by_ksic.get(key[:length])
+            if knowledge:
+                return knowledge
+        return None
+
+    def industries(self) -> List[IndustryKnowledge]:
+        return list(self._by_code.values())
+
+
+def _tokens(text: str) -> List[str]:
+    return [token for token in (normalize_industry(part) for part in text.split()) if token]
+
+
+def _contains_in_order(tokens: List[str], alias_tokens: List[str]) -> bool:
+    """별칭의 단어가 산업명에 순서대로 들어 있는지 확인합니다. (예: "자동차 시트 부품" ⊃ "자동차 부품")"""
+    remaining = iter(tokens)
+    return all(token in remaining for token in alias_tokens)
+
+
+_store: Optional[IndustryKnowledgeStore] = None
+_store_lock = threading.Lock()
+
+
+def get_industry_knowledge() -> IndustryKnowledgeStore:
+    """프로세스 전체에서 공유하는 산업 지식 저장소. 처음 호출될 때(서버 시작 시) 한 번만 로드됩니다."""
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = IndustryKnowledgeStore.load()
+        return _store
+
+
+def _condition_matches(condition: Optional[Dict[str, Any]], ratios: Dict[str, Optional[float]]) -> bool:
+    if not condition:
+        return True
+
+    value = ratios.get(condition["metric"])
+    if value is None:
+        return False
+
+    op, threshold = condition["op"], condition["value"]
+    if op == ">":
+        return value > threshold
+    if op == ">=":
+        return value >= threshold
+    if op == "<":
+        return value < threshold
+    if op == "<=":
+        return value <= threshold
+    if op == "between":
+        return threshold[0] <= value < threshold[1]
+    raise ValueError(f"알 수 없는 조건 연산자입니다: {op}")
+
+
+class _FormatValues(dict):
+    def __missing__(self, key):
+        return "N/A"
+
+
+def _grade(risk_factors: List[Dict[str, Any]]) -> str:
+    score = sum(2 if f["level"] == "high" else 1 if f["level"] == "medium" else 0 for f in risk_factors)
+    for max_score, grade in GRADE_THRESHOLDS:
+        if score <= max_score:
+            return grade
+    return LOWEST_GRADE
+
+
+def build_local_risk_analysis(extraction: DocumentExtraction, match: IndustryMatch) -> Dict[str, Any]:
+    """
+    산업 지식의 업종 평균과 위험 요인 템플릿으로 위험 분석 결과를 만듭니다 (LLM 호출 없음).
+    반환값은 RiskAnalysisResponse와 같은 형태의 dict입니다.
+    """
+    knowledge = match.knowledge
+    ratios = compute_ratios(extraction)
+
+    values = _FormatValues()
+    for name, value in ratios.items():
+        if value is not None:
+            values[name] = f"{value:.1f}%"
+    for name, average in knowledge.average_ratios.items():
+        values[f"avg_{name}"] = f"{average:.1f}%"
+
+    risk_factors = []
+    if extraction.equity is not None and extraction.equity <= 0:
+        risk_factors.append({
+            "level": "high",
+            "title": "자본잠식",
+            "description": "자본총계가 0 이하로 완전 자본잠식 상태입니다. 부채비율 등 자본 기준 비율을 산출할 수 없습니다.",
+            "metrics": [f"자본 {extraction.equity:,.0f}"],
+            "recommendation": "증자 등 자본 확충 계획과 보증·담보 보강 여부를 확인해야 합니다.",
+        })
+
+    for template in knowledge.risk_factor_templates:
+        if not _condition_matches(template.get("when"), ratios):
+            continue
+        recommendation = template.get("recommendation")
+        risk_factors.append({
+            "level": template["level"],
+            "title": template["title"],
+            "description": template["description"].format_map(values),
+            "metrics": [metric.format_map(values) for metric in template.get("metrics", [])],
+            "recommendation": recommendation.format_map(values) if recommendation else None,
+        })
+
+    financial_ratios = build_financial_ratios(extraction, knowledge.average_ratios)
+
+    recommendations = [
+        f["recommendation"] for f in risk_factors
+        if f["level"] in ("high", "medium") and f["recommendation"]
+    ]
+    improvement_plan = " ".join(recommendations) or "현재 재무 상태를 유지하며 정기적으로 재무 현황을 점검하면 됩니다."
+
+    return {
+        "industry_classification": {
+            "code": knowledge.code,
+            "name": knowledge.name,
+            "confidence": match.confidence,
+            "reasons": [
+                f"추출된 산업 정보 '{extraction.industry}'이(가) 산업 지식의 '{match.matched_alias}'와 "
+                + ("일치합니다." if match.exact else "부분 일치합니다."),
+                f"{knowledge.name} 업종 평균 재무 비율과 위험 요인 기준으로 분석했습니다.",
+            ],
+            "alternatives": [
+                {"code": other.code, "name": other.name}
+                for other in get_industry_knowledge().industries()
+                if other.code != knowledge.code
+            ],
+        },
+        "risk_factors": risk_factors,
+        "financial_ratios": financial_ratios,
+        "overall_grade": _grade(risk_factors),
+        "improvement_plan": improvement_plan,
+    }
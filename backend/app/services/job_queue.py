@@ -0,0 +1,308 @@
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.job import ExtractionJob
+
+
+# 작업 큐 설정
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "30"))
+JOB_RETRY_MAX_SECONDS = float(os.getenv("JOB_RETRY_MAX_SECONDS", "3600"))
+# 워커가 작업을 가져간 뒤 이 시간 안에 완료하거나 연장하지 않으면 다른 워커가 다시 가져감
+JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "600"))
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# enqueue_many에서 한 번에 조회할 문서 ID 수 (SQLite 바인드 변수 제한)
+ENQUEUE_CHUNK_SIZE = 500
+
+
+class JobQueue:
+    """
+    DB에 저장되는 문서 추출 작업 큐.
+    API 프로세스가 재시작되어도 작업이 남아 있으며, 별도의 워커 프로세스(worker.py)가 처리합니다.
+
+    상태 전이:
+        queued -> running -> succeeded
+                          -> queued (재시도, 지수 백오프)
+                          -> queued (defer: 다른 작업 대기, 시도 횟수 유지)
+                          -> failed (재시도 횟수 초과)
+        running (locked_until 경과) -> running (다른 워커가 회수)
+    """
+
+    def __init__(self, visibility_timeout: float = JOB_VISIBILITY_TIMEOUT):
+        self.visibility_timeout = visibility_timeout
+
+    @property
+    def heartbeat_interval(self) -> float:
+        """실행 중인 작업의 잠금을 연장하는 간격 (visibility timeout의 1/3)"""
+        return max(1.0, self.visibility_timeout / 3)
+
+    def enqueue(
+        self,
+        db: Session,
+        document_id: int,
+        kind: str = "extract",
+        max_attempts: Optional[int] = None,
+    ) -> ExtractionJob:
+        """
+        문서 처리 작업을 큐에 추가합니다.
+        같은 문서에 대해 대기 중이거나 실행 중인 작업이 있으면 그 작업을 반환합니다.
+        """
+        existing = (
+            db.query(ExtractionJob)
+            .filter(
+                ExtractionJob.document_id == document_id,
+                ExtractionJob.kind == kind,
+                ExtractionJob.status.in_(ACTIVE_STATUSES),
+            )
+            .first()
+        )
+        if existing:
+            return existing
+
+        job = ExtractionJob(
+            document_id=document_id,
+            kind=kind,
+            status="queued",
+            max_attempts=max_attempts or JOB_MAX_ATTEMPTS,
+            available_at=datetime.utcnow(),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    def enqueue_many(
+        self,
+        db: Session,
+        document_ids: Sequence[int],
+        kind: str = "extract",
+        batch_id: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Tuple[List[int], List[int]]:
+        """
+        여러 문서의 작업을 한 번에 큐에 추가합니다 (커밋 한 번).
+        대기 중이거나 실행 중인 작업이 있는 문서는 동시에 처리되지 않도록 제외합니다.
+
+        Returns:
+            (추가된 문서 ID 목록, 제외된 문서 ID 목록)
+        """
+        active = set()
+        for start in range(0, len(document_ids), ENQUEUE_CHUNK_SIZE):
+            chunk = document_ids[start:start + ENQUEUE_CHUNK_SIZE]
+            rows = (
+                db.query(ExtractionJob.document_id)
+                .filter(
+                    ExtractionJob.document_id.in_(chunk),
+                    ExtractionJob.status.in_(ACTIVE_STATUSES),
+                )
+                .all()
+            )
+            active.update(document_id for (document_id,) in rows)
+
+        now = datetime.utcnow()
+        added, skipped = [], []
+        for document_id in document_ids:
+            if document_id in active:
+                skipped.append(document_id)
+                continue
+            db.add(ExtractionJob(
+                document_id=document_id,
+                batch_id=batch_id,
+                kind=kind,
+                status="queued",
+                max_attempts=max_attempts or JOB_MAX_ATTEMPTS,
+                available_at=now,
+            ))
+            added.append(document_id)
+
+        db.commit()
+        return added, skipped
+
+    def _claimable(self, now: datetime):
+        """가져갈 수 있는 작업 조건: 실행 가능한 대기 작업, 또는 잠금이 만료된 실행 중 작업"""
+        return or_(
+            and_(ExtractionJob.status == "queued", ExtractionJob.available_at <= now),
+            and_(
+                ExtractionJob.status == "running",
+                ExtractionJob.locked_until < now,
+                ExtractionJob.attempts < ExtractionJob.max_attempts,
+            ),
+        )
+
+    def claim(
+        self,
+        db: Session,
+        worker_id: str,
+        batch_id: Optional[int] = None,
+        kind: Optional[str] = None,
+    ) -> Optional[ExtractionJob]:
+        """
+        다음 작업 하나를 가져와 running 상태로 잠급니다.
+        조건부 UPDATE로 잠그므로 여러 워커가 동시에 호출해도 한 작업은 한 워커만 가져갑니다.
+        batch_id, kind를 지정하면 해당 일괄 작업/종류의 작업만 가져옵니다.
+        """
+        now = datetime.utcnow()
+        query = db.query(ExtractionJob.id).filter(self._claimable(now))
+        if batch_id is not None:
+            query = query.filter(ExtractionJob.batch_id == batch_id)
+        if kind is not None:
+            query = query.filter(ExtractionJob.kind == kind)
+        candidates = (
+            query
+            .order_by(ExtractionJob.available_at, ExtractionJob.id)
+            .limit(10)
+            .all()
+        )
+
+        for (job_id,) in candidates:
+            updated = (
+                db.query(ExtractionJob)
+                .filter(ExtractionJob.id == job_id, self._claimable(now))
+                .update(
+                    {
+                        ExtractionJob.status: "running",
+                        ExtractionJob.worker_id: worker_id,
+                        ExtractionJob.locked_until: now + timedelta(seconds=self.visibility_timeout),
+                        ExtractionJob.attempts: ExtractionJob.attempts + 1,
+                        ExtractionJob.updated_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if updated == 1:
+                return db.query(ExtractionJob).filter(ExtractionJob.id == job_id).first()
+
+        return None
+
+    def heartbeat(self, db: Session, job_id: int, worker_id: str) -> bool:
+        """실행 중인 작업의 잠금을 연장합니다. 다른 워커가 이미 회수했으면 False."""
+        now = datetime.utcnow()
+        updated = (
+            db.query(ExtractionJob)
+            .filter(
+                ExtractionJob.id == job_id,
+                ExtractionJob.status == "running",
+                ExtractionJob.worker_id == worker_id,
+            )
+            .update(
+                {ExtractionJob.locked_until: now + timedelta(seconds=self.visibility_timeout)},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return updated == 1
+
+    def complete(self, db: Session, job: ExtractionJob) -> None:
+        now = datetime.utcnow()
+        job.status = "succeeded"
+        job.locked_until = None
+        job.last_error = None
+        job.finished_at = now
+        db.commit()
+
+    def fail(self, db: Session, job: ExtractionJob, error: str, retry: bool = True) -> None:
+        """
+        작업 실패를 기록합니다. 재시도 횟수가 남아 있으면 지수 백오프 후 다시 대기시키고,
+        모두 소진했거나 retry=False이면 failed로 확정하고 문서 상태도 failed로 변경합니다.
+        """
+        now = datetime.utcnow()
+        job.last_error = error
+        job.locked_until = None
+
+        document = db.query(Document).filter(Document.id == job.document_id).first()
+
+        if retry and job.attempts < job.max_attempts:
+            delay = min(JOB_RETRY_BASE_SECONDS * (2 ** (job.attempts - 1)), JOB_RETRY_MAX_SECONDS)
+            job.status = "queued"
+            job.available_at = now + timedelta(seconds=delay)
+            # 재시도 대기 중에는 처리 중으로 표시 (프론트엔드가 계속 폴링하도록)
+            if document:
+                document.status = "processing"
+            print(
+                f"[JobQueue] 작업 {job.id} 실패 ({job.attempts}/{job.max_attempts}), "
+                f"{delay:.0f}초 후 재시도: {error}"
+            )
+        else:
+            job.status = "failed"
+            job.finished_at = now
+            if document:
+                document.status = "failed"
+            print(f"[JobQueue] 작업 {job.id} 최종 실패 ({job.attempts}회 시도): {error}")
+
+        db.commit()
+
+    def defer(self, db: Session, job: ExtractionJob, delay: float, reason: str) -> None:
+        """
+        작업을 실패로 세지 않고 delay초 뒤에 다시 대기시킵니다 (다른 작업의 결과를 기다리는 경우).
+        claim에서 늘린 시도 횟수를 되돌려 기다리는 동안 재시도 횟수를 소진하지 않습니다.
+        """
+        now = datetime.utcnow()
+        job.status = "queued"
+        job.attempts = max(job.attempts - 1, 0)
+        job.available_at = now + timedelta(seconds=delay)
+        job.locked_until = None
+        job.worker_id = None
+        job.last_error = reason
+
+        document = db.query(Document).filter(Document.id == job.document_id).first()
+        if document:
+            document.status = "processing"
+
+        db.commit()
+
+    def release_running(self, db: Session, batch_id: int) -> int:
+        """
+        일괄 작업의 실행 중 작업 중 heartbeat가 끊긴 작업의 잠금을 바로 만료시켜 다음 claim에서 다시 가져가게 합니다.
+        중단된 일괄 작업을 이어서 처리할 때 visibility timeout을 기다리지 않기 위해 사용합니다.
+        heartbeat 간격의 두 배 넘게 잠금이 연장되지 않은 작업만 대상이므로,
+        다른 워커(worker.py 등)가 처리 중인 작업은 그대로 둡니다.
+        """
+        now = datetime.utcnow()
+        # 잠금은 claim/heartbeat 시각 + visibility_timeout이므로, 마지막 연장 시각이 이보다 오래된 작업
+        stale_before = now + timedelta(seconds=self.visibility_timeout - 2 * self.heartbeat_interval)
+        released = (
+            db.query(ExtractionJob)
+            .filter(
+                ExtractionJob.batch_id == batch_id,
+                ExtractionJob.status == "running",
+                ExtractionJob.locked_until < stale_before,
+            )
+            .update(
+                {ExtractionJob.locked_until: now, ExtractionJob.updated_at: now},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return released
+
+    def fail_expired(self, db: Session) -> int:
+        """잠금이 만료됐지만 재시도 횟수를 모두 소진한 작업(반복적으로 워커를 죽이는 작업)을 failed로 확정합니다."""
+        now = datetime.utcnow()
+        expired = (
+            db.query(ExtractionJob)
+            .filter(
+                ExtractionJob.status == "running",
+                ExtractionJob.locked_until < now,
+                ExtractionJob.attempts >= ExtractionJob.max_attempts,
+            )
+            .all()
+        )
+        for job in expired:
+            self.fail(db, job, job.last_error or "워커가 응답 없이 종료되었습니다 (visibility timeout 초과).")
+        return len(expired)
+
+    def counts(self, db: Session, batch_id: Optional[int] = None) -> Dict[str, int]:
+        """상태별 작업 수 (batch_id를 지정하면 해당 일괄 작업만)"""
+        query = db.query(ExtractionJob.status, func.count(ExtractionJob.id))
+        if batch_id is not None:
+            query = query.filter(ExtractionJob.batch_id == batch_id)
+        rows = query.group_by(ExtractionJob.status).all()
+        return {status: count for status, count in rows}
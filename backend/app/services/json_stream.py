@@ -0,0 +1,94 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class IncrementalJSONObjectParser:
+    """
+    스트리밍으로 들어오는 JSON 객체 텍스트를 조각 단위로 받아,
+    최상위 키의 값이 완성되는 즉시 (키, 값)으로 반환하는 파서.
+
+    LLM 응답 앞뒤의 ```json 코드 블록 표시나 설명 문장은 최상위 '{' 이전/이후이므로 무시됩니다.
+
+    사용 예:
+        parser = IncrementalJSONObjectParser()
+        async for chunk in llm_client.stream(prompt):
+            for key, value in parser.feed(chunk):
+                ...
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+        self.done = False
+
+        # 최상위 객체에서 현재 읽고 있는 키/값 위치
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+        self.result: dict = {}
+
+    def _emit(self, end: int, emitted: List[Tuple[str, Any]]) -> None:
+        if self._key is None or self._value_start is None:
+            return
+        value = json.loads(self._buffer[self._value_start:end])
+        self.result[self._key] = value
+        emitted.append((self._key, value))
+        self._key = None
+        self._value_start = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        텍스트 조각을 추가하고, 이번 조각으로 완성된 최상위 (키, 값) 목록을 반환합니다.
+
+        Raises:
+            json.JSONDecodeError: 완성된 값이 올바른 JSON이 아닌 경우
+        """
+        emitted: List[Tuple[str, Any]] = []
+        offset = len(self._buffer)
+        self._buffer += chunk
+
+        for i, char in enumerate(chunk, start=offset):
+            if self.done:
+                break
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key_start is not None:
+                        self._key = json.loads(self._buffer[self._key_start:i + 1])
+                        self._key_start = None
+                continue
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+                # 최상위 객체에서 값이 아닌 위치의 문자열은 키
+                if self._depth == 1 and self._value_start is None:
+                    self._key_start = i
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(i, emitted)
+                    self.done = True
+            elif self._depth == 1:
+                if char == ":":
+                    self._value_start = i + 1
+                elif char == ",":
+                    self._emit(i, emitted)
+
+        return emitted
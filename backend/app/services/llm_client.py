@@ -0,0 +1,100 @@
+import json
+import math
+import os
+import threading
+from typing import Any, AsyncIterator, Optional
+
+import google.generativeai as genai
+
+
+# gemini-2.0-flash: 최신 무료 모델, 빠르고 강력함
+LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gemini-2.0-flash")
+
+# 토큰 수 추정용: 한글 위주 텍스트의 평균 문자 수 / 토큰 (보수적으로 추정)
+CHARS_PER_TOKEN = 2.0
+
+
+def strip_code_block(text: str) -> str:
+    """LLM 응답에서 ```json ... ``` 코드 블록 표시를 제거합니다."""
+    result = text.strip()
+    if result.startswith("```json"):
+        result = result[7:]
+    elif result.startswith("```"):
+        result = result[3:]
+    if result.endswith("```"):
+        result = result[:-3]
+    return result.strip()
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수를 대략 추정합니다 (API 호출 없이 예산 계산용)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def parse_json_response(text: str) -> Any:
+    """LLM 응답 텍스트를 JSON으로 파싱합니다."""
+    return json.loads(strip_code_block(text))
+
+
+class LLMClient:
+    """
+    프로세스 전체에서 공유하는 Gemini 클라이언트.
+    API 키 설정과 모델 인스턴스 생성은 한 번만 수행하고, 내부 gRPC 연결을 요청 간에 재사용합니다.
+    """
+
+    def __init__(self, model_name: str = LLM_MODEL_NAME):
+        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+
+    async def generate(self, prompt: str, temperature: float = 0.3) -> str:
+        """비동기로 텍스트를 생성합니다. 응답을 기다리는 동안 이벤트 루프를 막지 않습니다."""
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                temperature=temperature,
+            )
+        )
+        return response.text
+
+    async def generate_json(self, prompt: str, temperature: float = 0.3) -> Any:
+        """비동기로 생성한 응답을 JSON으로 파싱하여 반환합니다."""
+        return parse_json_response(await self.generate(prompt, temperature=temperature))
+
+    async def stream(self, prompt: str, temperature: float = 0.3) -> AsyncIterator[str]:
+        """비동기로 텍스트를 생성하며, 모델이 만들어 내는 대로 조각(chunk) 단위로 반환합니다."""
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                temperature=temperature,
+            ),
+            stream=True,
+        )
+        async for chunk in response:
+            # 안전 필터 등으로 텍스트가 없는 조각은 건너뜀
+            if chunk.parts:
+                yield chunk.text
+
+    def generate_sync(self, prompt: str, temperature: float = 0.3) -> str:
+        """동기 방식으로 텍스트를 생성합니다 (워커 스레드 등 이벤트 루프 밖에서 사용)."""
+        response = self.model.generate_content(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                temperature=temperature,
+            )
+        )
+        return response.text
+
+
+_llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """공유 LLM 클라이언트를 반환합니다. 처음 호출될 때 한 번만 설정됩니다."""
+    global _llm_client
+
+    with _llm_client_lock:
+        if _llm_client is None:
+            _llm_client = LLMClient()
+        return _llm_client
@@ -0,0 +1,185 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# OCR 결과 캐시 설정
+OCR_CACHE_ENABLED = os.getenv("OCR_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", "cache/ocr")
+OCR_CACHE_MAX_BYTES = int(os.getenv("OCR_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))  # 512MB
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_file_hash(file_path: str) -> str:
+    """파일 내용의 SHA-256 해시를 계산합니다."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_cache_key(file_hash: str, page_number: int, dpi: int, lang: str, preprocess: str) -> str:
+    """
+    파일 내용, 페이지, OCR 설정을 조합한 캐시 키를 만듭니다.
+    설정(DPI, 언어, 전처리)이 바뀌면 다른 키가 되므로 이전 결과를 재사용하지 않습니다.
+    """
+    raw = f"{file_hash}|{page_number}|{dpi}|{lang}|{preprocess}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class OCRCache:
+    """
+    페이지 단위 OCR 결과를 디스크(SQLite)에 저장하는 캐시.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다 (LRU).
+    히트/미스 횟수도 같은 파일에 저장되어 여러 프로세스에서 합산됩니다.
+    """
+
+    def __init__(self, cache_dir: str = OCR_CACHE_DIR, max_bytes: int = OCR_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.db_path = self.cache_dir / "ocr_cache.sqlite3"
+        self._lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_last_access ON entries (last_access)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)",
+                [("hits",), ("misses",)],
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """여러 키를 한 번에 조회합니다. 찾은 항목의 마지막 사용 시각을 갱신합니다."""
+        if not keys:
+            return {}
+
+        with self._lock, self._connect() as conn:
+            placeholders = ",".join("?" for _ in keys)
+            rows = conn.execute(
+                f"SELECT key, text FROM entries WHERE key IN ({placeholders})", keys
+            ).fetchall()
+            found = dict(rows)
+
+            if found:
+                conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    [(time.time(), key) for key in found],
+                )
+            conn.execute("UPDATE counters SET value = value + ? WHERE name = 'hits'", (len(found),))
+            conn.execute(
+                "UPDATE counters SET value = value + ? WHERE name = 'misses'",
+                (len(keys) - len(found),),
+            )
+
+        return found
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """여러 항목을 저장한 뒤 크기 한도를 넘은 만큼 LRU 순서로 삭제합니다."""
+        now = time.time()
+        rows = [(key, text, len(text.encode("utf-8")), now, now) for key, text in items]
+        if not rows:
+            return
+
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO entries (key, text, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._evict(conn)
+
+    def put(self, key: str, text: str) -> None:
+        self.put_many([(key, text)])
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evict_keys = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            evict_keys.append((key,))
+            total -= size
+
+        conn.executemany("DELETE FROM entries WHERE key = ?", evict_keys)
+        print(f"[OCRCache] LRU 정책으로 {len(evict_keys)}개 항목을 삭제했습니다.")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 히트/미스 횟수와 사용량을 반환합니다."""
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE counters SET value = 0")
+
+
+_ocr_cache: Optional[OCRCache] = None
+_ocr_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> Optional[OCRCache]:
+    """프로세스에서 공유하는 OCR 캐시를 반환합니다. 비활성화된 경우 None."""
+    global _ocr_cache
+
+    if not OCR_CACHE_ENABLED:
+        return None
+
+    with _ocr_cache_lock:
+        if _ocr_cache is None:
+            _ocr_cache = OCRCache()
+        return _ocr_cache
@@ -1,37 +1,460 @@
+import multiprocessing
 import os
+import re
 import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-from pdf2image import convert_from_path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from pdf2image import convert_from_path, pdfinfo_from_path
+from pypdf import PdfReader
 import pytesseract
 from PIL import Image
 import cv2
 import numpy as np
 
+from app.services.ocr_cache import build_cache_key, compute_file_hash, get_ocr_cache
+
 
 # Tesseract 실행 파일 경로 지정 (macOS)
 pytesseract.pytesseract.tesseract_cmd = "/opt/homebrew/bin/tesseract"
 
+# OCR 엔진 백엔드 (auto: tesserocr가 설치되어 있으면 사용, 없으면 pytesseract)
+OCR_BACKEND = os.getenv("OCR_BACKEND", "auto")
+# tesserocr에서 사용할 traineddata 경로 (지정하지 않으면 tesseract 기본 경로)
+TESSDATA_PREFIX = os.getenv("TESSDATA_PREFIX")
+
+# macOS에서 poppler 경로 설정
+POPPLER_PATH = "/opt/homebrew/bin"
+
+# 페이지 OCR 병렬 처리 워커 수 (1 이하이면 현재 프로세스에서 순차 처리)
+OCR_MAX_WORKERS = int(os.getenv("OCR_MAX_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+
+# OCR 프로세스 풀 시작 방식. 부모 프로세스에는 작업 큐/하트비트 스레드와 LLM 클라이언트가 떠 있으므로
+# 잠금 상태까지 복제하는 fork 대신 새 프로세스에서 시작 (워커 상태는 _init_worker가 다시 만듦)
+OCR_POOL_START_METHOD = os.getenv(
+    "OCR_POOL_START_METHOD",
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn",
+)
+
+# 스트리밍 모드: 전체 PDF를 한 번에 이미지로 만들지 않고 페이지 단위로 래스터화
+OCR_STREAMING = os.getenv("OCR_STREAMING", "true").lower() in ("1", "true", "yes")
+# 순차 스트리밍 시 한 번에 래스터화할 페이지 수
+OCR_PAGE_WINDOW = max(1, int(os.getenv("OCR_PAGE_WINDOW", "1")))
+
+# 텍스트 레이어를 OCR 대신 사용하기 위한 최소 글자 수 (공백 제외)
+TEXT_LAYER_MIN_CHARS = int(os.getenv("OCR_TEXT_LAYER_MIN_CHARS", "50"))
+# 텍스트 레이어에서 정상 문자(한글/영문/숫자/문장부호)가 차지해야 하는 최소 비율
+TEXT_LAYER_MIN_VALID_RATIO = float(os.getenv("OCR_TEXT_LAYER_MIN_VALID_RATIO", "0.8"))
+
+# 이미지 전처리 프로필 (accurate, fast, fast_adaptive)
+OCR_PREPROCESS_PROFILE = os.getenv("OCR_PREPROCESS_PROFILE", "accurate")
+
+# 페이지 처리 경로
+METHOD_OCR = "ocr"
+METHOD_TEXT_LAYER = "text_layer"
+
+_VALID_CHAR_PATTERN = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣA-Za-z0-9.,:;()\[\]%/\-+~·&'\"₩$]")
+
+_ocr_backend = None
+_ocr_backend_lock = threading.Lock()
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PreprocessProfile:
+    """OCR 전 이미지 전처리 방식"""
+
+    name: str
+    grayscale: str = "cv2"  # cv2: OpenCV 변환 (기존 방식), pil: PIL에서 바로 그레이스케일로 디코딩
+    denoise: str = "nlmeans"  # nlmeans, median, none
+    threshold: str = "otsu"  # otsu, adaptive
+    # 추정 노이즈(표준편차)가 이 값보다 낮으면 깨끗한 페이지로 보고 노이즈 제거를 생략
+    skip_denoise_below: Optional[float] = None
+
+    @property
+    def signature(self) -> str:
+        """OCR 캐시 키에 들어가는 전처리 식별자. 파라미터가 바뀌면 캐시가 무효화됩니다."""
+        return (
+            f"{self.name}:gray={self.grayscale},denoise={self.denoise},"
+            f"threshold={self.threshold},skip<{self.skip_denoise_below}"
+        )
+
+
+PREPROCESS_PROFILES = {
+    # 기존 전처리: 전체 해상도 fastNlMeansDenoising + Otsu 이진화
+    "accurate": PreprocessProfile(name="accurate"),
+    # 빠른 전처리: 그레이스케일 직접 디코딩, 노이즈가 있는 페이지만 median blur
+    "fast": PreprocessProfile(
+        name="fast", grayscale="pil", denoise="median", threshold="otsu", skip_denoise_below=2.0
+    ),
+    # 빠른 전처리 + 적응형 이진화 (조명이 고르지 않은 스캔본용)
+    "fast_adaptive": PreprocessProfile(
+        name="fast_adaptive", grayscale="pil", denoise="median", threshold="adaptive", skip_denoise_below=2.0
+    ),
+}
+
+
+def get_preprocess_profile(name: Optional[str] = None) -> PreprocessProfile:
+    """이름으로 전처리 프로필을 찾습니다. 지정하지 않으면 OCR_PREPROCESS_PROFILE을 사용합니다."""
+    name = name or OCR_PREPROCESS_PROFILE
+    if name not in PREPROCESS_PROFILES:
+        raise ValueError(
+            f"알 수 없는 전처리 프로필입니다: {name} (사용 가능: {', '.join(PREPROCESS_PROFILES)})"
+        )
+    return PREPROCESS_PROFILES[name]
+
+
+def estimate_noise(gray: np.ndarray, max_side: int = 1024) -> float:
+    """
+    그레이스케일 이미지의 노이즈 표준편차를 추정합니다 (Immerkær, 1996).
+    속도를 위해 이미지 중앙의 max_side x max_side 영역만 사용합니다.
+    """
+    h, w = gray.shape[:2]
+    top = max(0, (h - max_side) // 2)
+    left = max(0, (w - max_side) // 2)
+    crop = gray[top:top + max_side, left:left + max_side].astype(np.float32)
+    if crop.shape[0] < 3 or crop.shape[1] < 3:
+        return 0.0
+
+    kernel = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+    response = cv2.filter2D(crop, -1, kernel)[1:-1, 1:-1]
+    ch, cw = response.shape
+    return float(np.abs(response).sum() * np.sqrt(0.5 * np.pi) / (6.0 * ch * cw))
+
+
+@dataclass
+class PageResult:
+    """페이지 단위 텍스트 추출 결과"""
+
+    page_number: int
+    text: str = ""
+    method: str = METHOD_OCR  # ocr, text_layer
+    error: Optional[str] = None
+    elapsed: float = 0.0  # 초
+    cached: bool = False  # OCR 캐시에서 가져온 결과인지 여부
+
+
+@dataclass
+class OCRResult:
+    """문서 단위 텍스트 추출 결과"""
+
+    pages: List[PageResult] = field(default_factory=list)
+    page_markers: bool = True  # 단일 이미지 파일은 페이지 구분자 없이 반환
+
+    @property
+    def text(self) -> str:
+        """페이지 구분자를 포함한 전체 텍스트"""
+        if not self.page_markers:
+            return "\n\n".join(page.text for page in self.pages if page.text)
+        return "\n\n".join(
+            f"--- 페이지 {page.page_number} ---\n{page.text}"
+            for page in self.pages
+            if page.text
+        )
+
+    @property
+    def failed_pages(self) -> List[int]:
+        return [page.page_number for page in self.pages if page.error]
+
+    def summary(self) -> Dict[str, Any]:
+        """페이지별 처리 경로 통계. 텍스트 레이어로 절약된 OCR 시간 추정치를 포함합니다."""
+        ocr_pages = [page for page in self.pages if page.method == METHOD_OCR]
+        ocred_pages = [page for page in ocr_pages if not page.cached]
+        text_layer_pages = [page for page in self.pages if page.method == METHOD_TEXT_LAYER]
+        ocr_seconds = sum(page.elapsed for page in ocred_pages)
+        avg_ocr_seconds = ocr_seconds / len(ocred_pages) if ocred_pages else None
+
+        return {
+            "total_pages": len(self.pages),
+            "ocr_pages": len(ocr_pages),
+            "cached_pages": len(ocr_pages) - len(ocred_pages),
+            "text_layer_pages": len(text_layer_pages),
+            "failed_pages": self.failed_pages,
+            "page_methods": {page.page_number: page.method for page in self.pages},
+            "ocr_seconds": round(ocr_seconds, 2),
+            "text_layer_seconds": round(sum(page.elapsed for page in text_layer_pages), 2),
+            "estimated_ocr_seconds_saved": (
+                round(avg_ocr_seconds * len(text_layer_pages), 2)
+                if avg_ocr_seconds is not None
+                else None
+            ),
+        }
+
+
+class OCRBackend:
+    """OCR 엔진 인터페이스. 전처리된 이미지를 받아 텍스트를 반환합니다."""
+
+    name = "base"
+
+    def image_to_string(self, image: Image.Image, lang: str) -> str:
+        raise NotImplementedError
+
+    def warm_up(self, lang: str) -> None:
+        """언어 데이터를 미리 로드합니다 (필요한 백엔드만 구현)."""
+
+
+class PytesseractBackend(OCRBackend):
+    """
+    페이지마다 tesseract 프로세스를 실행하는 기본 백엔드.
+    호출할 때마다 언어 데이터를 다시 로드하지만 추가 의존성이 없어 fallback으로 사용합니다.
+    """
+
+    name = "pytesseract"
+
+    def image_to_string(self, image: Image.Image, lang: str) -> str:
+        return pytesseract.image_to_string(image, lang=lang)
+
+
+class TesserocrBackend(OCRBackend):
+    """
+    tesserocr(Tesseract C++ API 바인딩)를 사용하는 상주 엔진.
+    언어별 API 인스턴스를 한 번만 만들어 두고 여러 페이지에 재사용하므로
+    kor/eng traineddata를 페이지마다 다시 로드하지 않습니다.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self):
+        import tesserocr
+
+        self._tesserocr = tesserocr
+        self._apis = {}
+        # PyTessBaseAPI는 스레드 안전하지 않으므로 호출을 직렬화
+        self._lock = threading.Lock()
+
+    def _get_api(self, lang: str):
+        api = self._apis.get(lang)
+        if api is None:
+            kwargs = {"lang": lang}
+            if TESSDATA_PREFIX:
+                kwargs["path"] = TESSDATA_PREFIX
+            api = self._tesserocr.PyTessBaseAPI(**kwargs)
+            self._apis[lang] = api
+            print(f"[OCRService] tesserocr 엔진 로드 완료 (lang={lang}, pid={os.getpid()})")
+        return api
+
+    def warm_up(self, lang: str) -> None:
+        with self._lock:
+            self._get_api(lang)
+
+    def image_to_string(self, image: Image.Image, lang: str) -> str:
+        with self._lock:
+            api = self._get_api(lang)
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+
+def get_ocr_backend() -> OCRBackend:
+    """
+    현재 프로세스에서 공유하는 OCR 백엔드를 반환합니다.
+    tesserocr를 사용할 수 없으면 pytesseract로 대체합니다.
+    """
+    global _ocr_backend
+
+    with _ocr_backend_lock:
+        if _ocr_backend is None:
+            if OCR_BACKEND in ("auto", "tesserocr"):
+                try:
+                    _ocr_backend = TesserocrBackend()
+                except ImportError:
+                    if OCR_BACKEND == "tesserocr":
+                        print("[OCRService] tesserocr를 불러올 수 없어 pytesseract를 사용합니다.")
+            elif OCR_BACKEND != "pytesseract":
+                print(f"[OCRService] 알 수 없는 OCR_BACKEND({OCR_BACKEND}), pytesseract를 사용합니다.")
+
+            if _ocr_backend is None:
+                _ocr_backend = PytesseractBackend()
+        return _ocr_backend
+
+
+def _init_worker(lang: str) -> None:
+    """프로세스 풀 워커 초기화: OCR 엔진과 언어 데이터를 워커당 한 번만 로드합니다."""
+    try:
+        get_ocr_backend().warm_up(lang)
+    except Exception as e:
+        print(f"[OCRService] 워커 OCR 엔진 초기화 실패: {str(e)}")
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    페이지 OCR용 프로세스 풀을 반환합니다. OCR_MAX_WORKERS 크기로 한 번만 만들어 여러 문서(워커 스레드)가 공유하며,
+    호출마다의 동시 처리 수는 제출하는 작업 수로 제한합니다 (OCRService._run_parallel).
+    """
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=OCR_MAX_WORKERS,
+                mp_context=multiprocessing.get_context(OCR_POOL_START_METHOD),
+                initializer=_init_worker,
+                initargs=("kor+eng",),
+            )
+        return _process_pool
+
+
+def _reset_process_pool(pool: ProcessPoolExecutor) -> None:
+    """워커 프로세스가 비정상 종료되어 깨진 풀을 폐기합니다 (다른 스레드가 이미 새 풀로 바꿨으면 그대로 둠)."""
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _ocr_page_task(page_number: int, image: Image.Image, lang: str, profile: str) -> PageResult:
+    """
+    워커 프로세스에서 한 페이지를 OCR합니다.
+    프로세스 풀에서 pickle 될 수 있도록 모듈 수준 함수로 정의합니다.
+    """
+    started = time.perf_counter()
+    try:
+        service = OCRService(max_workers=1, preprocess_profile=profile)
+        processed_image = service.preprocess_image(image)
+        text = get_ocr_backend().image_to_string(processed_image, lang=lang)
+        return PageResult(
+            page_number=page_number,
+            text=text.strip(),
+            elapsed=time.perf_counter() - started,
+        )
+    except Exception as e:
+        return PageResult(
+            page_number=page_number,
+            error=str(e),
+            elapsed=time.perf_counter() - started,
+        )
+
+
+def get_pdf_page_count(pdf_path: str) -> int:
+    """PDF 페이지 수를 반환합니다 (이미지 변환 없이 pdfinfo만 사용)."""
+    info = pdfinfo_from_path(pdf_path, poppler_path=POPPLER_PATH)
+    return int(info["Pages"])
+
+
+def _group_consecutive(page_numbers: List[int], window: int) -> List[Tuple[int, int]]:
+    """페이지 번호 목록을 최대 window 길이의 연속 구간 (first, last)으로 묶습니다."""
+    ranges = []
+    for page_number in sorted(page_numbers):
+        if ranges and page_number == ranges[-1][1] + 1 and page_number - ranges[-1][0] < window:
+            ranges[-1] = (ranges[-1][0], page_number)
+        else:
+            ranges.append((page_number, page_number))
+    return ranges
+
+
+def iter_pdf_pages(
+    pdf_path: str,
+    dpi: int = 300,
+    window: int = OCR_PAGE_WINDOW,
+    page_numbers: Optional[List[int]] = None,
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    PDF를 window 페이지씩 래스터화하여 (페이지 번호, 이미지)를 순서대로 반환합니다.
+    메모리에는 최대 window 페이지의 이미지만 유지됩니다.
+    page_numbers를 지정하면 해당 페이지만 래스터화합니다.
+    """
+    if page_numbers is None:
+        page_numbers = list(range(1, get_pdf_page_count(pdf_path) + 1))
+
+    for first_page, last_page in _group_consecutive(page_numbers, window):
+        images = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=first_page,
+            last_page=last_page,
+            poppler_path=POPPLER_PATH,
+        )
+        for offset, image in enumerate(images):
+            yield first_page + offset, image
+        del images
+
+
+def _ocr_pdf_page_task(page_number: int, pdf_path: str, dpi: int, lang: str, profile: str) -> PageResult:
+    """워커 프로세스에서 PDF의 한 페이지만 래스터화한 뒤 OCR합니다."""
+    try:
+        images = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=page_number,
+            last_page=page_number,
+            poppler_path=POPPLER_PATH,
+        )
+    except Exception as e:
+        return PageResult(page_number=page_number, error=f"페이지 이미지 변환 실패: {str(e)}")
+    if not images:
+        return PageResult(page_number=page_number, error="페이지 이미지 변환 결과가 없습니다.")
+    return _ocr_page_task(page_number, images[0], lang, profile)
+
+
+def is_usable_text_layer(text: Optional[str]) -> bool:
+    """
+    PDF에 포함된 텍스트 레이어를 OCR 없이 그대로 사용할 수 있는지 판단합니다.
+    글자 수가 너무 적거나 (스캔 이미지 위의 워터마크 등),
+    폰트 매핑이 깨져 정상 문자 비율이 낮은 경우 OCR 대상으로 분류합니다.
+    """
+    if not text or "(cid:" in text or "�" in text:
+        return False
+
+    compact = re.sub(r"\s+", "", text)
+    if len(compact) < TEXT_LAYER_MIN_CHARS:
+        return False
+
+    valid_chars = len(_VALID_CHAR_PATTERN.findall(compact))
+    return valid_chars / len(compact) >= TEXT_LAYER_MIN_VALID_RATIO
+
 
 class OCRService:
     """PDF 문서에서 텍스트를 추출하는 OCR 서비스"""
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: Optional[bool] = None,
+        preprocess_profile: Optional[str] = None,
+    ):
+        self.max_workers = max_workers if max_workers is not None else OCR_MAX_WORKERS
+        self.streaming = streaming if streaming is not None else OCR_STREAMING
+        self.profile = get_preprocess_profile(preprocess_profile)
 
     def preprocess_image(self, image: Image.Image) -> Image.Image:
-        """OCR 정확도를 높이기 위한 이미지 전처리"""
-        # PIL Image를 OpenCV 형식으로 변환
-        opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        """OCR 정확도를 높이기 위한 이미지 전처리 (프로필에 따라 방식이 달라집니다)"""
+        profile = self.profile
 
         # 그레이스케일 변환
-        gray = cv2.cvtColor(opencv_image, cv2.COLOR_BGR2GRAY)
+        if profile.grayscale == "pil" or image.mode == "L":
+            # PIL에서 바로 단일 채널로 디코딩 (중간 RGB/BGR 배열을 만들지 않음)
+            gray = np.asarray(image if image.mode == "L" else image.convert("L"))
+        else:
+            gray = cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2GRAY)
 
-        # 노이즈 제거
-        denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+        # 노이즈 제거 (깨끗한 페이지는 생략 가능)
+        denoise = profile.denoise
+        if denoise != "none" and profile.skip_denoise_below is not None:
+            if estimate_noise(gray) < profile.skip_denoise_below:
+                denoise = "none"
+
+        if denoise == "nlmeans":
+            denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+        elif denoise == "median":
+            denoised = cv2.medianBlur(gray, 3)
+        else:
+            denoised = gray
 
-        # 이진화 (Otsu's method)
-        _, binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # 이진화
+        if profile.threshold == "adaptive":
+            binary = cv2.adaptiveThreshold(
+                denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 15
+            )
+        else:
+            # Otsu's method
+            _, binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
         # OpenCV 이미지를 PIL Image로 변환
         processed_image = Image.fromarray(binary)
@@ -45,39 +468,287 @@ class OCRService:
             processed_image = self.preprocess_image(image)
 
             # OCR 수행 (한국어 + 영어)
-            text = pytesseract.image_to_string(processed_image, lang=lang)
+            text = get_ocr_backend().image_to_string(processed_image, lang=lang)
 
             return text.strip()
         except Exception as e:
             print(f"OCR 오류: {str(e)}")
             return ""
 
-    def extract_text_from_pdf(self, pdf_path: str, dpi: int = 300) -> str:
-        """PDF 파일에서 텍스트 추출"""
+    def extract_text_layer(self, pdf_path: str) -> Dict[int, str]:
+        """
+        PDF에 내장된 텍스트 레이어를 페이지별로 읽습니다.
+
+        Returns:
+            Dict[int, str]: 페이지 번호 -> 텍스트. 읽을 수 없는 PDF는 빈 dict를 반환합니다.
+        """
         try:
-            if not os.path.exists(pdf_path):
-                raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+            reader = PdfReader(pdf_path)
+            texts = {}
+            for i, page in enumerate(reader.pages):
+                try:
+                    texts[i + 1] = (page.extract_text() or "").strip()
+                except Exception as e:
+                    print(f"[OCRService] 페이지 {i+1} 텍스트 레이어 읽기 실패: {str(e)}")
+                    texts[i + 1] = ""
+            return texts
+        except Exception as e:
+            print(f"[OCRService] 텍스트 레이어 읽기 실패, 전체 OCR로 진행합니다: {str(e)}")
+            return {}
+
+    def _lookup_cache(
+        self, file_path: str, page_numbers: List[int], dpi: int, lang: str
+    ) -> Tuple[Dict[int, str], List[PageResult]]:
+        """
+        OCR 캐시에서 페이지 결과를 조회합니다.
+
+        Returns:
+            (페이지 번호 -> 캐시 키, 캐시에서 찾은 페이지 결과)
+        """
+        cache = get_ocr_cache()
+        if cache is None or not page_numbers:
+            return {}, []
+
+        try:
+            file_hash = compute_file_hash(file_path)
+            keys = {
+                page_number: build_cache_key(
+                    file_hash, page_number, dpi, lang, f"{self.profile.signature}|{get_ocr_backend().name}"
+                )
+                for page_number in page_numbers
+            }
+            found = cache.get_many(list(keys.values()))
+        except Exception as e:
+            print(f"[OCRService] OCR 캐시 조회 실패, 캐시 없이 진행합니다: {str(e)}")
+            return {}, []
 
-            # macOS에서 poppler 경로 설정
-            poppler_path = "/opt/homebrew/bin"
+        cached_pages = [
+            PageResult(page_number=page_number, text=found[key], method=METHOD_OCR, cached=True)
+            for page_number, key in keys.items()
+            if key in found
+        ]
+        return keys, cached_pages
 
-            # PDF를 이미지로 변환
-            images = convert_from_path(pdf_path, dpi=dpi, poppler_path=poppler_path)
+    def _store_cache(self, keys: Dict[int, str], results: List[PageResult]) -> None:
+        """성공한 OCR 결과를 캐시에 저장합니다."""
+        cache = get_ocr_cache()
+        if cache is None or not keys:
+            return
 
-            extracted_texts = []
+        try:
+            cache.put_many(
+                (keys[result.page_number], result.text)
+                for result in results
+                if not result.error and result.page_number in keys
+            )
+        except Exception as e:
+            print(f"[OCRService] OCR 캐시 저장 실패: {str(e)}")
 
-            # 각 페이지에서 텍스트 추출
-            for i, image in enumerate(images):
-                print(f"페이지 {i+1}/{len(images)} 처리 중...")
-                text = self.extract_text_from_image(image)
-                if text:
-                    extracted_texts.append(f"--- 페이지 {i+1} ---\n{text}")
+    def _run_parallel(
+        self, task: Callable[..., PageResult], task_args: List[tuple], workers: int
+    ) -> List[PageResult]:
+        """
+        페이지 작업을 공유 프로세스 풀에서 실행하고 페이지 순서대로 결과를 반환합니다.
+        task_args의 각 항목은 task의 인자이며, 첫 번째 값은 페이지 번호입니다.
+        한 번에 workers개까지만 제출하므로 다른 문서의 OCR과 풀을 나눠 씁니다.
+        풀이 깨졌거나 작업이 취소된 페이지는 이 스레드에서 순차로 다시 처리합니다.
+        """
+        total = len(task_args)
+        print(f"[OCRService] {total}페이지를 {workers}개 프로세스로 병렬 처리합니다.")
+        results = {}
+        retry = []
+        pending_args = list(task_args)
+        running = {}
+        pool = _get_process_pool()
+        pool_broken = False
 
-            # 모든 페이지의 텍스트 결합
-            full_text = "\n\n".join(extracted_texts)
+        while pending_args or running:
+            while pending_args and len(running) < workers and not pool_broken:
+                args = pending_args.pop(0)
+                try:
+                    running[pool.submit(task, *args)] = args
+                except BrokenProcessPool:
+                    pool_broken = True
+                    retry.append(args)
+            if pool_broken:
+                retry.extend(pending_args)
+                pending_args = []
+            if not running:
+                break
 
-            return full_text
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                args = running.pop(future)
+                try:
+                    results[args[0]] = future.result()
+                except (BrokenProcessPool, CancelledError) as e:
+                    # 워커 프로세스가 죽었거나 다른 스레드가 깨진 풀을 폐기하며 취소된 페이지
+                    pool_broken = pool_broken or isinstance(e, BrokenProcessPool)
+                    retry.append(args)
+                    continue
+                print(f"페이지 {len(results)}/{total} 처리 완료")
 
+        if pool_broken:
+            _reset_process_pool(pool)
+
+        for args in retry:
+            print(f"[OCRService] 페이지 {args[0]}를 순차로 다시 처리합니다.")
+            results[args[0]] = task(*args)
+
+        return [results[page_number] for page_number in sorted(results)]
+
+    def ocr_pages(
+        self,
+        images: List[Image.Image],
+        lang: str = "kor+eng",
+        page_numbers: Optional[List[int]] = None,
+    ) -> List[PageResult]:
+        """
+        메모리에 올라온 여러 페이지 이미지를 OCR합니다.
+        워커가 2개 이상이면 프로세스 풀에서 동시에 처리합니다.
+
+        Args:
+            images: 페이지 이미지 목록 (페이지 순서)
+            lang: Tesseract 언어 설정
+            page_numbers: 각 이미지의 페이지 번호 (지정하지 않으면 1부터 순서대로)
+
+        Returns:
+            List[PageResult]: 페이지 순서대로 정렬된 결과. 실패한 페이지는 error가 채워집니다.
+        """
+        if page_numbers is None:
+            page_numbers = list(range(1, len(images) + 1))
+        total = len(images)
+        workers = min(self.max_workers, total)
+
+        if workers <= 1:
+            results = []
+            for i, (page_number, image) in enumerate(zip(page_numbers, images)):
+                print(f"페이지 {page_number} 처리 중... ({i+1}/{total})")
+                results.append(_ocr_page_task(page_number, image, lang, self.profile.name))
+            return results
+
+        task_args = [
+            (page_number, image, lang, self.profile.name) for page_number, image in zip(page_numbers, images)
+        ]
+        return self._run_parallel(_ocr_page_task, task_args, workers)
+
+    def ocr_pdf_pages(
+        self,
+        pdf_path: str,
+        dpi: int = 300,
+        lang: str = "kor+eng",
+        page_numbers: Optional[List[int]] = None,
+    ) -> List[PageResult]:
+        """
+        PDF를 페이지 단위로 래스터화하면서 OCR합니다 (스트리밍 모드).
+        전체 페이지 이미지를 메모리에 올리지 않으므로 최대 메모리가 문서 길이와 무관합니다.
+
+        - 병렬: 각 워커가 자신이 맡은 페이지만 직접 래스터화 (워커 수만큼의 페이지만 메모리에 존재)
+        - 순차: OCR_PAGE_WINDOW 페이지씩 래스터화하여 바로 OCR
+        """
+        if page_numbers is None:
+            page_numbers = list(range(1, get_pdf_page_count(pdf_path) + 1))
+        total = len(page_numbers)
+        workers = min(self.max_workers, total)
+
+        if workers <= 1:
+            results = []
+            for page_number, image in iter_pdf_pages(pdf_path, dpi=dpi, page_numbers=page_numbers):
+                print(f"페이지 {page_number} 처리 중... ({len(results)+1}/{total})")
+                results.append(_ocr_page_task(page_number, image, lang, self.profile.name))
+            return results
+
+        task_args = [
+            (page_number, pdf_path, dpi, lang, self.profile.name) for page_number in page_numbers
+        ]
+        return self._run_parallel(_ocr_pdf_page_task, task_args, workers)
+
+    def extract_pdf(self, pdf_path: str, dpi: int = 300, lang: str = "kor+eng") -> OCRResult:
+        """
+        PDF에서 페이지별로 텍스트를 추출합니다.
+        텍스트 레이어가 있는 페이지는 그대로 읽고, 이미지뿐인 페이지만 OCR합니다.
+        """
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+
+        # 1단계: 텍스트 레이어 확인
+        started = time.perf_counter()
+        text_layer = self.extract_text_layer(pdf_path)
+        text_layer_elapsed = time.perf_counter() - started
+
+        page_count = len(text_layer) if text_layer else get_pdf_page_count(pdf_path)
+        usable_pages = {
+            page_number: text
+            for page_number, text in text_layer.items()
+            if is_usable_text_layer(text)
+        }
+        ocr_page_numbers = [
+            page_number for page_number in range(1, page_count + 1)
+            if page_number not in usable_pages
+        ]
+
+        per_page_elapsed = text_layer_elapsed / page_count if page_count else 0.0
+        pages = [
+            PageResult(
+                page_number=page_number,
+                text=text,
+                method=METHOD_TEXT_LAYER,
+                elapsed=per_page_elapsed,
+            )
+            for page_number, text in usable_pages.items()
+        ]
+
+        # 2단계: OCR 캐시 조회 (같은 파일, 같은 설정으로 OCR한 적이 있으면 재사용)
+        cache_keys, cached_pages = self._lookup_cache(pdf_path, ocr_page_numbers, dpi, lang)
+        if cached_pages:
+            cached_numbers = {page.page_number for page in cached_pages}
+            ocr_page_numbers = [p for p in ocr_page_numbers if p not in cached_numbers]
+            pages.extend(cached_pages)
+            print(f"[OCRService] OCR 캐시에서 {len(cached_pages)}페이지를 가져왔습니다.")
+
+        # 3단계: 나머지 이미지 페이지만 OCR
+        if ocr_page_numbers:
+            print(
+                f"[OCRService] 텍스트 레이어 {len(usable_pages)}페이지, "
+                f"OCR 대상 {len(ocr_page_numbers)}페이지"
+            )
+            if self.streaming:
+                # 페이지 단위로 래스터화하면서 텍스트 추출
+                ocr_results = self.ocr_pdf_pages(
+                    pdf_path, dpi=dpi, lang=lang, page_numbers=ocr_page_numbers
+                )
+            else:
+                # OCR 대상 페이지만 한 번에 이미지로 변환한 뒤 텍스트 추출 (연속 구간은 한 번에 변환)
+                rendered = list(iter_pdf_pages(
+                    pdf_path, dpi=dpi, window=len(ocr_page_numbers), page_numbers=ocr_page_numbers
+                ))
+                ocr_results = self.ocr_pages(
+                    [image for _, image in rendered],
+                    lang=lang,
+                    page_numbers=[page_number for page_number, _ in rendered],
+                )
+            self._store_cache(cache_keys, ocr_results)
+            pages.extend(ocr_results)
+        elif cached_pages:
+            print("[OCRService] 모든 OCR 대상 페이지를 캐시에서 가져왔습니다. OCR 생략")
+        else:
+            print(f"[OCRService] 모든 페이지({page_count})를 텍스트 레이어에서 읽었습니다. OCR 생략")
+
+        pages.sort(key=lambda page: page.page_number)
+        result = OCRResult(pages=pages)
+
+        if result.failed_pages:
+            print(f"[OCRService] OCR 실패 페이지: {result.failed_pages}")
+            for page in result.pages:
+                if page.error:
+                    print(f"  - 페이지 {page.page_number}: {page.error}")
+
+        return result
+
+    def extract_text_from_pdf(self, pdf_path: str, dpi: int = 300) -> str:
+        """PDF 파일에서 텍스트 추출"""
+        try:
+            return self.extract_pdf(pdf_path, dpi=dpi).text
         except Exception as e:
             raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
 
@@ -95,13 +766,34 @@ class OCRService:
         except Exception as e:
             raise Exception(f"이미지 텍스트 추출 실패: {str(e)}")
 
-    def extract_text_from_file(self, file_path: str) -> str:
-        """파일 형식에 따라 텍스트 추출"""
+    def extract_from_file(self, file_path: str) -> OCRResult:
+        """파일 형식에 따라 텍스트를 추출하고 페이지별 처리 경로를 함께 반환합니다."""
         file_ext = Path(file_path).suffix.lower()
 
         if file_ext == ".pdf":
-            return self.extract_text_from_pdf(file_path)
+            try:
+                return self.extract_pdf(file_path)
+            except Exception as e:
+                raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
         elif file_ext in [".jpg", ".jpeg", ".png", ".gif", ".bmp"]:
-            return self.extract_text_from_image_file(file_path)
+            cache_keys, cached_pages = self._lookup_cache(file_path, [1], 0, "kor+eng")
+            if cached_pages:
+                return OCRResult(pages=cached_pages, page_markers=False)
+
+            started = time.perf_counter()
+            text = self.extract_text_from_image_file(file_path)
+            page = PageResult(
+                page_number=1,
+                text=text,
+                method=METHOD_OCR,
+                elapsed=time.perf_counter() - started,
+            )
+            if text:
+                self._store_cache(cache_keys, [page])
+            return OCRResult(pages=[page], page_markers=False)
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
+
+    def extract_text_from_file(self, file_path: str) -> str:
+        """파일 형식에 따라 텍스트 추출"""
+        return self.extract_from_file(file_path).text
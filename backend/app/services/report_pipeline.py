@@ -0,0 +1,93 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Stage:
+    """
+    파이프라인 단계.
+    func는 depends_on에 나열된 단계의 결과를 같은 이름의 키워드 인자로 받습니다.
+    """
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class PipelineResult:
+    results: Dict[str, Any] = field(default_factory=dict)
+    # 단계별 시작 시각(파이프라인 시작 기준)과 소요 시간 (초)
+    stage_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    wall_clock: float = 0.0
+
+    def timings(self) -> Dict[str, Any]:
+        """
+        단계별 소요 시간과, 모든 단계를 순서대로 실행했을 때 대비 절약된 시간.
+        """
+        sequential = sum(timing["duration"] for timing in self.stage_timings.values())
+        return {
+            "stages": self.stage_timings,
+            "wall_clock": round(self.wall_clock, 3),
+            "sequential_estimate": round(sequential, 3),
+            "saved": round(max(0.0, sequential - self.wall_clock), 3),
+        }
+
+
+class StagePipeline:
+    """
+    의존 관계가 있는 비동기 단계를 실행합니다.
+    각 단계는 입력(의존 단계의 결과)이 준비되는 즉시 시작되므로,
+    서로 독립적인 LLM 호출은 동시에 진행됩니다.
+    """
+
+    def __init__(self, stages: List[Stage]):
+        names = set()
+        for stage in stages:
+            missing = [dep for dep in stage.depends_on if dep not in names]
+            if missing:
+                raise ValueError(f"단계 '{stage.name}'의 의존 단계가 먼저 정의되어야 합니다: {missing}")
+            names.add(stage.name)
+        self.stages = stages
+
+    async def run(
+        self,
+        on_stage_complete: Optional[Callable[[str, Any, Dict[str, float]], Awaitable[None]]] = None,
+    ) -> PipelineResult:
+        """
+        모든 단계를 실행합니다.
+        on_stage_complete를 지정하면 단계가 끝날 때마다 (단계 이름, 결과, 소요 시간)으로 호출합니다 (진행 상황 스트리밍용).
+        """
+        result = PipelineResult()
+        tasks: Dict[str, asyncio.Task] = {}
+        pipeline_started = time.perf_counter()
+
+        async def run_stage(stage: Stage) -> Any:
+            inputs = {dep: await tasks[dep] for dep in stage.depends_on}
+            started = time.perf_counter()
+            try:
+                value = await stage.func(**inputs)
+            finally:
+                result.stage_timings[stage.name] = {
+                    "started_at": round(started - pipeline_started, 3),
+                    "duration": round(time.perf_counter() - started, 3),
+                }
+            if on_stage_complete:
+                await on_stage_complete(stage.name, value, result.stage_timings[stage.name])
+            return value
+
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+
+        try:
+            values = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        result.results = dict(zip(tasks.keys(), values))
+        result.wall_clock = time.perf_counter() - pipeline_started
+        return result
@@ -0,0 +1,259 @@
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+
+# 금액 단위 (원 기준 배수)
+UNIT_MULTIPLIERS: Dict[str, int] = {
+    "원": 1,
+    "천원": 1_000,
+    "만원": 10_000,
+    "백만원": 1_000_000,
+    "천만원": 10_000_000,
+    "억원": 100_000_000,
+}
+
+# 숫자 뒤에 붙는 한글 단위 ("12억 3,400만원", "1,234백만원")
+_COMPONENT_MULTIPLIERS: Dict[str, int] = {
+    "조": 1_000_000_000_000,
+    "억": 100_000_000,
+    "천만": 10_000_000,
+    "백만": 1_000_000,
+    "만": 10_000,
+    "천": 1_000,
+}
+
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+
+# 표 머리의 단위 표시 ("(단위: 백만원)", "단위 : 천원")
+_UNIT_HEADER_PATTERN = re.compile(r"단\s*위\s*[:：]?\s*(천만원|백만원|억원|만원|천원|원)")
+_PAGE_MARKER_PATTERN = re.compile(r"^--- 페이지 \d+ ---$")
+
+# 금액: 부호(-, △, ▲, 괄호) + 숫자 + 한글 단위 조합
+_AMOUNT_PATTERN = re.compile(
+    rf"(?P<sign>[-−△▲(]\s*)?"
+    rf"(?P<body>(?:(?:{_NUMBER})\s*(?:조|억|천만|백만|만|천)\s*)*(?:{_NUMBER})?)"
+    rf"\s*(?P<unit>천만원|백만원|억원|만원|천원|원)?"
+    # 연도, 비율 등 금액이 아닌 숫자는 제외
+    rf"(?![\d.,]*\s*(?:년|%|배))"
+)
+# 줄 전체가 금액 하나인 경우 (괄호 음수의 닫는 괄호 포함)
+_SINGLE_AMOUNT_PATTERN = re.compile(rf"(?:{_AMOUNT_PATTERN.pattern})\s*\)?")
+_COMPONENT_PATTERN = re.compile(rf"({_NUMBER})\s*(조|억|천만|백만|만|천)?")
+# 단위나 쉼표 없는 4자리 연도 ("2023")는 표 머리의 연도일 가능성이 높아 금액으로 보지 않음
+_YEAR_LIKE_PATTERN = re.compile(r"(?:19|20)\d{2}")
+
+_BUSINESS_NUMBER_PATTERN = re.compile(r"(?<!\d)(\d{3})\s*-\s*(\d{2})\s*-\s*(\d{5})(?!\d)")
+_DATE_PATTERN = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?")
+_COUNT_PATTERN = re.compile(r"(\d{1,3}(?:,\d{3})+|\d+)(?![\d.,]*\s*[년.\-/%])\s*(?:명|인)?")
+
+
+def _label(*words: str) -> Pattern:
+    """OCR에서 글자 사이에 공백이 끼는 경우(매 출 액)를 허용하는 레이블 패턴"""
+    alternatives = ["\\s*".join(map(re.escape, word)) for word in words]
+    return re.compile(rf"(?:{'|'.join(alternatives)})")
+
+
+# 레이블 뒤 괄호 설명 ("영업이익(손실)", "자본총계(자기자본)")은 건너뜀 (괄호 음수 "(1,000)"는 유지)
+_LABEL_SUFFIX = re.compile(r"^\s*(?:\([^)\d]*\)|（[^）\d]*）)?\s*[:：]?")
+
+# 금액 필드: 우선순위 순 레이블 패턴과, 뒤에 오면 다른 항목인 접미어
+AMOUNT_FIELD_LABELS: Dict[str, List[Pattern]] = {
+    "revenue": [_label("매출액", "영업수익", "매출총액")],
+    "operating_profit": [_label("영업이익", "영업손익")],
+    "net_profit": [_label("당기순이익", "당기순손익", "순이익")],
+    "total_assets": [_label("자산총계", "총자산", "자산합계")],
+    "total_liabilities": [_label("부채총계", "총부채", "부채합계")],
+    # 부채비율 계산에 쓰이므로 자본총계를 우선하고, 없으면 자본금
+    "equity": [_label("자본총계", "자기자본", "자본합계"), _label("자본금")],
+    "loan_amount": [_label("대출신청금액", "신청금액", "대출금액", "차입신청금액")],
+}
+# 레이블 바로 뒤에 오면 다른 항목 (예: 영업이익률, 총자산이익률, 매출액증가율)
+_OTHER_ITEM_SUFFIX = re.compile(r"^\s*(?:률|율|이익률|증가율|회전율|대비|영업이익률|순이익률)")
+
+_BUSINESS_NUMBER_LABEL = _label("사업자등록번호", "사업자번호")
+_ESTABLISHMENT_LABEL = _label("설립일자", "설립연월일", "설립일", "개업연월일", "개업일")
+_EMPLOYEE_LABEL = _label("상시근로자수", "종업원수", "직원수", "상시근로자", "종업원", "임직원수")
+
+# 양식의 "레이블: 값" 형태 텍스트 필드 (콜론이 있는 경우만 사용해 본문 문장과 구분)
+TEXT_FIELD_LABELS: Dict[str, Pattern] = {
+    "company_name": _label("상호", "회사명", "법인명", "기업명"),
+    "ceo_name": _label("대표자명", "대표자", "대표이사"),
+    "industry": _label("업종", "업태"),
+    "address": _label("본점소재지", "사업장소재지", "소재지", "주소"),
+    "main_products": _label("주요제품", "주요품목", "주요사업", "종목"),
+    "loan_purpose": _label("대출목적", "자금용도", "차입목적"),
+}
+_TEXT_VALUE_PATTERN = re.compile(r"^\s*(?:\([^)\d]*\))?\s*[:：]\s*(.+)$")
+# 한 줄에 여러 항목이 있으면 다음 "레이블:" 앞에서 자름 ("업태: 제조업  종목: 자동차부품")
+_NEXT_LABEL_PATTERN = re.compile(r"\s{2,}|\s+[^\s:：]{1,10}\s*[:：]")
+TEXT_VALUE_MAX_CHARS = 100
+
+# 규칙으로 추출을 시도하는 필드
+RULE_FIELDS = [
+    "business_number",
+    "establishment_date",
+    "employee_count",
+    *AMOUNT_FIELD_LABELS.keys(),
+    *TEXT_FIELD_LABELS.keys(),
+]
+
+
+@dataclass
+class RuleExtractionResult:
+    """규칙 기반 추출 결과: 찾은 필드 값"""
+
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self.data.keys())
+
+
+def parse_amount(text: str, unit_multiplier: int = 1) -> Optional[int]:
+    """
+    금액 문자열을 원 단위 정수로 변환합니다.
+
+    - "1,234,567" -> 1234567 (단위 표시가 없으면 unit_multiplier 적용)
+    - "12억 3,400만원" -> 1234000000, "1,234백만원" -> 1234000000, "3,000천원" -> 3000000
+    - "△1,000", "(1,000)", "-1,000" -> 음수
+    """
+    match = _AMOUNT_PATTERN.match(text.strip())
+    if not match or not match.group("body").strip():
+        return None
+    if not match.group("unit") and _YEAR_LIKE_PATTERN.fullmatch(match.group("body").strip()):
+        return None
+
+    total = 0.0
+    has_korean_unit = False
+    for number, component in _COMPONENT_PATTERN.findall(match.group("body")):
+        value = float(number.replace(",", ""))
+        if component:
+            has_korean_unit = True
+            value *= _COMPONENT_MULTIPLIERS[component]
+        total += value
+
+    unit = match.group("unit")
+    if unit and unit != "원":
+        total *= UNIT_MULTIPLIERS[unit]
+    elif not unit and not has_korean_unit:
+        total *= unit_multiplier
+
+    if match.group("sign"):
+        total = -total
+    return int(round(total))
+
+
+def _normalize_date(year: str, month: str, day: str) -> Optional[str]:
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return None
+
+
+def _lines_with_units(text: str) -> List[Tuple[str, int]]:
+    """각 줄과 그 줄에 적용되는 단위 배수 (가장 가까운 앞쪽 단위 표시, 페이지가 바뀌면 원 단위)"""
+    lines = []
+    multiplier = 1
+    for line in text.splitlines():
+        line = line.strip()
+        if _PAGE_MARKER_PATTERN.match(line):
+            multiplier = 1
+            continue
+        unit = _UNIT_HEADER_PATTERN.search(line)
+        if unit:
+            multiplier = UNIT_MULTIPLIERS[unit.group(1)]
+        lines.append((line, multiplier))
+    return lines
+
+
+def _value_after_label(lines: List[Tuple[str, int]], index: int, end: int, pattern: Pattern) -> str:
+    """
+    레이블 뒤의 값. 같은 줄에 값이 없으면 다음 줄 (표가 줄 단위로 끊긴 OCR 결과).
+    다음 줄은 줄 전체가 값 하나(pattern과 완전히 일치)일 때만 사용합니다.
+    (예: "구분 매출액 영업이익" 다음의 "2023 1,000 200"은 표 행이므로 사용하지 않음)
+    """
+    rest = _LABEL_SUFFIX.sub("", lines[index][0][end:], count=1).strip()
+    if rest:
+        return rest
+    for line, _ in lines[index + 1:index + 2]:
+        if pattern.fullmatch(line):
+            return line
+    return ""
+
+
+def _find_amount(lines: List[Tuple[str, int]], labels: List[Pattern]) -> Optional[int]:
+    for label in labels:
+        for index, (line, multiplier) in enumerate(lines):
+            for match in label.finditer(line):
+                if _OTHER_ITEM_SUFFIX.match(line[match.end():]):
+                    continue
+                value = parse_amount(_value_after_label(lines, index, match.end(), _SINGLE_AMOUNT_PATTERN), multiplier)
+                if value is not None:
+                    return value
+    return None
+
+
+def _find_after_label(lines: List[Tuple[str, int]], label: Pattern, pattern: Pattern) -> Optional[re.Match]:
+    for index, (line, _) in enumerate(lines):
+        match = label.search(line)
+        if match:
+            value = pattern.match(_value_after_label(lines, index, match.end(), pattern))
+            if value:
+                return value
+    return None
+
+
+def _find_text(lines: List[Tuple[str, int]], label: Pattern) -> Optional[str]:
+    for line, _ in lines:
+        for match in label.finditer(line):
+            # 레이블이 단어 중간(예: "주소지변경")이 아니고 바로 뒤에 콜론이 와야 함
+            value = _TEXT_VALUE_PATTERN.match(line[match.end():])
+            if not value:
+                continue
+            text = _NEXT_LABEL_PATTERN.split(value.group(1), maxsplit=1)[0].strip()
+            if text and len(text) <= TEXT_VALUE_MAX_CHARS:
+                return text
+    return None
+
+
+def extract_with_rules(text: str) -> RuleExtractionResult:
+    """
+    형식이 정해진 필드(사업자등록번호, 설립일, 직원 수, 재무제표 합계 금액, 양식의 "레이블: 값" 항목)를
+    미리 컴파일한 패턴으로 추출합니다. 찾지 못한 필드는 결과에 포함하지 않습니다.
+
+    Args:
+        text: OCR 텍스트 (압축 전 전체 텍스트 권장)
+    """
+    result = RuleExtractionResult()
+    lines = _lines_with_units(text)
+
+    # 사업자등록번호: 레이블 뒤 값을 우선, 없으면 문서 안의 ###-##-##### 형식
+    number = _find_after_label(lines, _BUSINESS_NUMBER_LABEL, _BUSINESS_NUMBER_PATTERN)
+    if not number:
+        number = _BUSINESS_NUMBER_PATTERN.search(text)
+    if number:
+        result.data["business_number"] = "-".join(number.groups())
+
+    established = _find_after_label(lines, _ESTABLISHMENT_LABEL, _DATE_PATTERN)
+    if established:
+        normalized = _normalize_date(*established.groups())
+        if normalized:
+            result.data["establishment_date"] = normalized
+
+    employees = _find_after_label(lines, _EMPLOYEE_LABEL, _COUNT_PATTERN)
+    if employees:
+        result.data["employee_count"] = int(employees.group(1).replace(",", ""))
+
+    for field_name, labels in AMOUNT_FIELD_LABELS.items():
+        value = _find_amount(lines, labels)
+        if value is not None:
+            result.data[field_name] = value
+
+    for field_name, label in TEXT_FIELD_LABELS.items():
+        value = _find_text(lines, label)
+        if value:
+            result.data[field_name] = value
+
+    return result
@@ -1,19 +1,90 @@
-import os
-from typing import Dict, Any, Optional
-import google.generativeai as genai
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 import json
+import os
+
+from app.services.llm_client import estimate_tokens, get_llm_client, strip_code_block
+
+
+# 추출할 필드 (필드명 -> 설명)
+EXTRACTION_FIELDS = {
+    "company_name": "회사명",
+    "business_number": "사업자등록번호",
+    "ceo_name": "대표자명",
+    "establishment_date": "설립일 (YYYY-MM-DD 형식)",
+    "industry": "업종",
+    "address": "주소",
+    "revenue": "매출액 (숫자만, 단위: 원)",
+    "operating_profit": "영업이익 (숫자만, 단위: 원)",
+    "net_profit": "순이익 (숫자만, 단위: 원)",
+    "total_assets": "총자산 (숫자만, 단위: 원)",
+    "total_liabilities": "총부채 (숫자만, 단위: 원)",
+    "equity": "자본금 (숫자만, 단위: 원)",
+    "employee_count": "직원 수 (숫자만)",
+    "main_products": "주요 제품/서비스",
+    "loan_purpose": "대출 목적",
+    "loan_amount": "대출 신청 금액 (숫자만, 단위: 원)",
+}
+
+NUMERIC_FIELDS = [
+    "revenue",
+    "operating_profit",
+    "net_profit",
+    "total_assets",
+    "total_liabilities",
+    "equity",
+    "employee_count",
+    "loan_amount",
+]
+
+# 여러 문서를 한 번에 추출할 때의 요청당 토큰 예산과 최대 문서 수
+LLM_BATCH_TOKEN_BUDGET = int(os.getenv("LLM_BATCH_TOKEN_BUDGET", "30000"))
+LLM_BATCH_MAX_DOCUMENTS = int(os.getenv("LLM_BATCH_MAX_DOCUMENTS", "8"))
+
+
+@dataclass
+class BatchExtractionResult:
+    """여러 문서 추출 결과: 문서 키별 추출 데이터와 실패 사유"""
+
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    requests: int = 0  # LLM 호출 횟수 (재시도 포함)
+
+
+def _field_instructions(fields: Optional[List[str]] = None) -> str:
+    fields = fields or list(EXTRACTION_FIELDS)
+    return "\n".join(f"- {name}: {EXTRACTION_FIELDS[name]}" for name in fields)
 
 
 class StructuredDataService:
     """문서 텍스트에서 구조화된 데이터를 추출하는 서비스"""
 
     def __init__(self):
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        # gemini-2.0-flash: 최신 무료 모델, 빠르고 강력함
-        self.model = genai.GenerativeModel("gemini-2.0-flash")
+        # 프로세스에서 공유하는 LLM 클라이언트 (설정과 연결을 재사용)
+        self.llm_client = get_llm_client()
+
+    def _normalize(self, structured_data: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """추출 대상 필드만 남기고 숫자 필드 타입을 변환합니다."""
+        structured_data = {name: structured_data.get(name) for name in (fields or EXTRACTION_FIELDS)}
+
+        for field_name in NUMERIC_FIELDS:
+            if structured_data.get(field_name) is not None:
+                try:
+                    # 문자열인 경우 쉼표 제거 후 숫자 변환
+                    if isinstance(structured_data[field_name], str):
+                        structured_data[field_name] = int(
+                            structured_data[field_name].replace(",", "")
+                        )
+                except (ValueError, AttributeError):
+                    structured_data[field_name] = None
+
+        return structured_data
 
     def extract_document_data(
-        self, document_text: str, document_type: str = "기업 대출 신청서"
+        self,
+        document_text: str,
+        document_type: str = "기업 대출 신청서",
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         문서 텍스트에서 구조화된 데이터를 추출합니다.
@@ -21,6 +92,7 @@ class StructuredDataService:
         Args:
             document_text: OCR로 추출된 문서 텍스트
             document_type: 문서 유형
+            fields: 추출할 필드 (None이면 전체, 규칙 추출 후 남은 필드만 요청할 때 사용)
 
         Returns:
             Dict[str, Any]: 추출된 구조화된 데이터
@@ -31,22 +103,7 @@ class StructuredDataService:
 이 텍스트에서 아래 정보를 추출하여 JSON 형식으로 반환해주세요.
 
 추출할 정보:
-- company_name: 회사명
-- business_number: 사업자등록번호
-- ceo_name: 대표자명
-- establishment_date: 설립일 (YYYY-MM-DD 형식)
-- industry: 업종
-- address: 주소
-- revenue: 매출액 (숫자만, 단위: 원)
-- operating_profit: 영업이익 (숫자만, 단위: 원)
-- net_profit: 순이익 (숫자만, 단위: 원)
-- total_assets: 총자산 (숫자만, 단위: 원)
-- total_liabilities: 총부채 (숫자만, 단위: 원)
-- equity: 자본금 (숫자만, 단위: 원)
-- employee_count: 직원 수 (숫자만)
-- main_products: 주요 제품/서비스
-- loan_purpose: 대출 목적
-- loan_amount: 대출 신청 금액 (숫자만, 단위: 원)
+{_field_instructions(fields)}
 
 정보가 없는 경우 null을 반환해주세요.
 숫자 필드는 쉼표 없이 숫자만 반환해주세요.
@@ -57,52 +114,15 @@ class StructuredDataService:
 """
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=0,
-                )
-            )
-
-            result = response.text
+            result = self.llm_client.generate_sync(prompt, temperature=0)
 
             if not result:
                 raise ValueError("LLM 응답이 비어있습니다.")
 
             # JSON 코드 블록 제거 (```json ... ``` 형식)
-            result = result.strip()
-            if result.startswith("```json"):
-                result = result[7:]
-            elif result.startswith("```"):
-                result = result[3:]
-            if result.endswith("```"):
-                result = result[:-3]
-            result = result.strip()
-
-            structured_data = json.loads(result)
-
-            # 숫자 필드 타입 변환
-            numeric_fields = [
-                "revenue",
-                "operating_profit",
-                "net_profit",
-                "total_assets",
-                "total_liabilities",
-                "equity",
-                "employee_count",
-                "loan_amount",
-            ]
-
-            for field in numeric_fields:
-                if field in structured_data and structured_data[field] is not None:
-                    try:
-                        # 문자열인 경우 쉼표 제거 후 숫자 변환
-                        if isinstance(structured_data[field], str):
-                            structured_data[field] = int(
-                                structured_data[field].replace(",", "")
-                            )
-                    except (ValueError, AttributeError):
-                        structured_data[field] = None
+            result = strip_code_block(result)
+
+            structured_data = self._normalize(json.loads(result), fields)
 
             print(f"[StructuredDataService] 추출된 필드 수: {len([k for k, v in structured_data.items() if v is not None])}")
 
@@ -112,3 +132,138 @@ class StructuredDataService:
             raise Exception(f"LLM 응답 JSON 파싱 실패: {str(e)}")
         except Exception as e:
             raise Exception(f"구조화된 데이터 추출 실패: {str(e)}")
+
+    def _batch_prompt(
+        self, documents: Dict[str, str], document_type: str, fields: Optional[List[str]] = None
+    ) -> str:
+        sections = "\n\n".join(
+            f"<<<DOCUMENT id={key}>>>\n{text}\n<<<END DOCUMENT id={key}>>>"
+            for key, text in documents.items()
+        )
+        return f"""
+다음은 {document_type} {len(documents)}건에서 추출된 텍스트입니다.
+각 문서는 <<<DOCUMENT id=...>>> 와 <<<END DOCUMENT id=...>>> 사이에 있습니다.
+문서마다 아래 정보를 따로 추출하고, 다른 문서의 내용을 섞지 마세요.
+
+추출할 정보:
+{_field_instructions(fields)}
+
+다음 형식의 JSON으로 응답해주세요 (모든 문서를 빠짐없이 포함):
+
+{{
+  "documents": [
+    {{"id": "문서 id", "data": {{"company_name": "...", "revenue": 1000000000, "...": null}}}}
+  ]
+}}
+
+정보가 없는 경우 null을 반환해주세요.
+숫자 필드는 쉼표 없이 숫자만 반환해주세요.
+반드시 JSON 형식으로만 응답하고, 다른 텍스트는 포함하지 마세요.
+
+{sections}
+"""
+
+    @staticmethod
+    def _union_fields(field_lists: List[Optional[List[str]]]) -> Optional[List[str]]:
+        """묶인 문서들이 요청하는 필드의 합집합 (하나라도 전체를 요청하면 None)"""
+        if any(fields is None for fields in field_lists):
+            return None
+        requested = set().union(*field_lists)
+        return [name for name in EXTRACTION_FIELDS if name in requested]
+
+    def pack_batches(
+        self,
+        documents: Dict[str, str],
+        token_budget: int = LLM_BATCH_TOKEN_BUDGET,
+        max_documents: int = LLM_BATCH_MAX_DOCUMENTS,
+    ) -> List[List[str]]:
+        """
+        문서를 요청 단위로 묶습니다. 공통 지시문과 문서 텍스트의 추정 토큰 수가 예산을 넘지 않도록
+        순서대로 채우며, 혼자서 예산을 넘는 문서는 단독 요청이 됩니다.
+        """
+        overhead = estimate_tokens(self._batch_prompt({}, ""))
+        batches: List[List[str]] = []
+        current: List[str] = []
+        used = overhead
+
+        for key, text in documents.items():
+            # 구분자 토큰 포함
+            tokens = estimate_tokens(text) + 20
+            if current and (used + tokens > token_budget or len(current) >= max_documents):
+                batches.append(current)
+                current, used = [], overhead
+            current.append(key)
+            used += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _parse_batch_response(
+        self, text: str, expected: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """배치 응답을 파싱하여 요청한 문서 키와 매칭합니다. 형식이 맞지 않는 항목은 버립니다."""
+        parsed = json.loads(strip_code_block(text))
+        entries = parsed.get("documents", []) if isinstance(parsed, dict) else parsed
+
+        results = {}
+        for entry in entries or []:
+            if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+                continue
+            key = str(entry.get("id", "")).strip()
+            # 요청하지 않은 id나 중복 응답은 무시 (다른 문서 결과가 섞이는 것 방지)
+            if key in expected and key not in results:
+                results[key] = self._normalize(entry["data"], fields)
+        return results
+
+    def extract_documents_batch(
+        self,
+        documents: Dict[str, str],
+        document_type: str = "기업 대출 신청서",
+        token_budget: int = LLM_BATCH_TOKEN_BUDGET,
+        max_documents: int = LLM_BATCH_MAX_DOCUMENTS,
+        fields: Optional[Dict[str, List[str]]] = None,
+    ) -> BatchExtractionResult:
+        """
+        여러 문서를 토큰 예산 안에서 묶어 한 번의 요청으로 추출합니다.
+        응답에서 빠졌거나 형식이 잘못된 문서는 문서별로 다시 요청합니다.
+
+        Args:
+            documents: 문서 키(예: 문서 ID) -> OCR 텍스트
+            document_type: 문서 유형
+            fields: 문서 키별 추출할 필드 (없으면 전체). 묶음 요청에는 묶인 문서들의 필드를 합쳐 요청합니다.
+
+        Returns:
+            BatchExtractionResult: 문서 키별 추출 데이터와 실패 사유
+        """
+        outcome = BatchExtractionResult()
+        documents = {str(key): text for key, text in documents.items()}
+        fields = {str(key): value for key, value in (fields or {}).items()}
+
+        for batch in self.pack_batches(documents, token_budget, max_documents):
+            missing = batch
+            if len(batch) > 1:
+                batch_fields = self._union_fields([fields.get(key) for key in batch])
+                try:
+                    outcome.requests += 1
+                    response = self.llm_client.generate_sync(
+                        self._batch_prompt({key: documents[key] for key in batch}, document_type, batch_fields),
+                        temperature=0,
+                    )
+                    results = self._parse_batch_response(response, batch, batch_fields)
+                    outcome.results.update(results)
+                    missing = [key for key in batch if key not in results]
+                except Exception as e:
+                    print(f"[StructuredDataService] 배치 추출 실패 ({len(batch)}건), 문서별로 재시도: {str(e)}")
+
+                print(f"[StructuredDataService] 배치 추출: {len(batch)}건 중 {len(batch) - len(missing)}건 성공")
+
+            # 빠진 문서는 단독으로 재요청
+            for key in missing:
+                try:
+                    outcome.requests += 1
+                    outcome.results[key] = self.extract_document_data(documents[key], document_type, fields.get(key))
+                except Exception as e:
+                    outcome.errors[key] = str(e)
+
+        return outcome
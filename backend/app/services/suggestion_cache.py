@@ -0,0 +1,139 @@
+import asyncio
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+# 산업별 추가 정보 제안 캐시 설정
+SUGGESTION_CACHE_TTL = float(os.getenv("SUGGESTION_CACHE_TTL", str(24 * 3600)))  # 이 시간 동안은 그대로 사용
+SUGGESTION_CACHE_MAX_STALE = float(os.getenv("SUGGESTION_CACHE_MAX_STALE", str(7 * 24 * 3600)))  # 이 시간까지는 오래된 값을 주면서 백그라운드 갱신
+SUGGESTION_CACHE_MAX_ENTRIES = int(os.getenv("SUGGESTION_CACHE_MAX_ENTRIES", "512"))
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_industry(industry: Optional[str]) -> str:
+    """
+    산업명을 캐시 키로 정규화합니다.
+    전각/반각(NFKC), 대소문자, 공백, 문장부호 차이를 무시합니다. (예: "자동차 부품 제조업" == "자동차부품제조업")
+    """
+    if not industry:
+        return ""
+    normalized = unicodedata.normalize("NFKC", industry).casefold()
+    return _NON_WORD.sub("", normalized)
+
+
+@dataclass
+class _Entry:
+    payload: Dict[str, Any]
+    created_at: float
+
+
+class SuggestionCache:
+    """
+    산업별 추가 정보 제안(LLM 응답)을 메모리에 보관하는 캐시.
+
+    - TTL 이내: 캐시된 값을 바로 반환
+    - TTL 경과 ~ max_stale 이내: 캐시된 값을 바로 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+    - 그 이후 또는 캐시 없음: LLM 응답을 기다림 (같은 산업의 동시 요청은 호출 하나를 공유)
+    """
+
+    def __init__(
+        self,
+        ttl: float = SUGGESTION_CACHE_TTL,
+        max_stale: float = SUGGESTION_CACHE_MAX_STALE,
+        max_entries: int = SUGGESTION_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    def _store(self, key: str, payload: Dict[str, Any]) -> None:
+        self._entries[key] = _Entry(payload=payload, created_at=time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str, loader: Callable[[], Awaitable[Dict[str, Any]]]) -> asyncio.Task:
+        """키에 대한 로드 작업을 시작하거나, 이미 진행 중인 작업을 반환합니다."""
+        task = self._tasks.get(key)
+        if task is None:
+            async def run():
+                payload = await loader()
+                self._store(key, payload)
+                return payload
+
+            task = asyncio.ensure_future(run())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return task
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        if key in self._tasks:
+            return
+
+        def log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                print(f"[SuggestionCache] '{key}' 백그라운드 갱신 실패: {str(task.exception())}")
+
+        self._load(key, loader).add_done_callback(log_failure)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        캐시된 제안을 반환하거나 loader로 생성합니다.
+        loader가 실패하면 예외를 그대로 전달하며, 실패한 결과는 캐시하지 않습니다.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.time() - entry.created_at
+            if age <= self.ttl:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry.payload
+            if age <= self.max_stale:
+                self._stale_hits += 1
+                self._entries.move_to_end(key)
+                self._refresh_in_background(key, loader)
+                return entry.payload
+
+        self._misses += 1
+        # 요청이 취소되어도 같은 산업을 기다리는 다른 요청을 위해 생성은 계속 진행
+        return await asyncio.shield(self._load(key, loader))
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+            "refreshing": len(self._tasks),
+            "ttl": self.ttl,
+            "max_stale": self.max_stale,
+        }
+
+
+_suggestion_cache: Optional[SuggestionCache] = None
+
+
+def get_suggestion_cache() -> SuggestionCache:
+    """프로세스 전체에서 공유하는 산업별 제안 캐시"""
+    global _suggestion_cache
+
+    if _suggestion_cache is None:
+        _suggestion_cache = SuggestionCache()
+    return _suggestion_cache
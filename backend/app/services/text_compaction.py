@@ -0,0 +1,289 @@
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.services.llm_client import CHARS_PER_TOKEN, estimate_tokens
+from app.services.ocr_service import OCRResult
+
+
+# 구조화 추출 프롬프트에 넣을 문서 텍스트의 토큰 예산 (0이면 압축하지 않음)
+EXTRACTION_TEXT_TOKEN_BUDGET = int(os.getenv("EXTRACTION_TEXT_TOKEN_BUDGET", "8000"))
+
+# 머리글/바닥글 후보로 볼 페이지 위/아래 줄 수와, 반복으로 판단할 페이지 비율
+HEADER_FOOTER_LINES = 3
+HEADER_FOOTER_MIN_PAGE_RATIO = 0.5
+# 머리글/바닥글로 볼 최대 줄 길이 (긴 본문 줄은 반복되어도 제거하지 않음)
+HEADER_FOOTER_MAX_CHARS = 80
+
+# 빈 줄 없이 긴 OCR 텍스트를 나눌 영역당 최대 줄 수
+MAX_REGION_LINES = 8
+
+# 추출 대상 필드와 관련된 키워드 가중치 (공백을 제거한 텍스트에서 검색)
+KEYWORD_WEIGHTS: Dict[str, float] = {
+    "사업자등록번호": 4.0,
+    "매출액": 3.0,
+    "영업이익": 3.0,
+    "당기순이익": 3.0,
+    "순이익": 1.0,
+    "자산총계": 3.0,
+    "총자산": 3.0,
+    "부채총계": 3.0,
+    "총부채": 3.0,
+    "자본총계": 3.0,
+    "자본금": 3.0,
+    "상호": 2.0,
+    "회사명": 2.0,
+    "법인명": 2.0,
+    "대표자": 2.0,
+    "대표이사": 2.0,
+    "설립일": 2.0,
+    "개업연월일": 2.0,
+    "업종": 2.0,
+    "업태": 2.0,
+    "소재지": 2.0,
+    "주소": 2.0,
+    "종업원": 2.0,
+    "직원수": 2.0,
+    "주요제품": 2.0,
+    "대출목적": 2.0,
+    "자금용도": 2.0,
+    "신청금액": 2.0,
+    "대출금액": 2.0,
+}
+
+# 금액으로 보이는 숫자 (1,234,567 또는 4자리 이상)
+_AMOUNT_PATTERN = re.compile(r"\d{1,3}(?:,\d{3})+|\d{4,}")
+_WHITESPACE_PATTERN = re.compile(r"[ \t 　]+")
+_PAGE_MARKER_PATTERN = re.compile(r"^--- 페이지 (\d+) ---$")
+# 머리글/바닥글 줄의 처음이나 끝에 있는 쪽 번호 토큰 ("- 3 -", "3 / 10", "Page 3 of 10", "3쪽").
+# 금액·수량일 수도 있으므로 페이지 순서대로 증가하는 번호로 확인된 경우에만 쪽 번호로 봄
+_PAGE_NUMBER_TOKEN = r"(?:page\s*)?[-–—]?\s*(\d{1,3})\s*(?:(?:/|of)\s*\d{1,3})?\s*[-–—]?\s*(?:쪽|페이지)?"
+_LEADING_PAGE_NUMBER = re.compile(rf"^{_PAGE_NUMBER_TOKEN}(?=\s|$)", re.IGNORECASE)
+_TRAILING_PAGE_NUMBER = re.compile(rf"(?:^|(?<=\s)){_PAGE_NUMBER_TOKEN}$", re.IGNORECASE)
+_LETTER_PATTERN = re.compile(r"[^\W\d_]")
+# 결과 텍스트에서 영역 사이 구분자("\n\n")가 차지하는 토큰
+_SEPARATOR_TOKENS = estimate_tokens("\n\n")
+
+
+@dataclass
+class TextRegion:
+    page_number: int
+    index: int  # 문서 내 순서
+    text: str
+    score: float
+    tokens: int
+
+
+@dataclass
+class CompactionResult:
+    """압축된 문서 텍스트와 압축 통계"""
+
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+    total_regions: int
+    kept_regions: int
+    removed_header_footer_lines: int
+
+    @property
+    def ratio(self) -> float:
+        """압축률 (압축 후 토큰 / 원본 토큰, 1.0이면 그대로)"""
+        if not self.original_tokens:
+            return 1.0
+        return round(self.compacted_tokens / self.original_tokens, 3)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "original_tokens": self.original_tokens,
+            "compacted_tokens": self.compacted_tokens,
+            "ratio": self.ratio,
+            "total_regions": self.total_regions,
+            "kept_regions": self.kept_regions,
+            "removed_header_footer_lines": self.removed_header_footer_lines,
+        }
+
+
+def _clean_lines(text: str) -> List[str]:
+    return [_WHITESPACE_PATTERN.sub(" ", line).strip() for line in text.splitlines()]
+
+
+def _edge_lines(lines: List[str]) -> List[str]:
+    content = [line for line in lines if line and len(line) <= HEADER_FOOTER_MAX_CHARS]
+    return content[:HEADER_FOOTER_LINES] + content[-HEADER_FOOTER_LINES:]
+
+
+def _page_number_keys(line: str, page_number: int) -> Set[Tuple[str, int]]:
+    """
+    줄의 처음이나 끝에 쪽 번호 토큰이 있으면 (토큰을 #으로 바꾼 줄, 적힌 번호 - 페이지 번호)를 반환합니다.
+    쪽 번호가 맞다면 모든 페이지에서 같은 값이 나옵니다. (예: "감사보고서 - 3 -" -> ("감사보고서 #", 2))
+    """
+    keys = set()
+    for match in (_LEADING_PAGE_NUMBER.match(line), _TRAILING_PAGE_NUMBER.search(line)):
+        if match:
+            template = (line[:match.start()] + "#" + line[match.end():]).strip()
+            keys.add((template, int(match.group(1)) - page_number))
+    return keys
+
+
+def _remove_headers_footers(pages: List[tuple]) -> int:
+    """
+    여러 페이지에 반복되는 머리글/바닥글과 쪽 번호 줄을 제거합니다. 제거한 줄 수를 반환합니다.
+    - 머리글/바닥글: 글자가 있고 여러 페이지에서 완전히 같은 줄
+    - 쪽 번호: 쪽 번호 토큰 외에는 같고, 그 번호가 페이지 순서대로 증가하는 줄
+    숫자가 다른 표 행(예: "자산총계 12,345,678")은 반복으로 보지 않습니다.
+    """
+    repeated, page_number_keys = set(), set()
+    if len(pages) >= 2:
+        counts, key_counts = Counter(), Counter()
+        for page_number, lines in pages:
+            edges = _edge_lines(lines)
+            counts.update({line for line in edges if _LETTER_PATTERN.search(line)})
+            key_counts.update(set().union(*(_page_number_keys(line, page_number) for line in edges)))
+        threshold = max(2, len(pages) * HEADER_FOOTER_MIN_PAGE_RATIO)
+        repeated = {line for line, count in counts.items() if count >= threshold}
+        page_number_keys = {key for key, count in key_counts.items() if count >= threshold}
+
+    removed = 0
+    for page_number, lines in pages:
+        edges = set(_edge_lines(lines))
+        for i, line in enumerate(lines):
+            if line not in edges:
+                continue
+            if line in repeated or _page_number_keys(line, page_number) & page_number_keys:
+                lines[i] = ""
+                removed += 1
+    return removed
+
+
+def _marker_tokens(page_number: int) -> int:
+    return estimate_tokens(f"--- 페이지 {page_number} ---") + _SEPARATOR_TOKENS
+
+
+def _score(text: str) -> float:
+    compact = text.replace(" ", "")
+    score = sum(weight for keyword, weight in KEYWORD_WEIGHTS.items() if keyword in compact)
+    # 금액이 많은 영역(재무제표 표)은 가산점
+    score += min(len(_AMOUNT_PATTERN.findall(text)), 10) * 0.3
+    return score
+
+
+def _split_regions(page_number: int, lines: List[str], start_index: int) -> List[TextRegion]:
+    """빈 줄 기준으로 문단을 나누고, 긴 문단은 MAX_REGION_LINES 줄 단위로 나눕니다."""
+    regions = []
+    block: List[str] = []
+
+    def flush():
+        for offset in range(0, len(block), MAX_REGION_LINES):
+            text = "\n".join(block[offset:offset + MAX_REGION_LINES])
+            regions.append(TextRegion(page_number, start_index + len(regions), text, _score(text), estimate_tokens(text)))
+        block.clear()
+
+    for line in lines:
+        if line:
+            block.append(line)
+        else:
+            flush()
+    flush()
+    return regions
+
+
+def _split_pages(text: str) -> List[tuple]:
+    """OCRResult.text 형식의 페이지 구분자로 텍스트를 (페이지 번호, 줄 목록)으로 나눕니다."""
+    pages = []
+    page_number, lines = 1, []
+    for line in _clean_lines(text):
+        marker = _PAGE_MARKER_PATTERN.match(line)
+        if marker:
+            if any(lines):
+                pages.append((page_number, lines))
+            page_number, lines = int(marker.group(1)), []
+        else:
+            lines.append(line)
+    if any(lines):
+        pages.append((page_number, lines))
+    return pages
+
+
+def _render(regions: List[TextRegion], page_markers: bool) -> str:
+    parts = []
+    current_page = None
+    for region in sorted(regions, key=lambda r: r.index):
+        if page_markers and region.page_number != current_page:
+            parts.append(f"--- 페이지 {region.page_number} ---")
+            current_page = region.page_number
+        parts.append(region.text)
+    return "\n\n".join(parts)
+
+
+def compact_text(
+    text: str,
+    token_budget: int = EXTRACTION_TEXT_TOKEN_BUDGET,
+    page_markers: bool = True,
+) -> CompactionResult:
+    """
+    OCR 텍스트를 구조화 추출에 필요한 부분 위주로 줄입니다.
+
+    1. 공백 정리, 반복되는 머리글/바닥글과 쪽 번호 제거
+    2. 문단(영역)별로 추출 대상 키워드와 금액 수로 점수 계산
+    3. 정리된 텍스트가 토큰 예산을 넘으면 점수가 높은 영역부터 예산 안에서 선택하고 원래 순서로 배치
+       (페이지 구분자와 영역 사이 구분자도 예산에 포함)
+
+    Args:
+        text: OCR 텍스트 (OCRResult.text 형식의 페이지 구분자 포함 가능)
+        token_budget: 압축 후 최대 추정 토큰 수 (0 이하이면 정리만 수행)
+        page_markers: 결과에 페이지 구분자를 넣을지 여부
+    """
+    original_tokens = estimate_tokens(text)
+    pages = _split_pages(text)
+    removed = _remove_headers_footers(pages)
+
+    regions: List[TextRegion] = []
+    for page_number, lines in pages:
+        regions.extend(_split_regions(page_number, lines, len(regions)))
+
+    def marker_cost(page_number: int, pages_used: set) -> int:
+        # 영역이 들어가는 첫 페이지마다 구분자 줄이 하나씩 추가됨
+        return _marker_tokens(page_number) if page_markers and page_number not in pages_used else 0
+
+    kept = regions
+    total = sum(region.tokens + _SEPARATOR_TOKENS for region in regions)
+    total += sum(marker_cost(page_number, set()) for page_number in {region.page_number for region in regions})
+    if token_budget > 0 and total > token_budget:
+        kept, used, pages_used = [], 0, set()
+        # 점수가 같으면 앞쪽 영역(회사 개요가 주로 앞에 있음) 우선
+        for region in sorted(regions, key=lambda r: (-r.score, r.index)):
+            cost = region.tokens + _SEPARATOR_TOKENS + marker_cost(region.page_number, pages_used)
+            if used + cost <= token_budget:
+                kept.append(region)
+                used += cost
+                pages_used.add(region.page_number)
+        if not kept and regions:
+            # 예산보다 큰 영역 하나뿐이면 점수가 가장 높은 영역을 예산 길이로 자름
+            best = max(regions, key=lambda r: (r.score, -r.index))
+            available = max(token_budget - marker_cost(best.page_number, set()), 0)
+            best.text = best.text[: int(available * CHARS_PER_TOKEN)]
+            kept = [best]
+
+    compacted = _render(kept, page_markers)
+    return CompactionResult(
+        text=compacted,
+        original_tokens=original_tokens,
+        compacted_tokens=estimate_tokens(compacted),
+        total_regions=len(regions),
+        kept_regions=len(kept),
+        removed_header_footer_lines=removed,
+    )
+
+
+def compact_ocr_result(
+    ocr_result: OCRResult,
+    token_budget: Optional[int] = None,
+) -> CompactionResult:
+    """OCRService 결과를 구조화 추출용 텍스트로 압축합니다."""
+    return compact_text(
+        ocr_result.text,
+        EXTRACTION_TEXT_TOKEN_BUDGET if token_budget is None else token_budget,
+        page_markers=ocr_result.page_markers,
+    )
@@ -0,0 +1,312 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.upload import UploadSession
+from app.services.blob_store import StoredBlob, get_blob_store
+from app.services.document_ingest import ALLOWED_EXTENSIONS, register_upload
+from app.services.ocr_cache import compute_file_hash
+
+# 이어받기 업로드 설정
+RESUMABLE_MAX_FILE_SIZE = int(os.getenv("RESUMABLE_MAX_FILE_SIZE", str(1024 * 1024 * 1024)))  # 1GB
+RESUMABLE_CHUNK_SIZE = int(os.getenv("RESUMABLE_CHUNK_SIZE", str(8 * 1024 * 1024)))  # 클라이언트 권장 조각 크기 (8MB)
+UPLOAD_MAX_CHUNK_SIZE = int(os.getenv("UPLOAD_MAX_CHUNK_SIZE", str(64 * 1024 * 1024)))  # 요청 하나로 받을 최대 크기
+UPLOAD_SESSION_TTL_HOURS = int(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24"))  # 마지막 업로드 후 세션 유지 시간
+# 조각을 쓰던 요청이 이 시간 안에 끝나지 않으면 (프로세스 종료 등) 다른 요청이 이어서 쓸 수 있음
+UPLOAD_WRITE_TIMEOUT_SECONDS = int(os.getenv("UPLOAD_WRITE_TIMEOUT_SECONDS", "300"))
+
+
+class UploadSessionError(Exception):
+    """업로드 세션 요청이 잘못된 경우"""
+
+
+class OffsetMismatchError(UploadSessionError):
+    """요청한 시작 위치가 서버가 받은 위치와 다른 경우 (클라이언트는 offset부터 다시 보내야 함)"""
+
+    def __init__(self, offset: int):
+        super().__init__(f"업로드 위치가 맞지 않습니다. 현재 위치: {offset}")
+        self.offset = offset
+
+
+class UploadInProgressError(UploadSessionError):
+    """같은 세션에 다른 요청이 조각을 쓰고 있는 경우 (클라이언트는 잠시 뒤 offset을 확인하고 다시 보내야 함)"""
+
+    def __init__(self, offset: int):
+        super().__init__(f"다른 요청이 이 업로드에 조각을 쓰고 있습니다. 현재 위치: {offset}")
+        self.offset = offset
+
+
+def _expires_at() -> datetime:
+    return datetime.utcnow() + timedelta(hours=UPLOAD_SESSION_TTL_HOURS)
+
+
+def expire_stale_sessions(db: Session) -> int:
+    """기간이 지난 미완료 세션을 만료 처리하고 임시 파일을 삭제합니다."""
+    stale = (
+        db.query(UploadSession)
+        .filter(UploadSession.status.in_(("open", "writing")), UploadSession.expires_at < datetime.utcnow())
+        .all()
+    )
+    for session in stale:
+        Path(session.temp_path).unlink(missing_ok=True)
+        session.status = "expired"
+
+    if stale:
+        db.commit()
+        print(f"[Upload] 만료된 업로드 세션 {len(stale)}개 정리")
+    return len(stale)
+
+
+def create_session(db: Session, filename: str, size: int) -> UploadSession:
+    """
+    이어받기 업로드 세션을 만듭니다.
+    조각은 임시 파일에 순서대로 이어 쓰고, 완료 시 내용 해시 경로로 옮깁니다.
+    """
+    file_ext = Path(filename).suffix.lower()
+    if file_ext not in ALLOWED_EXTENSIONS:
+        raise UploadSessionError(f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(ALLOWED_EXTENSIONS)}")
+    if size <= 0:
+        raise UploadSessionError("파일 크기가 올바르지 않습니다.")
+    if size > RESUMABLE_MAX_FILE_SIZE:
+        raise UploadSessionError(
+            f"파일 크기가 제한을 초과했습니다. (최대: {RESUMABLE_MAX_FILE_SIZE // (1024 * 1024)}MB)"
+        )
+
+    expire_stale_sessions(db)
+
+    temp_path = get_blob_store().new_temp_path()
+    temp_path.touch()
+
+    session = UploadSession(
+        id=uuid.uuid4().hex,
+        filename=filename,
+        file_ext=file_ext,
+        total_size=size,
+        received=0,
+        temp_path=str(temp_path),
+        status="open",
+        expires_at=_expires_at(),
+    )
+    db.add(session)
+    db.commit()
+    db.refresh(session)
+    return session
+
+
+async def write_range(
+    db: AsyncSession,
+    session: UploadSession,
+    start: int,
+    body: AsyncIterator[bytes],
+    length: Optional[int] = None,
+) -> int:
+    """
+    start 위치부터 받은 바이트를 임시 파일에 씁니다 (메모리에 모으지 않고 받은 만큼 바로 기록).
+    연결이 중간에 끊겨도 이미 쓴 바이트까지는 받은 것으로 기록하므로 클라이언트는 그 위치부터 이어서 보내면 됩니다.
+    쓰기 전에 세션을 writing 상태로 잠그므로, 같은 세션에 동시에 들어온 다른 요청은 바이트를 쓰기 전에 거절됩니다.
+
+    Args:
+        start: 이 조각의 시작 위치 (세션의 received와 같아야 함)
+        body: 요청 본문 스트림
+        length: 이 조각의 크기 (Content-Range로 알려준 경우)
+
+    Returns:
+        새로운 offset
+    """
+    limit = min(session.total_size - start, UPLOAD_MAX_CHUNK_SIZE)
+    if length is not None and length > limit:
+        raise UploadSessionError(f"조각 크기가 너무 큽니다. (최대: {limit} 바이트)")
+
+    writer_id = await _claim(db, session, start)
+
+    written = 0
+    try:
+        buffer = await asyncio.to_thread(open, session.temp_path, "r+b")
+        try:
+            await asyncio.to_thread(buffer.seek, start)
+            async for chunk in body:
+                if not chunk:
+                    continue
+                if written + len(chunk) > limit:
+                    raise UploadSessionError(f"조각 크기가 너무 큽니다. (최대: {limit} 바이트)")
+                await asyncio.to_thread(buffer.write, chunk)
+                written += len(chunk)
+        finally:
+            await asyncio.to_thread(buffer.close)
+    finally:
+        await _release(db, session, writer_id, start, written)
+
+    return start + written
+
+
+async def _claim(db: AsyncSession, session: UploadSession, start: int) -> str:
+    """
+    세션이 열려 있고 받은 위치가 start일 때만 writing 상태로 잠급니다 (조건부 UPDATE, 여러 프로세스에서도 하나만 성공).
+    잠금을 잡은 요청의 writer_id를 반환합니다.
+    """
+    writer_id = uuid.uuid4().hex
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(UploadSession)
+        .where(
+            UploadSession.id == session.id,
+            UploadSession.received == start,
+            or_(
+                UploadSession.status == "open",
+                # 쓰던 요청이 응답 없이 사라진 경우
+                and_(
+                    UploadSession.status == "writing",
+                    UploadSession.updated_at < now - timedelta(seconds=UPLOAD_WRITE_TIMEOUT_SECONDS),
+                ),
+            ),
+        )
+        .values(status="writing", writer_id=writer_id, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount == 1:
+        await db.refresh(session)
+        return writer_id
+
+    await db.refresh(session)
+    if session.status == "writing":
+        raise UploadInProgressError(session.received)
+    if session.status != "open":
+        raise UploadSessionError(f"업로드 세션이 열려 있지 않습니다: {session.status}")
+    raise OffsetMismatchError(session.received)
+
+
+async def _release(db: AsyncSession, session: UploadSession, writer_id: str, start: int, written: int) -> None:
+    """쓴 바이트만큼 받은 위치를 옮기고 잠금을 풉니다."""
+    values = {"status": "open", "writer_id": None, "updated_at": datetime.utcnow()}
+    if written:
+        values.update(received=start + written, expires_at=_expires_at())
+
+    result = await db.execute(
+        update(UploadSession)
+        .where(
+            UploadSession.id == session.id,
+            UploadSession.status == "writing",
+            UploadSession.writer_id == writer_id,
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    await db.refresh(session)
+    # 잠금 시간이 지나 다른 요청이 가져간 경우 이 요청이 쓴 바이트는 반영하지 않음
+    if result.rowcount != 1:
+        raise OffsetMismatchError(session.received)
+
+
+def _completed_document(db: Session, session: UploadSession) -> Optional[Document]:
+    if session.status == "completed" and session.document_id:
+        return db.query(Document).filter(Document.id == session.document_id).first()
+    return None
+
+
+def _claim_finalize(db: Session, session: UploadSession) -> bool:
+    """
+    세션을 finalizing 상태로 잠급니다 (조건부 UPDATE). 동시에 들어온 완료 요청 중 하나만 문서를 등록합니다.
+    다른 요청이 이미 완료했으면 False를 반환합니다.
+    """
+    now = datetime.utcnow()
+    updated = (
+        db.query(UploadSession)
+        .filter(
+            UploadSession.id == session.id,
+            UploadSession.received == UploadSession.total_size,
+            or_(
+                UploadSession.status == "open",
+                # 완료 처리하던 요청이 응답 없이 사라진 경우
+                and_(
+                    UploadSession.status == "finalizing",
+                    UploadSession.updated_at < now - timedelta(seconds=UPLOAD_WRITE_TIMEOUT_SECONDS),
+                ),
+            ),
+        )
+        .update({"status": "finalizing", "updated_at": now}, synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(session)
+    if updated == 1:
+        return True
+
+    if session.status == "completed":
+        return False
+    if session.status in ("writing", "finalizing"):
+        raise UploadInProgressError(session.received)
+    if session.status != "open":
+        raise UploadSessionError(f"업로드 세션이 열려 있지 않습니다: {session.status}")
+    raise UploadSessionError(f"업로드가 끝나지 않았습니다. ({session.received}/{session.total_size} 바이트)")
+
+
+def _commit_blob(db: Session, session: UploadSession) -> StoredBlob:
+    """
+    임시 파일을 내용 해시 경로로 옮깁니다. 옮긴 뒤 문서 등록이 실패해도 다시 완료 요청하면
+    기록해 둔 content_hash로 저장된 파일을 이어서 사용합니다 (임시 파일은 이미 없음).
+    """
+    blob_store = get_blob_store()
+    if session.content_hash:
+        path = blob_store.path_for(session.content_hash, session.file_ext)
+        if not path.exists():
+            raise UploadSessionError("업로드한 파일을 찾을 수 없습니다. 다시 업로드해 주세요.")
+        return StoredBlob(content_hash=session.content_hash, path=str(path), size=session.total_size, existed=True)
+
+    content_hash = compute_file_hash(session.temp_path)
+    blob = blob_store.commit(Path(session.temp_path), content_hash, session.file_ext, session.total_size)
+    session.content_hash = content_hash
+    db.commit()
+    return blob
+
+
+def finalize(db: Session, session: UploadSession) -> Document:
+    """
+    모든 바이트를 받은 세션을 문서로 등록합니다.
+    임시 파일을 조각 단위로 읽어 SHA-256을 계산하고 내용 해시 경로로 옮긴 뒤 추출 작업을 등록합니다.
+    이미 완료된 세션이면 생성된 문서를 그대로 반환합니다.
+    """
+    document = _completed_document(db, session)
+    if document:
+        return document
+    if session.received != session.total_size:
+        raise UploadSessionError(f"업로드가 끝나지 않았습니다. ({session.received}/{session.total_size} 바이트)")
+
+    if not _claim_finalize(db, session):
+        return _completed_document(db, session)
+
+    try:
+        blob = _commit_blob(db, session)
+        document = register_upload(db, session.filename, blob, session.file_ext)
+    except Exception:
+        # 다시 완료 요청할 수 있도록 열린 상태로 되돌림
+        db.rollback()
+        db.query(UploadSession).filter(
+            UploadSession.id == session.id, UploadSession.status == "finalizing"
+        ).update({"status": "open", "updated_at": datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+        db.refresh(session)
+        raise
+
+    session.status = "completed"
+    session.document_id = document.id
+    db.commit()
+    print(f"[Upload] 업로드 세션 {session.id} 완료: 문서 {document.id} ({session.total_size} 바이트)")
+    return document
+
+
+def abort(db: Session, session: UploadSession) -> None:
+    """업로드를 취소하고 임시 파일을 삭제합니다."""
+    if session.status != "open":
+        return
+    Path(session.temp_path).unlink(missing_ok=True)
+    session.status = "aborted"
+    db.commit()
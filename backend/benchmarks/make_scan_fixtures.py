@@ -0,0 +1,113 @@
+"""
+스캔 픽스처 생성: 텍스트 레이어가 있는 PDF 페이지를 래스터화한 뒤 스캔 품질 저하(기울어짐, 조명 불균일,
+노이즈, 번짐, JPEG 압축)를 입혀 이미지 + .txt 정답 쌍으로 저장합니다.
+
+디지털 PDF를 그대로 쓰면 노이즈 추정에 따른 디노이즈 생략/적용 경로가 실행되지 않으므로,
+벤치마크 기본 픽스처(benchmarks/fixtures/scans)는 이 스크립트로 만든 스캔 이미지를 사용합니다.
+같은 seed로 실행하면 같은 이미지가 만들어집니다.
+
+실행 방법 (backend 디렉토리에서):
+python -m benchmarks.make_scan_fixtures --source uploads --out benchmarks/fixtures/scans
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict
+
+import cv2
+import numpy as np
+
+DEFAULT_OUT_DIR = Path(__file__).parent / "fixtures" / "scans"
+
+# 품질 단계별 저하 설정
+SCAN_LEVELS: Dict[str, Dict[str, float]] = {
+    # 깨끗한 스캔: 노이즈 추정값이 낮아 fast 프로필에서 디노이즈를 건너뜀
+    "light": {"angle": 0.3, "shading": 0.03, "sigma": 1.0, "salt_pepper": 0.0, "blur": 0, "jpeg": 90},
+    # 일반적인 지점 스캐너 품질
+    "noisy": {"angle": 0.8, "shading": 0.10, "sigma": 10.0, "salt_pepper": 0.002, "blur": 3, "jpeg": 75},
+    # 팩스/복사본 수준
+    "heavy": {"angle": 1.5, "shading": 0.18, "sigma": 18.0, "salt_pepper": 0.008, "blur": 3, "jpeg": 60},
+}
+
+
+def degrade(gray: np.ndarray, level: str, seed: int) -> np.ndarray:
+    """그레이스케일 페이지 이미지에 스캔 품질 저하를 적용합니다."""
+    params = SCAN_LEVELS[level]
+    rng = np.random.default_rng(seed)
+    h, w = gray.shape[:2]
+
+    # 기울어짐
+    angle = params["angle"] * (1 if rng.random() < 0.5 else -1)
+    matrix = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    image = cv2.warpAffine(gray, matrix, (w, h), borderValue=255).astype(np.float32)
+
+    # 조명 불균일 (한쪽 모서리가 어두워지는 그라데이션)
+    if params["shading"]:
+        xs = np.linspace(0, 1, w, dtype=np.float32)
+        ys = np.linspace(0, 1, h, dtype=np.float32)
+        image *= 1.0 - params["shading"] * np.add.outer(ys, xs) / 2
+
+    if params["blur"]:
+        image = cv2.GaussianBlur(image, (int(params["blur"]), int(params["blur"])), 0)
+
+    # 센서 노이즈 + 점 잡음
+    if params["sigma"]:
+        image += rng.normal(0, params["sigma"], image.shape).astype(np.float32)
+    if params["salt_pepper"]:
+        mask = rng.random(image.shape)
+        image[mask < params["salt_pepper"] / 2] = 0
+        image[mask > 1 - params["salt_pepper"] / 2] = 255
+
+    image = np.clip(image, 0, 255).astype(np.uint8)
+
+    # JPEG 압축 손실
+    ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, int(params["jpeg"])])
+    return cv2.imdecode(encoded, cv2.IMREAD_GRAYSCALE) if ok else image
+
+
+def level_for(doc_index: int, page_number: int) -> str:
+    """문서/페이지마다 품질 단계를 돌아가며 지정합니다 (1페이지는 깨끗하게, 2페이지부터 노이즈)."""
+    if page_number == 1:
+        return "heavy" if doc_index % 2 else "light"
+    return "noisy"
+
+
+def normalize_truth(text: str) -> str:
+    # 텍스트 레이어의 합자(ﬁ 등)는 OCR 결과와 비교할 수 있도록 풀어 씀
+    return text.replace("ﬁ", "fi").replace("ﬂ", "fl")
+
+
+def main():
+    from app.services.ocr_service import OCRService, is_usable_text_layer, iter_pdf_pages
+
+    parser = argparse.ArgumentParser(description="스캔 픽스처 생성")
+    parser.add_argument("--source", default="uploads", help="텍스트 레이어가 있는 PDF 디렉토리")
+    parser.add_argument("--out", default=str(DEFAULT_OUT_DIR), help="픽스처 저장 디렉토리")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--max-pages", type=int, default=2, help="PDF당 최대 페이지 수")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ocr_service = OCRService(max_workers=1)
+
+    pdfs = sorted(Path(args.source).glob("*.pdf"))
+    for doc_index, pdf_path in enumerate(pdfs):
+        text_layer = ocr_service.extract_text_layer(str(pdf_path))
+        pages = [p for p, text in sorted(text_layer.items()) if is_usable_text_layer(text)][:args.max_pages]
+
+        for page_number, image in iter_pdf_pages(str(pdf_path), dpi=args.dpi, page_numbers=pages):
+            level = level_for(doc_index, page_number)
+            gray = np.array(image.convert("L"))
+            scanned = degrade(gray, level, seed=args.seed * 1000 + doc_index * 10 + page_number)
+
+            name = f"scan_{doc_index + 1:02d}_p{page_number}_{level}"
+            quality = int(SCAN_LEVELS[level]["jpeg"])
+            cv2.imwrite(str(out_dir / f"{name}.jpg"), scanned, [cv2.IMWRITE_JPEG_QUALITY, quality])
+            (out_dir / f"{name}.txt").write_text(normalize_truth(text_layer[page_number]) + "\n", encoding="utf-8")
+            print(f"  {name} ({pdf_path.name} {page_number}페이지)")
+
+
+if __name__ == "__main__":
+    main()
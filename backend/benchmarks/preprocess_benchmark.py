@@ -0,0 +1,168 @@
+"""
+OCR 전처리 프로필 벤치마크: 프로필별 페이지당 처리 시간과 OCR 문자 정확도를 비교합니다.
+
+픽스처 디렉토리 구성:
+- 이미지 파일 (png, jpg 등) + 같은 이름의 .txt 정답 파일
+- 텍스트 레이어가 있는 PDF: 텍스트 레이어를 정답으로 사용하고, 페이지를 래스터화하여 OCR
+
+기본 픽스처(benchmarks/fixtures/scans)는 깨끗한/노이즈/심한 노이즈 스캔 이미지와 정답 텍스트입니다
+(benchmarks/make_scan_fixtures.py로 생성). 디지털 PDF만으로는 디노이즈 생략/적용 경로가 실행되지 않습니다.
+
+실행 방법 (backend 디렉토리에서):
+python -m benchmarks.preprocess_benchmark
+python -m benchmarks.preprocess_benchmark --fixtures uploads
+python -m benchmarks.preprocess_benchmark --fixtures fixtures/ocr --profiles accurate fast --max-pages 3
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+from PIL import Image
+
+from app.services.ocr_service import (
+    PREPROCESS_PROFILES,
+    OCRService,
+    estimate_noise,
+    get_ocr_backend,
+    is_usable_text_layer,
+    iter_pdf_pages,
+)
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp"}
+
+DEFAULT_FIXTURE_DIR = Path(__file__).parent / "fixtures" / "scans"
+
+
+def normalize(text: str) -> str:
+    """정확도 비교를 위해 공백을 모두 제거합니다."""
+    return re.sub(r"\s+", "", text)
+
+
+def levenshtein(a: str, b: str) -> int:
+    """두 문자열의 편집 거리"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def char_accuracy(ocr_text: str, truth: str) -> float:
+    """문자 정확도 = 1 - 편집거리 / 정답 길이 (공백 제외, 0 이상)"""
+    ocr_text, truth = normalize(ocr_text), normalize(truth)
+    if not truth:
+        return 1.0 if not ocr_text else 0.0
+    return max(0.0, 1.0 - levenshtein(ocr_text, truth) / len(truth))
+
+
+def load_fixtures(fixture_dir: Path, dpi: int, max_pages: int) -> List[Tuple[str, Image.Image, str]]:
+    """(이름, 페이지 이미지, 정답 텍스트) 목록을 만듭니다."""
+    fixtures = []
+    ocr_service = OCRService(max_workers=1)
+
+    for path in sorted(fixture_dir.iterdir()):
+        suffix = path.suffix.lower()
+
+        if suffix in IMAGE_EXTENSIONS:
+            truth_path = path.with_suffix(".txt")
+            if not truth_path.exists():
+                print(f"  건너뜀 (정답 파일 없음): {path.name}")
+                continue
+            fixtures.append((path.name, Image.open(path).convert("RGB"), truth_path.read_text(encoding="utf-8")))
+
+        elif suffix == ".pdf":
+            text_layer = ocr_service.extract_text_layer(str(path))
+            pages = [p for p, text in sorted(text_layer.items()) if is_usable_text_layer(text)][:max_pages]
+            if not pages:
+                print(f"  건너뜀 (정답으로 쓸 텍스트 레이어 없음): {path.name}")
+                continue
+            for page_number, image in iter_pdf_pages(str(path), dpi=dpi, page_numbers=pages):
+                fixtures.append((f"{path.name}#{page_number}", image, text_layer[page_number]))
+
+    return fixtures
+
+
+def run(fixture_dir: Path, profiles: List[str], dpi: int, max_pages: int, lang: str) -> None:
+    print(f"픽스처 로드 중: {fixture_dir}")
+    fixtures = load_fixtures(fixture_dir, dpi, max_pages)
+    if not fixtures:
+        print("벤치마크할 픽스처가 없습니다.")
+        sys.exit(1)
+    print(f"총 {len(fixtures)}페이지\n")
+
+    backend = get_ocr_backend()
+    print(f"OCR 백엔드: {backend.name}")
+
+    # 페이지별 노이즈 추정값 (프로필의 skip_denoise_below와 비교해 디노이즈 생략 여부 결정)
+    noise_levels = [estimate_noise(np.array(image.convert("L"))) for _, image, _ in fixtures]
+    for (fixture_name, _, _), noise in zip(fixtures, noise_levels):
+        print(f"  {fixture_name}: 노이즈 추정 {noise:.2f}")
+    print()
+
+    rows = []
+    for name in profiles:
+        service = OCRService(max_workers=1, preprocess_profile=name)
+        threshold = PREPROCESS_PROFILES[name].skip_denoise_below
+        skipped = sum(1 for noise in noise_levels if threshold is not None and noise < threshold)
+        preprocess_seconds = 0.0
+        total_seconds = 0.0
+        accuracies = []
+
+        for fixture_name, image, truth in fixtures:
+            started = time.perf_counter()
+            processed = service.preprocess_image(image)
+            preprocessed = time.perf_counter()
+            text = backend.image_to_string(processed, lang=lang)
+            finished = time.perf_counter()
+
+            preprocess_seconds += preprocessed - started
+            total_seconds += finished - started
+            accuracies.append(char_accuracy(text, truth))
+
+        pages = len(fixtures)
+        rows.append((
+            name,
+            preprocess_seconds / pages * 1000,
+            total_seconds / pages * 1000,
+            sum(accuracies) / pages * 100,
+            skipped,
+        ))
+
+    print(f"{'프로필':<16}{'전처리 ms/페이지':>18}{'전체 ms/페이지':>18}{'문자 정확도 %':>16}{'디노이즈 생략':>14}")
+    for name, preprocess_ms, total_ms, accuracy, skipped in rows:
+        print(f"{name:<16}{preprocess_ms:>18.1f}{total_ms:>18.1f}{accuracy:>16.2f}{skipped:>14}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCR 전처리 프로필 벤치마크")
+    parser.add_argument(
+        "--fixtures",
+        default=str(DEFAULT_FIXTURE_DIR),
+        help="픽스처 디렉토리 (기본값: benchmarks/fixtures/scans)",
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(PREPROCESS_PROFILES),
+        choices=list(PREPROCESS_PROFILES),
+        help="비교할 전처리 프로필",
+    )
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--max-pages", type=int, default=5, help="PDF당 최대 페이지 수")
+    parser.add_argument("--lang", default="kor+eng")
+    args = parser.parse_args()
+
+    run(Path(args.fixtures), args.profiles, args.dpi, args.max_pages, args.lang)
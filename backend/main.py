@@ -1,16 +1,48 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from app.core.database import engine, Base
-from app.api import dashboard, documents, extraction, additional_info
+import os
+import threading
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
-# 환경 변수 로드
+# 환경 변수 로드 (모듈 수준 설정값이 .env를 읽을 수 있도록 app 모듈보다 먼저 로드)
 load_dotenv()
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from app.core.database import engine, dispose_async_engine
+from app.core.migrations import ensure_schema
+from app.api import dashboard, documents, extraction, additional_info, uploads
+from app.services.industry_knowledge import get_industry_knowledge
+from app.services.llm_client import get_llm_client
+
+# 스키마 버전 확인 (마이그레이션은 `python migrate.py`로 적용, AUTO_MIGRATE=1이면 여기서 적용)
+ensure_schema(engine)
+
+# 로컬 개발용: API 프로세스 안에서 실행할 추출 워커 수 (운영 환경에서는 0으로 두고 worker.py를 별도로 실행)
+EMBEDDED_WORKERS = int(os.getenv("EMBEDDED_WORKERS", "0"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # LLM 클라이언트는 시작 시 한 번만 설정하고 모든 요청에서 공유
+    get_llm_client()
+    # 산업 지식 파일은 시작 시 한 번 읽어 메모리에 색인
+    get_industry_knowledge()
+
+    stop_event = threading.Event()
+    if EMBEDDED_WORKERS > 0:
+        from app.services.extraction_worker import start_workers
+
+        start_workers(EMBEDDED_WORKERS, stop_event)
+        print(f"[Startup] 내장 추출 워커 {EMBEDDED_WORKERS}개 시작")
+
+    yield
+
+    stop_event.set()
+    await dispose_async_engine()
+
 
-app = FastAPI(title="Corporate Loan API", version="1.0.0")
+app = FastAPI(title="Corporate Loan API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -26,6 +58,7 @@ app.include_router(dashboard.router)
 app.include_router(documents.router)
 app.include_router(extraction.router)
 app.include_router(additional_info.router)
+app.include_router(uploads.router)
 
 @app.get("/")
 def read_root():
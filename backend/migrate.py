@@ -0,0 +1,39 @@
+"""
+데이터베이스 마이그레이션: schema_version에 기록되지 않은 마이그레이션을 순서대로 적용합니다.
+
+실행 방법:
+python migrate.py            # 미적용 마이그레이션 적용
+python migrate.py --status   # 현재 버전과 미적용 목록만 출력
+"""
+
+import argparse
+
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+from app.core.database import engine
+from app.core.migrations import LATEST_VERSION, apply_migrations, current_version, pending_migrations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터베이스 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="현재 스키마 버전과 미적용 마이그레이션만 출력")
+    args = parser.parse_args()
+
+    if args.status:
+        print(f"현재 스키마 버전: v{current_version(engine)} (최신 v{LATEST_VERSION})")
+        for migration in pending_migrations(engine):
+            print(f"  미적용 v{migration.version}: {migration.description}")
+        return
+
+    applied = apply_migrations(engine)
+    if applied:
+        print(f"마이그레이션 {len(applied)}개를 적용했습니다. 현재 버전: v{LATEST_VERSION}")
+    else:
+        print(f"적용할 마이그레이션이 없습니다. 현재 버전: v{LATEST_VERSION}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+문서 일괄 재처리: OCR 설정이나 추출 프롬프트를 바꾼 뒤 저장된 문서를 다시 추출합니다.
+
+실행 방법:
+python reprocess.py --status completed failed --from 2025-01-01 --to 2025-06-30 --workers 4
+python reprocess.py --ids 3 5 8
+python reprocess.py --resume 12     # 중단된 일괄 작업을 이어서 처리 (처리 중이던 문서도 바로 다시 처리)
+python reprocess.py --status failed --dry-run
+
+작업은 DB 작업 큐에 저장되므로 Ctrl+C로 중단해도 --resume으로 남은 문서부터 이어서 처리합니다.
+"""
+
+import argparse
+import signal
+import threading
+from datetime import date, datetime
+from typing import Union
+
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+from app.core.database import engine, SessionLocal
+from app.core.migrations import ensure_schema
+from app.models import document, job  # noqa: F401 (테이블 등록)
+from app.models.job import ExtractionBatch
+from app.services.job_queue import JobQueue
+from app.services.batch_reprocess import batch_progress, create_reprocess_batch, select_documents
+from app.services.extraction_worker import WORKER_CONCURRENCY, start_workers
+
+
+def parse_date(value: str) -> Union[date, datetime]:
+    """날짜만 지정하면 date로 반환합니다 (--to 2025-06-30은 그날 전체를 포함)."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 일괄 재처리")
+    parser.add_argument("--status", nargs="+", help="대상 문서 상태 (uploaded, processing, completed, failed)")
+    parser.add_argument("--from", dest="uploaded_from", type=parse_date, help="업로드 시작일 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)")
+    parser.add_argument("--to", dest="uploaded_to", type=parse_date, help="업로드 종료일 (YYYY-MM-DD이면 그날 전체 포함)")
+    parser.add_argument("--ids", nargs="+", type=int, help="대상 문서 ID 목록")
+    parser.add_argument("--resume", type=int, metavar="BATCH_ID", help="이어서 처리할 일괄 작업 ID")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKER_CONCURRENCY,
+        help=f"동시에 처리할 문서 수 (기본값: WORKER_CONCURRENCY={WORKER_CONCURRENCY})",
+    )
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="진행 상황 출력 간격 (초)")
+    parser.add_argument("--dry-run", action="store_true", help="대상 문서 수만 출력하고 종료")
+    args = parser.parse_args()
+
+    # 스키마 버전 확인 (마이그레이션은 `python migrate.py`로 적용)
+    ensure_schema(engine)
+
+    db = SessionLocal()
+    try:
+        if args.dry_run:
+            targets = select_documents(db, args.status, args.uploaded_from, args.uploaded_to, args.ids)
+            print(f"재처리 대상 문서: {len(targets)}개")
+            return
+
+        if args.resume:
+            batch = db.query(ExtractionBatch).filter(ExtractionBatch.id == args.resume).first()
+            if not batch:
+                parser.error(f"일괄 작업을 찾을 수 없습니다: {args.resume}")
+            # 이전 실행이 중단되며 남긴 처리 중 작업(heartbeat가 끊긴 작업)은 잠금 만료(JOB_VISIBILITY_TIMEOUT)를 기다리지 않고 바로 다시 처리
+            released = JobQueue().release_running(db, batch.id)
+            print(f"일괄 작업 {batch.id}을(를) 이어서 처리합니다. (중단된 작업 {released}개 다시 처리)")
+        else:
+            batch = create_reprocess_batch(db, args.status, args.uploaded_from, args.uploaded_to, args.ids)
+        batch_id = batch.id
+    finally:
+        db.close()
+
+    stop_event = threading.Event()
+
+    def shutdown(signum, frame):
+        print(f"종료 신호를 받았습니다. 진행 중인 문서를 마친 뒤 종료합니다. (이어서 처리: python reprocess.py --resume {batch_id})")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    threads = start_workers(args.workers, stop_event, batch_id=batch_id)
+
+    # 일괄 작업이 끝나거나 종료 신호를 받을 때까지 진행 상황 출력
+    while not stop_event.wait(args.progress_interval):
+        db = SessionLocal()
+        try:
+            progress = batch_progress(db, db.get(ExtractionBatch, batch_id))
+        finally:
+            db.close()
+
+        print(
+            f"[{progress['percent']:5.1f}%] 완료 {progress['succeeded']} / 실패 {progress['failed']} / "
+            f"처리 중 {progress['running']} / 대기 {progress['queued']} (전체 {progress['total']})"
+        )
+        if progress["done"]:
+            stop_event.set()
+
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1)
+
+    print(f"일괄 작업 {batch_id} 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+문서 추출 작업 워커: API 서버가 큐에 넣은 OCR + LLM 추출 작업을 처리합니다.
+
+실행 방법:
+python worker.py
+python worker.py --workers 4
+"""
+
+import argparse
+import signal
+import threading
+
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+from app.core.database import engine
+from app.core.migrations import ensure_schema
+from app.models import document, job  # noqa: F401 (테이블 등록)
+from app.services.extraction_worker import WORKER_CONCURRENCY, start_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 추출 작업 워커")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKER_CONCURRENCY,
+        help=f"동시에 처리할 작업 수 (기본값: WORKER_CONCURRENCY={WORKER_CONCURRENCY})",
+    )
+    args = parser.parse_args()
+
+    # 스키마 버전 확인 (마이그레이션은 `python migrate.py`로 적용)
+    ensure_schema(engine)
+
+    stop_event = threading.Event()
+
+    def shutdown(signum, frame):
+        print("종료 신호를 받았습니다. 진행 중인 작업을 마친 뒤 종료합니다...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    threads = start_workers(args.workers, stop_event)
+    print(f"워커 {len(threads)}개가 작업을 기다리는 중입니다.")
+
+    # 메인 스레드는 신호를 받을 수 있도록 짧게 대기하며 반복
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1)
+
+
+if __name__ == "__main__":
+    main()
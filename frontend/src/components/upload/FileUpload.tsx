@@ -1,5 +1,10 @@
 import { useState, useRef, ChangeEvent, DragEvent } from "react";
 import { documentsService, DocumentUploadResponse } from "../../services/documents";
+import { uploadsService } from "../../services/uploads";
+
+// 이 크기보다 큰 파일은 조각으로 나누어 이어받기 업로드
+const RESUMABLE_THRESHOLD = 20 * 1024 * 1024;
+const MAX_FILE_SIZE = 1024 * 1024 * 1024;
 
 interface FileUploadProps {
   onUploadSuccess: (response: DocumentUploadResponse) => void;
@@ -9,15 +14,15 @@ interface FileUploadProps {
 export default function FileUpload({ onUploadSuccess, onUploadError }: FileUploadProps) {
   const [uploading, setUploading] = useState(false);
   const [dragOver, setDragOver] = useState(false);
+  const [progress, setProgress] = useState<number | null>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
   const handleFileSelect = async (file: File) => {
     if (!file) return;
 
-    // 파일 크기 검증 (50MB)
-    const maxSize = 50 * 1024 * 1024;
-    if (file.size > maxSize) {
-      const errorMsg = "파일 크기는 50MB를 초과할 수 없습니다.";
+    // 파일 크기 검증 (1GB)
+    if (file.size > MAX_FILE_SIZE) {
+      const errorMsg = "파일 크기는 1GB를 초과할 수 없습니다.";
       onUploadError?.(errorMsg);
       return;
     }
@@ -42,7 +47,12 @@ export default function FileUpload({ onUploadSuccess, onUploadError }: FileUploa
 
     try {
       setUploading(true);
-      const response = await documentsService.uploadDocument(file);
+      const response =
+        file.size > RESUMABLE_THRESHOLD
+          ? await uploadsService.uploadFile(file, (uploaded, total) =>
+              setProgress(Math.round((uploaded / total) * 100))
+            )
+          : await documentsService.uploadDocument(file);
       onUploadSuccess(response);
     } catch (error) {
       const errorMsg = error instanceof Error ? error.message : "파일 업로드에 실패했습니다.";
@@ -50,6 +60,7 @@ export default function FileUpload({ onUploadSuccess, onUploadError }: FileUploa
       console.error("Upload error:", error);
     } finally {
       setUploading(false);
+      setProgress(null);
     }
   };
 
@@ -122,7 +133,9 @@ export default function FileUpload({ onUploadSuccess, onUploadError }: FileUploa
             <h3 className="text-lg font-medium text-gray-900 mb-2">
               업로드 중...
             </h3>
-            <p className="text-sm text-gray-600">잠시만 기다려주세요</p>
+            <p className="text-sm text-gray-600">
+              {progress !== null ? `${progress}% 전송됨` : "잠시만 기다려주세요"}
+            </p>
           </>
         ) : (
           <>
@@ -144,7 +157,7 @@ export default function FileUpload({ onUploadSuccess, onUploadError }: FileUploa
             </p>
             <div className="text-xs text-gray-500">
               <p>지원 형식: PDF, DOCX, PPT, 이미지</p>
-              <p>최대 파일 크기: 50MB</p>
+              <p>최대 파일 크기: 1GB (20MB 이상은 끊겨도 이어서 업로드)</p>
             </div>
           </>
         )}
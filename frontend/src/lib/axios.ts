@@ -75,8 +75,8 @@ export const httpClient = {
     return axiosInstance.post<T, T>(endpoint, data, config);
   },
 
-  put: async <T, D = unknown>(endpoint: string, data: D): Promise<T> => {
-    return axiosInstance.put<T, T>(endpoint, data);
+  put: async <T, D = unknown>(endpoint: string, data: D, config?: any): Promise<T> => {
+    return axiosInstance.put<T, T>(endpoint, data, config);
   },
 
   patch: async <T, D = unknown>(endpoint: string, data: D): Promise<T> => {
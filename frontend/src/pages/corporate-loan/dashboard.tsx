@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { FormEvent, useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import Button from "../../components/common/Button";
 import Layout from "../../components/common/Layout";
@@ -7,13 +7,19 @@ import { dashboardService, CompletedReport } from "../../services/dashboard";
 export default function Dashboard() {
   const navigate = useNavigate();
   const [reports, setReports] = useState<CompletedReport[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [searchInput, setSearchInput] = useState("");
+  const [query, setQuery] = useState("");
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchReports = async () => {
+      setIsLoading(true);
       try {
-        const data = await dashboardService.getCompletedReports();
-        setReports(data);
+        const page = await dashboardService.getCompletedReports({ q: query });
+        setReports(page.items);
+        setNextCursor(page.next_cursor);
       } catch (error) {
         console.error("리포트 목록 조회 실패:", error);
       } finally {
@@ -22,7 +28,29 @@ export default function Dashboard() {
     };
 
     fetchReports();
-  }, []);
+  }, [query]);
+
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await dashboardService.getCompletedReports({
+        q: query,
+        cursor: nextCursor,
+      });
+      setReports((prev) => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (error) {
+      console.error("리포트 목록 조회 실패:", error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
+  const handleSearch = (event: FormEvent<HTMLFormElement>) => {
+    event.preventDefault();
+    setQuery(searchInput.trim());
+  };
 
   const handleStartAnalysis = () => {
     navigate("/corporate-loan/upload");
@@ -45,8 +73,20 @@ export default function Dashboard() {
   return (
     <Layout title="Dashboard" subtitle="완료된 리포트 목록">
       <div className="bg-white border border-gray-200 rounded-lg shadow-sm overflow-hidden mb-6">
-        <div className="px-6 py-4 border-b border-gray-200">
+        <div className="px-6 py-4 border-b border-gray-200 flex flex-col sm:flex-row sm:items-center sm:justify-between gap-3">
           <h3 className="text-lg font-semibold text-gray-900">완료된 리포트</h3>
+          <form onSubmit={handleSearch} className="flex gap-2">
+            <input
+              type="text"
+              value={searchInput}
+              onChange={(e) => setSearchInput(e.target.value)}
+              placeholder="회사명 또는 산업 검색"
+              className="px-3 py-2 border border-gray-300 rounded-md text-sm focus:outline-none focus:ring-2 focus:ring-blue-500"
+            />
+            <Button type="submit" size="sm" variant="outline">
+              검색
+            </Button>
+          </form>
         </div>
 
         {isLoading ? (
@@ -108,6 +148,18 @@ export default function Dashboard() {
                 ))}
               </tbody>
             </table>
+            {nextCursor && (
+              <div className="px-6 py-4 border-t border-gray-200 text-center">
+                <Button
+                  onClick={handleLoadMore}
+                  size="sm"
+                  variant="outline"
+                  disabled={isLoadingMore}
+                >
+                  {isLoadingMore ? "불러오는 중..." : "더 보기"}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -9,9 +9,29 @@ export interface CompletedReport {
   status: string;
 }
 
+export interface CompletedReportPage {
+  items: CompletedReport[];
+  next_cursor: string | null;
+}
+
+export interface CompletedReportQuery {
+  cursor?: string | null;
+  q?: string;
+  limit?: number;
+}
+
 export const dashboardService = {
-  // 완료된 리포트 목록 조회
-  getCompletedReports: async (): Promise<CompletedReport[]> => {
-    return httpClient.get<CompletedReport[]>("/api/dashboard/completed-reports");
+  // 완료된 리포트 목록 조회 (커서 기반 페이지)
+  getCompletedReports: async (
+    query: CompletedReportQuery = {}
+  ): Promise<CompletedReportPage> => {
+    const params = new URLSearchParams();
+    if (query.cursor) params.set("cursor", query.cursor);
+    if (query.q) params.set("q", query.q);
+    if (query.limit) params.set("limit", String(query.limit));
+    const search = params.toString();
+    return httpClient.get<CompletedReportPage>(
+      `/api/dashboard/completed-reports${search ? `?${search}` : ""}`
+    );
   },
-};
\ No newline at end of file
+};
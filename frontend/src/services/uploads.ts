@@ -0,0 +1,97 @@
+import { httpClient } from "../lib/axios";
+import { DocumentUploadResponse } from "./documents";
+
+export interface UploadSession {
+  id: string;
+  filename: string;
+  size: number;
+  offset: number;
+  status: string; // open, writing, finalizing, completed, aborted, expired
+  chunk_size: number;
+  document_id: number | null;
+  expires_at: string;
+}
+
+// 한 조각이 실패했을 때 서버의 offset을 확인하고 다시 시도하는 횟수
+const MAX_CHUNK_RETRIES = 5;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+export const uploadsService = {
+  // 업로드 세션 생성
+  createSession: async (file: File): Promise<UploadSession> => {
+    return httpClient.post<UploadSession>("/api/uploads", {
+      filename: file.name,
+      size: file.size,
+    });
+  },
+
+  // 서버가 받은 위치 조회
+  getSession: async (uploadId: string): Promise<UploadSession> => {
+    return httpClient.get<UploadSession>(`/api/uploads/${uploadId}`);
+  },
+
+  // 조각 업로드 (start부터 chunk 크기만큼)
+  uploadChunk: async (
+    uploadId: string,
+    chunk: Blob,
+    start: number,
+    total: number
+  ): Promise<UploadSession> => {
+    return httpClient.put<UploadSession, Blob>(`/api/uploads/${uploadId}`, chunk, {
+      headers: {
+        "Content-Type": "application/octet-stream",
+        "Content-Range": `bytes ${start}-${start + chunk.size - 1}/${total}`,
+      },
+      timeout: 300000,
+    });
+  },
+
+  // 업로드 완료 (문서 등록 및 추출 시작)
+  completeUpload: async (uploadId: string): Promise<DocumentUploadResponse> => {
+    return httpClient.post<DocumentUploadResponse>(
+      `/api/uploads/${uploadId}/complete`,
+      undefined,
+      { timeout: 300000 }
+    );
+  },
+
+  /**
+   * 파일을 조각으로 나누어 업로드합니다.
+   * 조각 전송이 실패하면 서버가 받은 위치를 조회해 그 위치부터 이어서 보냅니다.
+   */
+  uploadFile: async (
+    file: File,
+    onProgress?: (uploaded: number, total: number) => void
+  ): Promise<DocumentUploadResponse> => {
+    let session = await uploadsService.createSession(file);
+    let offset = session.offset;
+    let retries = 0;
+    let resync = false;
+
+    while (offset < file.size) {
+      try {
+        // 실패한 뒤에는 서버가 받은 위치를 먼저 확인 (조회 실패도 같은 재시도 횟수로 처리)
+        if (resync) {
+          session = await uploadsService.getSession(session.id);
+          offset = session.offset;
+          resync = false;
+          if (offset >= file.size) break;
+        }
+        const chunk = file.slice(offset, offset + session.chunk_size);
+        session = await uploadsService.uploadChunk(session.id, chunk, offset, file.size);
+        retries = 0;
+      } catch (error) {
+        if (retries >= MAX_CHUNK_RETRIES) throw error;
+        retries += 1;
+        resync = true;
+        await sleep(1000 * 2 ** retries);
+        continue;
+      }
+      offset = session.offset;
+      onProgress?.(offset, file.size);
+    }
+
+    return uploadsService.completeUpload(session.id);
+  },
+};